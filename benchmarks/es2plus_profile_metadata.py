@@ -0,0 +1,116 @@
+"""
+    Profile Metadata memory benchmark.
+
+    python benchmarks/es2plus_profile_metadata.py [profiles]
+
+    Holds the metadata of `profiles` Profiles (default 100000) of a few operators and measures with tracemalloc,
+    per 100k Profiles:
+        .   the decoded pycrate values (RSPDefinitions.StoreMetadataRequest.get_val()),
+        .   the JSON dicts (RSPDefinitions.StoreMetadataRequest.to_json() loaded with json.loads),
+        .   the StoreMetadataRequest DER,
+        .   ProfileMetadata records.
+    pycrate is slow, its representations are measured on a sample and extrapolated.
+"""
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'es2plus'))
+
+from api.metadata import ProfileMetadata  # noqa: E402
+from api.rsp_22_v3 import RSPDefinitions  # noqa: E402
+
+OPERATORS = 8
+SAMPLE = 5000
+
+
+def iccid(index):
+    digits = '8900{:015d}'.format(index) + 'F'
+    return bytes(int(digits[i + 1] + digits[i], 16) for i in range(0, 20, 2))
+
+
+def store_metadata_request(index, icons):
+    operator = index % OPERATORS
+    RSPDefinitions.StoreMetadataRequest.set_val({
+        'iccid': iccid(index),
+        'serviceProviderName': 'Operator {}'.format(operator),
+        'profileName': 'Operator {} consumer'.format(operator),
+        'iconType': 1,
+        'icon': icons[operator],
+        'notificationConfigurationInfo': [{
+            'profileManagementOperation': (0xe, 4),
+            'notificationAddress': 'notifications.operator{}.example.com'.format(operator),
+        }],
+        'profileOwner': {'mccMnc': bytes.fromhex('12f345'), 'gid1': bytes([operator])},
+        'profilePolicyRules': (2, 3),
+        'rpmConfiguration': {
+            'managingDpList': [{'managingDpOid': (2, 999, 10, operator)}],
+            'profileOwnerOid': (2, 999, 1, operator),
+        },
+    })
+    return RSPDefinitions.StoreMetadataRequest.to_der()
+
+
+def measure(name, build, count, profiles):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    held = build()
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_100k = size / count * 100_000
+    print(f'{name:<28} {per_100k / 2 ** 20:10.1f} MiB/100k {size / count:8.0f} B/profile '
+          f'{elapsed / count * 1e6:8.1f} us/profile'
+          + (f'  (sample of {count}, {per_100k * profiles / 100_000 / 2 ** 20:.1f} MiB for {profiles})'
+             if count < profiles else ''))
+    return held
+
+
+def main(profiles=100_000):
+    icons = [os.urandom(1024) for _ in range(OPERATORS)]
+    sample = min(SAMPLE, profiles)
+    ders = [store_metadata_request(index, icons) for index in range(sample)]
+
+    def pycrate_values():
+        values = []
+        for der in ders:
+            RSPDefinitions.StoreMetadataRequest.from_der(der)
+            values.append(RSPDefinitions.StoreMetadataRequest.get_val())
+        return values
+
+    def json_dicts():
+        dicts = []
+        for der in ders:
+            RSPDefinitions.StoreMetadataRequest.from_der(der)
+            dicts.append(json.loads(RSPDefinitions.StoreMetadataRequest.to_json()))
+        return dicts
+
+    measure('pycrate get_val()', pycrate_values, sample, profiles)
+    measure('pycrate to_json() dicts', json_dicts, sample, profiles)
+    measure('DER', lambda: [bytes(bytearray(der)) for der in ders], sample, profiles)
+
+    template = ProfileMetadata.from_der(ders[0])
+    all_ders = [
+        ders[index] if index < sample else ProfileMetadata(
+            iccid=iccid(index),
+            service_provider_name='Operator {}'.format(index % OPERATORS),
+            profile_name='Operator {} consumer'.format(index % OPERATORS),
+            icon_type=template.icon_type, icon=icons[index % OPERATORS], profile_class=template.profile_class,
+            profile_policy_rules=template.profile_policy_rules,
+            other=ProfileMetadata.from_der(ders[index % OPERATORS]).other,
+        ).to_store_metadata_request()
+        for index in range(profiles)
+    ]
+    records = measure('ProfileMetadata', lambda: [ProfileMetadata.from_der(der) for der in all_ders],
+                      profiles, profiles)
+
+    assert all(record.to_store_metadata_request() == der for record, der in zip(records, all_ders))
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
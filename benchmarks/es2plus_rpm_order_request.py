@@ -0,0 +1,122 @@
+"""
+    RpmOrder request validation benchmark.
+
+    python benchmarks/es2plus_rpm_order_request.py [requests]
+
+    Validates `requests` RpmOrder bodies (default 20000, eid, matchingId, SM-DS addresses and an rpmScript of
+    8 'Enable Profile' commands), rpmScript decoded to the RpmPackage bytes:
+        .   fields only: RpmOrderRequestSerializer.is_valid() (RpmOrder steps left out) versus RequestSchema,
+        .   invalid bodies (eid too short, rpmScript not base64), DRF versus RequestSchema,
+    then runs the complete validation, with the RpmOrder steps (in-memory SQLite, `requests` / 10 bodies), through
+    RpmOrderRequestSerializer.is_valid() versus RpmOrderHelper.
+"""
+import os
+import sys
+import time
+from base64 import b64encode
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'es2plus'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'es2plsu.settings')
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.DATABASES['default']['NAME'] = ':memory:'
+django.setup()
+
+from django.db import connection  # noqa: E402
+from rest_framework.exceptions import ValidationError  # noqa: E402
+
+from api.metadata import ProfileMetadata  # noqa: E402
+from api.models import Profile, HandleNotifyState, RpmOrder  # noqa: E402
+from api.rsp_22_v3 import RSPDefinitions  # noqa: E402
+from api.schema import RequestSchema  # noqa: E402
+from api.serializers import RpmOrderRequestSerializer  # noqa: E402
+from api.utils import RpmOrderHelper  # noqa: E402
+
+EID = '89049032000000000000000000000001'
+ICCIDS = ['89000000000000000{:02d}'.format(index) for index in range(8)]
+PROFILE_OWNER_OID = '2.999.1'
+
+
+class FieldsRpmOrderRequestSerializer(RpmOrderRequestSerializer):
+    def validate(self, data):
+        return data
+
+
+class Request:
+    tenant_name = None
+    profile_owner_oid = PROFILE_OWNER_OID
+
+    def __init__(self, data):
+        self.data = data
+
+
+def measure(name, validate, bodies):
+    started = time.perf_counter()
+    for body in bodies:
+        validate(body)
+    elapsed = time.perf_counter() - started
+    print(f'{name:<48} {len(bodies) / elapsed:10.0f} requests/s {elapsed / len(bodies) * 1e6:10.1f} us/request')
+
+
+def drf_fields(body):
+    serializer = FieldsRpmOrderRequestSerializer(data=body)
+    serializer.is_valid()
+    return serializer.validated_data or serializer.errors
+
+
+def schema_fields(schema):
+    def validate(body):
+        try:
+            return schema.validate(body)
+        except ValidationError as exc:
+            return exc.detail
+    return validate
+
+
+def drf_rpm_order(body):
+    serializer = RpmOrderRequestSerializer(
+        data=body, context={'tenant_name': None, 'profile_owner_oid': PROFILE_OWNER_OID}
+    )
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+def main(count=20000):
+    RSPDefinitions.RpmPackage.set_val([
+        {'rpmCommandDetails': ('enable', {'iccid': ProfileMetadata.digits_to_iccid(iccid)})} for iccid in ICCIDS
+    ])
+    rpm_script = b64encode(RSPDefinitions.RpmPackage.to_der()).decode()
+    body = {
+        'eid': EID, 'rpmScript': rpm_script, 'matchingId': 'ABCDE-FGHIJ-KLMNO-PQRST',
+        'rootSmdsAddress': 'smds.example.com', 'altSmdsAddress': '.unspecified',
+    }
+    invalid = {'eid': EID[:20], 'rpmScript': rpm_script[:-1] + '!'}
+    schema = RequestSchema(RpmOrderRequestSerializer)
+    assert drf_fields(dict(body)) == schema_fields(schema)(dict(body))
+    assert drf_fields(dict(invalid)) == schema_fields(schema)(dict(invalid))
+
+    measure('fields: RpmOrderRequestSerializer', drf_fields, [dict(body) for _ in range(count)])
+    measure('fields: RequestSchema', schema_fields(schema), [dict(body) for _ in range(count)])
+    measure('invalid fields: RpmOrderRequestSerializer', drf_fields, [dict(invalid) for _ in range(count)])
+    measure('invalid fields: RequestSchema', schema_fields(schema), [dict(invalid) for _ in range(count)])
+
+    with connection.schema_editor() as editor:
+        editor.create_model(Profile)
+        editor.create_model(RpmOrder)
+    Profile.objects.bulk_create([
+        Profile(upp='', linked_eid=EID, iccid=iccid, handle_notify_state=HandleNotifyState.ENABLED,
+                profile_owner_oid=PROFILE_OWNER_OID) for iccid in ICCIDS
+    ])
+    orders = count // 10
+    measure('RpmOrder: RpmOrderRequestSerializer.is_valid()', drf_rpm_order, [dict(body) for _ in range(orders)])
+    # a new matchingId per order, RpmOrderHelper storing them
+    del body['matchingId']
+    measure('RpmOrder: RpmOrderHelper (RequestSchema)', lambda data: RpmOrderHelper(Request(data)),
+            [dict(body) for _ in range(orders)])
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
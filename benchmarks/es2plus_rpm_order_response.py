@@ -0,0 +1,171 @@
+"""
+    ES2+ response rendering benchmark.
+
+    python benchmarks/es2plus_rpm_order_response.py [responses]
+
+    Renders `responses` responses (default 20000) per endpoint:
+        .   RpmOrder success: RpmOrderResponseSerializer + DRF JSONRenderer, versus Es2PlusResponseBuilder,
+        .   RpmOrder failure: DRF exception handler + JSONRenderer, versus the preallocated Es2PlusException body,
+        .   a ProfileInfo list payload: DRF JSONRenderer versus FastJSONRenderer (ES2PLUS_JSON_ENCODER),
+    then posts RpmOrder requests (one 'Enable Profile' command, in-memory SQLite) to RpmOrderViewSet, with the
+    serializer / JSONRenderer response path versus the current one.
+"""
+import os
+import sys
+import time
+from base64 import b64encode
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'es2plus'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'es2plsu.settings')
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.DATABASES['default']['NAME'] = ':memory:'
+django.setup()
+
+from django.db import connection  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.response import Response  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+from rest_framework.views import exception_handler  # noqa: E402
+
+from api.exceptions import RpmOrderICCIDIsUnknownException  # noqa: E402
+from api.metadata import ProfileMetadata  # noqa: E402
+from api.models import Profile, HandleNotifyState, RpmOrder  # noqa: E402
+from api.renderers import FastJSONRenderer, Es2PlusResponseBuilder, orjson  # noqa: E402
+from api.rsp_22_v3 import RSPDefinitions  # noqa: E402
+from api.serializers import RpmOrderResponseSerializer  # noqa: E402
+from api.utils import RpmOrderHelper  # noqa: E402
+from api.viewsets import RpmOrderViewSet  # noqa: E402
+
+EID = '89049032000000000000000000000001'
+ICCID = '8900000000000000001'
+
+
+def measure(name, render, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        render()
+    elapsed = time.perf_counter() - started
+    print(f'{name:<52} {count / elapsed:10.0f} responses/s {elapsed / count * 1e6:10.1f} us/response')
+
+
+def drf_render(data):
+    response = Response(data)
+    response.accepted_renderer = JSONRenderer()
+    response.accepted_media_type = 'application/json'
+    response.renderer_context = {}
+    return response.render().content
+
+
+def serializer_success():
+    return drf_render(RpmOrderResponseSerializer({
+        'header': {'functionExecutionStatus': {'status': 'Executed-Success'}},
+        'matchingId': 'ABCDE-FGHIJ-KLMNO-PQRST',
+    }).data)
+
+
+def handler_failure():
+    try:
+        raise RpmOrderICCIDIsUnknownException()
+    except RpmOrderICCIDIsUnknownException as exc:
+        response = exception_handler(exc, {})
+        response.accepted_renderer = JSONRenderer()
+        response.accepted_media_type = 'application/json'
+        response.renderer_context = {}
+        return response.render().content
+
+
+def preallocated_failure():
+    try:
+        raise RpmOrderICCIDIsUnknownException()
+    except RpmOrderICCIDIsUnknownException as exc:
+        return exc.response().content
+
+
+class SerializerRpmOrderHelper(RpmOrderHelper):
+    @property
+    def response(self):
+        return Response(RpmOrderResponseSerializer({
+            'header': {'functionExecutionStatus': {'status': 'Executed-Success'}},
+            'matchingId': self.serializer_data['matchingId'],
+        }).data)
+
+
+class SerializerRpmOrderViewSet(RpmOrderViewSet):
+    rpm_order_helper = SerializerRpmOrderHelper
+    renderer_classes = [JSONRenderer]
+
+
+def rpm_order_requests(count):
+    with connection.schema_editor() as editor:
+        editor.create_model(Profile)
+        editor.create_model(RpmOrder)
+    Profile.objects.create(
+        upp='', linked_eid=EID, iccid=ICCID, handle_notify_state=HandleNotifyState.ENABLED, profile_owner_oid='2.999.1'
+    )
+    RSPDefinitions.RpmPackage.set_val([
+        {'rpmCommandDetails': ('enable', {'iccid': ProfileMetadata.digits_to_iccid(ICCID)})}
+    ])
+    data = {'eid': EID, 'rpmScript': b64encode(RSPDefinitions.RpmPackage.to_der()).decode()}
+    factory = APIRequestFactory()
+    requests = []
+    for _ in range(count):
+        request = factory.post('/rpmOrder', data, format='json')
+        request.tenant_name = None
+        request.profile_owner_oid = '2.999.1'
+        requests.append(request)
+    return requests
+
+
+def measure_view(name, view, requests):
+    started = time.perf_counter()
+    for request in requests:
+        response = view(request)
+        if hasattr(response, 'render'):
+            # DRF Response, rendered by the Django handler
+            response.render()
+        assert b'Executed-Success' in response.content, response.content
+    elapsed = time.perf_counter() - started
+    print(f'{name:<52} {len(requests) / elapsed:10.0f} requests/s  {elapsed / len(requests) * 1e6:10.1f} us/request')
+
+
+def main(count=20000):
+    print(f'ES2PLUS_JSON_ENCODER {settings.ES2PLUS_JSON_ENCODER}, orjson {"installed" if orjson else "missing"}')
+    builder = Es2PlusResponseBuilder('matchingId')
+    assert serializer_success() == builder.render(matchingId='ABCDE-FGHIJ-KLMNO-PQRST')
+    measure('RpmOrder success: serializer + JSONRenderer', serializer_success, count)
+    measure('RpmOrder success: Es2PlusResponseBuilder', lambda: builder.render(
+        matchingId='ABCDE-FGHIJ-KLMNO-PQRST'
+    ), count)
+
+    assert handler_failure() == preallocated_failure()
+    measure('RpmOrder failure: exception handler + JSONRenderer', handler_failure, count)
+    measure('RpmOrder failure: preallocated response', preallocated_failure, count)
+
+    profile_info = {
+        'header': {'functionExecutionStatus': {'status': 'Executed-Success'}},
+        'profileInfoList': [{
+            'iccid': '89000000000000000{:02d}'.format(index), 'serviceProviderName': 'Operator',
+            'profileName': 'Operator consumer {}'.format(index), 'profileState': 'enabled' if index else 'disabled',
+            'profileClass': 'operational', 'profileOwnerOid': '2.999.1',
+        } for index in range(16)],
+    }
+    assert JSONRenderer().render(profile_info) == FastJSONRenderer().render(profile_info)
+    measure('ProfileInfo list: JSONRenderer', lambda: JSONRenderer().render(profile_info), count)
+    measure('ProfileInfo list: FastJSONRenderer', lambda: FastJSONRenderer().render(profile_info), count)
+
+    views = count // 10
+    requests = rpm_order_requests(2 * views)
+    measure_view('RpmOrder view: serializer + JSONRenderer', SerializerRpmOrderViewSet.as_view(
+        {'post': 'create'}
+    ), requests[:views])
+    measure_view('RpmOrder view: Es2PlusResponseBuilder', RpmOrderViewSet.as_view(
+        {'post': 'create'}
+    ), requests[views:])
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,68 @@
+"""
+    SM-DP+ signing benchmark.
+
+    python benchmarks/es9plus_signing.py [signatures]
+
+    Signs `signatures` ServerSigned1-sized messages (default 2000) with an SK.DPauth.ECDSA-like NIST P-256 key:
+        .   parsing the PEM key on every call (deterministic ECDSA, as SmdpCredentials did before),
+        .   with the key parsed once (deterministic ECDSA),
+        .   with PrecomputedSigningKey, nonce pool filled ahead of the measure,
+        .   with PrecomputedSigningKey and an empty pool (nonces computed on the fly or in the background).
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ecdsa import SigningKey, NIST256p
+from ecdsa.util import sigencode_string, sigdecode_string
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'es9plus'))
+
+from api.signing import PrecomputedSigningKey  # noqa: E402
+
+
+def measure(name, sign, messages):
+    started = time.perf_counter()
+    signatures = [sign(data) for data in messages]
+    elapsed = time.perf_counter() - started
+    print(f'{name:<40} {len(messages) / elapsed:10.0f} signatures/s {elapsed / len(messages) * 1e6:10.1f} us/signature')
+    return signatures
+
+
+def main(signatures=2000):
+    signing_key = SigningKey.generate(curve=NIST256p)
+    verifying_key = signing_key.get_verifying_key()
+    messages = [os.urandom(16) + b'testsmdpplus1.example.com' + os.urandom(16) for _ in range(signatures)]
+
+    with tempfile.NamedTemporaryFile('w', suffix='.pem', delete=False) as pem:
+        pem.write(signing_key.to_pem().decode())
+    try:
+        measure('parse per call', lambda data: SigningKey.from_pem(Path(pem.name).read_text()).sign_deterministic(
+            data, hashfunc=hashlib.sha256, sigencode=sigencode_string
+        ), messages)
+        measure('parsed once', lambda data: signing_key.sign_deterministic(
+            data, hashfunc=hashlib.sha256, sigencode=sigencode_string
+        ), messages)
+
+        precomputed = PrecomputedSigningKey.from_pem(pem.name, nonces=signatures)
+        started = time.perf_counter()
+        precomputed.precompute()
+        print(f'{"precompute " + str(signatures) + " nonces":<40} {time.perf_counter() - started:10.2f} s')
+        results = measure('precomputed nonces', precomputed.sign, messages)
+
+        on_the_fly = PrecomputedSigningKey.from_pem(pem.name, nonces=256)
+        measure('empty nonce pool', on_the_fly.sign, messages)
+    finally:
+        os.unlink(pem.name)
+
+    assert all(
+        verifying_key.verify(signature, data, hashfunc=hashlib.sha256, sigdecode=sigdecode_string)
+        for signature, data in zip(results, messages)
+    )
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
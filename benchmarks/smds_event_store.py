@@ -0,0 +1,75 @@
+"""
+    EventTable benchmark.
+
+    python benchmarks/smds_event_store.py [events] [eids]
+
+    Registers `events` Event Records (default 10M) spread over `eids` EIDs, then measures Event Retrieval
+    lookups, deletions and a bulk expiry of half of the table.
+"""
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smds.event_store import EventTable  # noqa: E402
+
+RSP_SERVER_ADDRESSES = [f'smdp{index}.example.com' for index in range(16)]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000
+
+    def __call__(self):
+        return self.now
+
+
+def max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(events=10_000_000, eids=None):
+    eids = eids or events // 2
+    clock = Clock()
+    table = EventTable(clock=clock)
+    eid_values = [f'{index:032X}' for index in range(eids)]
+    baseline_rss = max_rss_mb()
+
+    started = time.perf_counter()
+    for index in range(events):
+        table.register(
+            eid_values[index % eids], f'EVENT-{index:012d}', RSP_SERVER_ADDRESSES[index % 16],
+            ttl=3600 if index % 2 else 7200
+        )
+    elapsed = time.perf_counter() - started
+    print(f'register:   {events} events in {elapsed:.2f}s ({events / elapsed:,.0f}/s)')
+    print(f'memory:     {max_rss_mb() - baseline_rss:,.0f} MB above baseline '
+          f'({(max_rss_mb() - baseline_rss) * 1024 * 1024 / events:.0f} B/event)')
+
+    lookups = 1_000_000
+    sample = random.choices(eid_values, k=lookups)
+    started = time.perf_counter()
+    for eid in sample:
+        table.pending(eid)
+    elapsed = time.perf_counter() - started
+    print(f'pending:    {lookups} lookups in {elapsed:.2f}s ({elapsed / lookups * 1e6:.2f} us/lookup)')
+
+    deletions = 100_000
+    started = time.perf_counter()
+    for index in range(deletions):
+        table.delete(eid_values[index % eids], f'EVENT-{index:012d}')
+    elapsed = time.perf_counter() - started
+    print(f'delete:     {deletions} events in {elapsed:.2f}s ({elapsed / deletions * 1e6:.2f} us/event)')
+
+    clock.now += 3600 + table.expiry_bucket
+    started = time.perf_counter()
+    removed = table.expire()
+    elapsed = time.perf_counter() - started
+    print(f'expire:     {removed} events in {elapsed:.2f}s, {len(table)} remaining')
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
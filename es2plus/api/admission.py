@@ -0,0 +1,124 @@
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class LocalTokenBucketBackend:
+    """
+        Token buckets of the function requesters, kept in the memory of the process: the stand-in of a backend
+        shared by the workers (e.g. a Redis script doing the same refill and take atomically), selected with
+        ES2PLUS_ADMISSION_BACKEND.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst, cost=1.0, reserve=0.0):
+        """
+            Takes cost tokens from the bucket of key (refilled at rate tokens per second up to burst) if at least
+            reserve tokens are left afterwards. Returns 0.0 when taken, otherwise the seconds to wait before
+            the tokens are available.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated_at) * rate)
+            if tokens - cost < reserve:
+                self._buckets[key] = (tokens, now)
+                return (cost + reserve - tokens) / rate
+            self._buckets[key] = (tokens - cost, now)
+            return 0.0
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class AdmissionController:
+    """
+        Admission of the ES2+ requests, per function requester (TLS client identity), before any database access
+        or cryptographic work:
+            .   each requester has a token bucket of ES2PLUS_ADMISSION_RATE requests per second and
+                ES2PLUS_ADMISSION_BURST requests (per tenant ADMISSION_RATE / ADMISSION_BURST), a request without
+                token is THROTTLED,
+            .   once more than ES2PLUS_ADMISSION_SOFT_IN_FLIGHT requests are in flight in the process, a request
+                is only admitted if its requester keeps a reserve of tokens growing with the queue depth, so the
+                requesters having drained their bucket are SHED first; at ES2PLUS_ADMISSION_MAX_IN_FLIGHT all
+                the new requests are shed.
+    """
+    ADMITTED = 'admitted'
+    THROTTLED = 'throttled'
+    SHED = 'shed'
+
+    _instance = None
+
+    def __init__(self, backend=None, rate=None, burst=None, soft_in_flight=None, max_in_flight=None):
+        self.backend = backend or import_string(settings.ES2PLUS_ADMISSION_BACKEND)()
+        self.rate = settings.ES2PLUS_ADMISSION_RATE if rate is None else rate
+        self.burst = settings.ES2PLUS_ADMISSION_BURST if burst is None else burst
+        self.soft_in_flight = settings.ES2PLUS_ADMISSION_SOFT_IN_FLIGHT if soft_in_flight is None \
+            else soft_in_flight
+        self.max_in_flight = settings.ES2PLUS_ADMISSION_MAX_IN_FLIGHT if max_in_flight is None else max_in_flight
+        self.in_flight = 0
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _reserve(self, burst):
+        if self.in_flight < self.soft_in_flight:
+            return 0.0
+        return burst * (self.in_flight - self.soft_in_flight + 1) / (self.max_in_flight - self.soft_in_flight + 1)
+
+    def _count(self, requester, decision):
+        counters = self._counters.get(requester)
+        if counters is None:
+            counters = self._counters[requester] = {self.ADMITTED: 0, self.THROTTLED: 0, self.SHED: 0}
+        counters[decision] += 1
+
+    def admit(self, requester, rate=None, burst=None):
+        """
+            (decision, seconds to wait before retrying); an ADMITTED request must be followed by release().
+        """
+        rate = rate or self.rate
+        burst = burst or self.burst
+        with self._lock:
+            if self.in_flight >= self.max_in_flight:
+                self._count(requester, self.SHED)
+                return self.SHED, 1.0
+            reserve = self._reserve(burst)
+        wait = self.backend.take(requester, rate, burst, reserve=reserve)
+        with self._lock:
+            if not wait:
+                self.in_flight += 1
+                decision = self.ADMITTED
+            else:
+                # out of tokens even without the reserve: throttled by its own rate
+                decision = self.THROTTLED if wait * rate > reserve else self.SHED
+            self._count(requester, decision)
+        return decision, wait
+
+    def release(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    @staticmethod
+    def retry_after(wait):
+        return str(max(1, math.ceil(wait)))
+
+    def metrics(self):
+        with self._lock:
+            return {
+                'in_flight': self.in_flight,
+                'soft_in_flight': self.soft_in_flight,
+                'max_in_flight': self.max_in_flight,
+                'requesters': {requester: dict(counters) for requester, counters in self._counters.items()},
+            }
@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+        Bounded pool of DB-API connections of one database (one tenant).
+
+        Connections are only opened when no idle one is available, at most max_size of them being in use at the
+        same time: a caller waits up to timeout seconds for a free slot, then PoolTimeout is raised, so a busy
+        tenant waits on its own pool instead of taking the connections of the others. The most recently released
+        connection is handed out first, the ones idle for more than max_idle seconds are closed.
+    """
+
+    def __init__(self, name, max_size=10, timeout=5.0, max_idle=300.0):
+        self.name = name
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._opened = 0
+        self._waits = 0
+
+    def acquire(self, connect):
+        """
+            An idle connection or a new one from connect(), blocking while max_size connections are in use.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._waits += 1
+            if not self._slots.acquire(timeout=self.timeout):
+                raise PoolTimeout('no connection of {} available after {}s ({} in use)'.format(
+                    self.name, self.timeout, self.max_size
+                ))
+        try:
+            connection = self._pop_idle()
+            if connection is None:
+                connection = connect()
+                with self._lock:
+                    self._opened += 1
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._in_use += 1
+        return connection
+
+    def _pop_idle(self):
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                connection, released_at = self._idle.pop()
+            if now - released_at <= self.max_idle and not getattr(connection, 'closed', False):
+                return connection
+            self._close(connection)
+
+    def release(self, connection, discard=False):
+        with self._lock:
+            self._in_use -= 1
+            if not discard:
+                self._idle.append((connection, time.monotonic()))
+        if discard:
+            self._close(connection)
+        self._slots.release()
+
+    def _close(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._opened -= 1
+
+    def close_idle(self):
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for connection, _ in idle:
+            self._close(connection)
+
+    def metrics(self):
+        with self._lock:
+            return {
+                'max_size': self.max_size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'opened': self._opened,
+                'waits': self._waits,
+            }
+
+
+class PooledDatabaseWrapperMixin:
+    """
+        DatabaseWrapper mixin taking the connections from a ConnectionPool per database alias, created on first
+        use with the POOL_SIZE, POOL_TIMEOUT and POOL_MAX_IDLE keys of the database settings.
+
+        Closing the Django connection (end of request, CONN_MAX_AGE = 0) gives the connection back to the pool,
+        rolled back; a connection failing the rollback, or closed inside an atomic block, is discarded.
+    """
+    POOL_SIZE = 10
+    POOL_TIMEOUT = 5.0
+    POOL_MAX_IDLE = 300.0
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    @property
+    def pool(self):
+        pool = self._pools.get(self.alias)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._pools.get(self.alias)
+                if pool is None:
+                    pool = self._pools[self.alias] = ConnectionPool(
+                        self.alias,
+                        self.settings_dict.get('POOL_SIZE', self.POOL_SIZE),
+                        self.settings_dict.get('POOL_TIMEOUT', self.POOL_TIMEOUT),
+                        self.settings_dict.get('POOL_MAX_IDLE', self.POOL_MAX_IDLE),
+                    )
+        return pool
+
+    def get_new_connection(self, conn_params):
+        connect = super().get_new_connection
+        try:
+            return self.pool.acquire(lambda: connect(conn_params))
+        except PoolTimeout as exc:
+            raise self.Database.OperationalError(str(exc)) from exc
+
+    def _close(self):
+        connection = self.connection
+        if connection is None:
+            return
+        if self.in_atomic_block:
+            self.pool.release(connection, discard=True)
+            return
+        try:
+            connection.rollback()
+        except self.Database.Error:
+            self.pool.release(connection, discard=True)
+        else:
+            self.pool.release(connection)
@@ -0,0 +1,9 @@
+from django.db.backends.postgresql import base
+
+from api.backends.pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    """
+        PostgreSQL backend with a bounded pool of connections per database, ENGINE 'api.backends.postgresql'.
+    """
@@ -1,161 +1,147 @@
-from rest_framework.exceptions import ValidationError
-
-
-class RpmOrderMandatoryElementMissingEidException(ValidationError):
-    status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.1.1",
-                    'reasonCode': "2.2",
-                    'message': "Indicates that the EID is missing in the context of this order.",
+import json
+
+from django.http import HttpResponse
+from rest_framework.exceptions import APIException
+
+
+class StatusCodeRegistry:
+    """
+        The ES2+ failure responses, (subjectCode, reasonCode) -> JSON body rendered once, when the exception
+        class declaring the status code is defined. Exception classes sharing a status code share its body,
+        a status code declared again with another body raises ValueError.
+    """
+    _rendered = {}
+
+    @staticmethod
+    def detail(subject_code, reason_code, message):
+        return {
+            'header': {
+                'functionExecutionStatus': {
+                    'status': 'Failed',
+                    'statusCodeData': {
+                        'subjectCode': subject_code,
+                        'reasonCode': reason_code,
+                        'message': message,
+                    }
                 }
             }
         }
-    }
-
 
-class RpmOrderUnknownEidException(ValidationError):
+    @staticmethod
+    def render(detail):
+        # same bytes as the DRF JSONRenderer (compact, UTF-8)
+        return json.dumps(detail, ensure_ascii=False, separators=(',', ':')).encode()
+
+    @classmethod
+    def register(cls, exception_class):
+        key = (exception_class.subject_code, exception_class.reason_code)
+        rendered = cls._rendered.setdefault(key, cls.render(exception_class.default_detail))
+        if rendered != cls.render(exception_class.default_detail):
+            raise ValueError('status code {} {} of {} already registered with another message'.format(
+                *key, exception_class.__name__
+            ))
+        return rendered
+
+
+class Es2PlusException(APIException):
+    """
+        ES2+ function execution failure, returned with HTTP status 200 and the statusCodeData of the subclass.
+
+        Not a ValidationError, so that it goes through serializer validation unchanged, and its response body is
+        preallocated: the views answer it with response() (see Es2PlusViewSetMixin) without going through the
+        DRF exception handler and renderer.
+    """
     status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.1.1",
-                    'reasonCode': "3.9",
-                    'message': "Indicates that the eUICC, identified by this EID is unknown to the SM-DP+.",
-                }
-            }
-        }
-    }
+    subject_code = None
+    reason_code = None
+    message = None
+    rendered = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.subject_code is not None:
+            cls.default_detail = StatusCodeRegistry.detail(cls.subject_code, cls.reason_code, cls.message)
+            cls.rendered = StatusCodeRegistry.register(cls)
 
-class RpmOrderMatchingIdInvalidException(ValidationError):
-    status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.2.6",
-                    'reasonCode': "2.1",
-                    'message': "Matching ID provided by the Operator is not valid.",
-                }
-            }
-        }
-    }
+    def __init__(self, detail=None, code=None):
+        # the shared default_detail, instead of the per-raise ErrorDetail copy of APIException
+        self.detail = self.default_detail if detail is None else detail
 
+    def response(self):
+        if self.detail is not self.default_detail:
+            return HttpResponse(StatusCodeRegistry.render(self.detail), content_type='application/json',
+                                status=self.status_code)
+        return HttpResponse(self.rendered, content_type='application/json', status=self.status_code)
 
-class RpmOrderMatchingIdAlreadyIsUseException(ValidationError):
-    status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.2.6",
-                    'reasonCode': "3.3",
-                    'message': "Matching ID provided by the Operator is already in use at the SM-DP+.",
-                }
-            }
-        }
-    }
 
+class RpmOrderMandatoryElementMissingEidException(Es2PlusException):
+    subject_code = "8.1.1"
+    reason_code = "2.2"
+    message = "Indicates that the EID is missing in the context of this order."
 
-class RpmOrderInvalidProfileOwnerOIDException(ValidationError):
-    status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.2.12",
-                    'reasonCode': "3.10",
-                    'message': "The Operator provided incorrect Profile Owner OID.",
-                }
-            }
-        }
-    }
 
+class RpmOrderUnknownEidException(Es2PlusException):
+    subject_code = "8.1.1"
+    reason_code = "3.9"
+    message = "Indicates that the eUICC, identified by this EID is unknown to the SM-DP+."
 
-class RpmOrderConditionalElementMissingICCIDException(ValidationError):
-    status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.2.1",
-                    'reasonCode': "2.3",
-                    'message': "Indicates that the ICCID is missing in the context of the RPM Command.",
-                }
-            }
-        }
-    }
 
+class RpmOrderEidInvalidAssociationException(Es2PlusException):
+    subject_code = "8.1.1"
+    reason_code = "3.10"
+    message = "Indicates that the Profile, identified by the ICCID, is not installed in the eUICC " \
+              "identified by this EID."
 
-class RpmOrderICCIDIsUnknownException(ValidationError):
-    status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.2.1",
-                    'reasonCode': "3.9",
-                    'message': "Indicates that the Profile, identified by this ICCID is unknown to the SM-DP+. ",
-                }
-            }
-        }
-    }
 
+class RpmOrderMatchingIdInvalidException(Es2PlusException):
+    subject_code = "8.2.6"
+    reason_code = "2.1"
+    message = "Matching ID provided by the Operator is not valid."
 
-class RpmOrderConditionalElementMissingUpdateMetadataRequestException(ValidationError):
-    status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.2.9",
-                    'reasonCode': "2.3",
-                    'message': "Indicates that no Metadata object is provided in the.",
-                }
-            }
-        }
-    }
 
+class RpmOrderMatchingIdAlreadyIsUseException(Es2PlusException):
+    subject_code = "8.2.6"
+    reason_code = "3.3"
+    message = "Matching ID provided by the Operator is already in use at the SM-DP+."
 
-class RpmOrderSMDSInAccessibleException(ValidationError):
-    status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.9",
-                    'reasonCode': "5.1",
-                    'message': "Indicates that the smdsAddress is invalid or not reachable.",
-                }
-            }
-        }
-    }
 
+class RpmOrderInvalidProfileOwnerOIDException(Es2PlusException):
+    subject_code = "8.2.12"
+    reason_code = "3.10"
+    message = "The Operator provided incorrect Profile Owner OID."
 
-class RpmOrderSMDSExecutionErrorException(ValidationError):
-    status_code = 200
-    default_detail = {
-        'header': {
-            'functionExecutionStatus': {
-                'status': 'Failed',
-                'statusCodeData': {
-                    'subjectCode': "8.9",
-                    'reasonCode': "4.2",
-                    'message': "The cascade SM-DS registration has failed. SMDS has raised an error.",
-                }
-            }
-        }
-    }
+
+class RpmOrderConditionalElementMissingICCIDException(Es2PlusException):
+    subject_code = "8.2.1"
+    reason_code = "2.3"
+    message = "Indicates that the ICCID is missing in the context of the RPM Command."
+
+
+class RpmOrderICCIDIsUnknownException(Es2PlusException):
+    subject_code = "8.2.1"
+    reason_code = "3.9"
+    message = "Indicates that the Profile, identified by this ICCID is unknown to the SM-DP+. "
+
+
+class RpmOrderConditionalElementMissingUpdateMetadataRequestException(Es2PlusException):
+    subject_code = "8.2.9"
+    reason_code = "2.3"
+    message = "Indicates that no Metadata object is provided in the."
+
+
+class RpmOrderInvalidMetadataException(Es2PlusException):
+    subject_code = "8.2.9"
+    reason_code = "2.1"
+    message = "Indicates that the provided Metadata object is invalid."
+
+
+class RpmOrderSMDSInAccessibleException(Es2PlusException):
+    subject_code = "8.9"
+    reason_code = "5.1"
+    message = "Indicates that the smdsAddress is invalid or not reachable."
+
+
+class RpmOrderSMDSExecutionErrorException(Es2PlusException):
+    subject_code = "8.9"
+    reason_code = "4.2"
+    message = "The cascade SM-DS registration has failed. SMDS has raised an error."
@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.http import HttpResponse
+
+
+class _Call:
+    __slots__ = ('done', 'response', 'expires_at')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.expires_at = None
+
+
+class IdempotencyStore:
+    """
+        Final responses of the ES2+ function calls, per (TLS client identity, functionRequesterIdentifier,
+        functionCallIdentifier), so that a call retried by the Operator (e.g. after a timeout) is not executed
+        again: the response of the first execution is replayed for ES2PLUS_IDEMPOTENCY_WINDOW seconds.
+
+        Concurrent duplicates wait for the execution in flight, up to ES2PLUS_IDEMPOTENCY_WAIT seconds: then they
+        are answered 503 Service Unavailable with Retry-After, never executed a second time (an RpmOrder would
+        get another matchingId). An execution raising an exception stores nothing, one of the duplicates waiting
+        for it then executes the call. The store is process-local, at most ES2PLUS_IDEMPOTENCY_MAX_ENTRIES
+        responses are kept, the oldest being dropped first.
+    """
+    BUSY_RETRY_AFTER = '1'
+
+    _instance = None
+
+    def __init__(self, window=None, wait=None, max_entries=None):
+        self.window = settings.ES2PLUS_IDEMPOTENCY_WINDOW if window is None else window
+        self.wait = settings.ES2PLUS_IDEMPOTENCY_WAIT if wait is None else wait
+        self.max_entries = settings.ES2PLUS_IDEMPOTENCY_MAX_ENTRIES if max_entries is None else max_entries
+        self._calls = {}
+        # (expires_at, key, call) in completion order, to drop the expired responses
+        self._completed = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def key(request):
+        """
+            Key of the ES2+ function call of request, None without functionCallIdentifier or without
+            authenticated caller. The TLS client identity set by TenantMiddleware is part of the key: a caller
+            cannot replay the responses of another one by presenting its identifiers.
+        """
+        client_identity = getattr(request, 'client_identity', None)
+        header = request.data.get('header') if isinstance(request.data, dict) else None
+        if not client_identity or not isinstance(header, dict) or not header.get('functionCallIdentifier'):
+            return None
+        return (
+            client_identity,
+            str(header.get('functionRequesterIdentifier', '')),
+            str(header['functionCallIdentifier']),
+        )
+
+    @classmethod
+    def _busy(cls):
+        response = HttpResponse(status=503)
+        response['Retry-After'] = cls.BUSY_RETRY_AFTER
+        return response
+
+    @staticmethod
+    def _replay(response):
+        content, status, content_type = response
+        return HttpResponse(content, status=status, content_type=content_type)
+
+    def _purge(self, now):
+        while self._completed and (self._completed[0][0] <= now or len(self._completed) > self.max_entries):
+            _, key, call = self._completed.popleft()
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    def run(self, key, execute):
+        """
+            The response of execute() (an HttpResponse), executed once per key within the window.
+        """
+        if key is None:
+            return execute()
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                self._purge(now)
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+            if leader:
+                return self._execute(key, call, execute)
+            if not call.done.wait(self.wait):
+                return self._busy()
+            if call.response is not None:
+                return self._replay(call.response)
+
+    def _execute(self, key, call, execute):
+        try:
+            response = execute()
+        except BaseException:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+            raise
+        call.response = (response.content, response.status_code, response['Content-Type'])
+        call.expires_at = time.monotonic() + self.window
+        with self._lock:
+            self._completed.append((call.expires_at, key, call))
+            self._purge(time.monotonic())
+        call.done.set()
+        return response
+
+    def clear(self):
+        with self._lock:
+            self._calls.clear()
+            self._completed.clear()
@@ -0,0 +1,175 @@
+import sys
+
+from api.tlv_helper import TlvHelper
+
+
+class ProfileMetadata:
+    """
+        Profile Metadata of one Profile (SGP.22 section 2.4a), decoded from and encoded to the DER of
+        RSPDefinitions.StoreMetadataRequest (tag 'BF25') or RSPDefinitions.ProfileInfo (tag 'E3').
+
+        Only the fields used to identify and search the Profiles are decoded, in slots. The other data
+        objects (notificationConfigurationInfo, profileOwner, rpmConfiguration ...) are kept as their DER
+        TLVs in `other` and copied back as is. Strings and repeated byte strings (icons, operator specific
+        data objects) are interned: the Profiles of an operator share them.
+    """
+    __slots__ = (
+        'iccid', 'isdp_aid', 'profile_state', 'profile_nickname', 'service_provider_name', 'profile_name',
+        'icon_type', 'icon', 'profile_class', 'profile_policy_rules', 'profile_owner_oid', 'other',
+    )
+
+    STORE_METADATA_REQUEST_TAG = bytes.fromhex('BF25')
+    PROFILE_INFO_TAG = bytes.fromhex('E3')
+
+    TEST = 0
+    PROVISIONING = 1
+    OPERATIONAL = 2
+
+    # tag: (slot, type), the other tags are kept in `other`
+    FIELDS = {
+        bytes.fromhex('5A'): ('iccid', bytes),
+        bytes.fromhex('4F'): ('isdp_aid', bytes),
+        bytes.fromhex('9F70'): ('profile_state', int),
+        bytes.fromhex('90'): ('profile_nickname', str),
+        bytes.fromhex('91'): ('service_provider_name', str),
+        bytes.fromhex('92'): ('profile_name', str),
+        bytes.fromhex('93'): ('icon_type', int),
+        bytes.fromhex('94'): ('icon', bytes),
+        bytes.fromhex('95'): ('profile_class', int),
+        bytes.fromhex('99'): ('profile_policy_rules', bytes),
+    }
+    PROFILE_CLASS_TAG = bytes.fromhex('95')
+    RPM_CONFIGURATION_TAG = bytes.fromhex('BA')
+    PROFILE_OWNER_OID_TAG = bytes.fromhex('83')
+
+    # data objects in the order of the SEQUENCE definitions
+    STORE_METADATA_REQUEST_ORDER = tuple(bytes.fromhex(tag) for tag in (
+        '5A', '91', '92', '93', '94', '95', 'B6', 'B7', '99', 'BF22', 'BF23', 'BA', '9B', 'BE', 'BC', 'BD', '9F1F',
+        'BF20', '9F21',
+    ))
+    PROFILE_INFO_ORDER = tuple(bytes.fromhex(tag) for tag in (
+        '5A', '4F', '9F70', '90', '91', '92', '93', '94', '95', 'B6', 'B7', 'B8', '99', 'BF22', 'BA', '9B', 'BC', 'BD',
+        '9F1F', 'BF20', '9F24', '9F25',
+    ))
+
+    _interned = {}
+    INTERNED_MAX = 65536
+
+    def __init__(self, iccid=None, isdp_aid=None, profile_state=None, profile_nickname=None,
+                 service_provider_name=None, profile_name=None, icon_type=None, icon=None, profile_class=None,
+                 profile_policy_rules=None, profile_owner_oid=None, other=b''):
+        self.iccid = iccid
+        self.isdp_aid = isdp_aid
+        self.profile_state = profile_state
+        self.profile_nickname = self._intern(profile_nickname)
+        self.service_provider_name = self._intern(service_provider_name)
+        self.profile_name = self._intern(profile_name)
+        self.icon_type = icon_type
+        self.icon = self._intern(icon)
+        self.profile_class = profile_class
+        self.profile_policy_rules = self._intern(profile_policy_rules)
+        self.profile_owner_oid = self._intern(profile_owner_oid)
+        self.other = self._intern(other)
+
+    @classmethod
+    def _intern(cls, value):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return sys.intern(value)
+        interned = cls._interned.get(value)
+        if interned is None:
+            if len(cls._interned) >= cls.INTERNED_MAX:
+                cls._interned.clear()
+            interned = cls._interned[value] = value
+        return interned
+
+    @classmethod
+    def from_der(cls, der):
+        """
+            Decode a StoreMetadataRequest or a ProfileInfo. profileClass is set to operational when absent
+            from a StoreMetadataRequest (DEFAULT operational).
+        """
+        tag, value_offset, end = TlvHelper.read_tlv(der)
+        values = {}
+        other = []
+        for field_tag, offset, field_offset, field_end in TlvHelper.iter_tlvs(der, value_offset, end):
+            field = cls.FIELDS.get(field_tag)
+            if field is None:
+                other.append(der[offset:field_end])
+                if field_tag == cls.RPM_CONFIGURATION_TAG:
+                    values['profile_owner_oid'] = cls._profile_owner_oid(der, field_offset, field_end)
+                continue
+            name, kind = field
+            value = der[field_offset:field_end]
+            if kind is int:
+                value = TlvHelper.decode_integer(value)
+            elif kind is str:
+                value = value.decode()
+            values[name] = bytes(value) if kind is bytes else value
+        if tag == cls.STORE_METADATA_REQUEST_TAG and 'profile_class' not in values:
+            values['profile_class'] = cls.OPERATIONAL
+        return cls(other=b''.join(other), **values)
+
+    @classmethod
+    def _profile_owner_oid(cls, der, value_offset, end):
+        for tag, _, oid_offset, oid_end in TlvHelper.iter_tlvs(der, value_offset, end):
+            if tag == cls.PROFILE_OWNER_OID_TAG:
+                return TlvHelper.decode_oid(der[oid_offset:oid_end])
+        return None
+
+    def _encode(self, outer_tag, order, tags=None, defaults=None):
+        other = {tag: self.other[offset:end] for tag, offset, _, end in TlvHelper.iter_tlvs(self.other)}
+        content = []
+        for tag in order:
+            if tags is not None and tag not in tags:
+                continue
+            field = self.FIELDS.get(tag)
+            if field is None:
+                if tag in other:
+                    content.append(other[tag])
+                continue
+            value = getattr(self, field[0])
+            if value is None or (defaults and defaults.get(tag) == value):
+                continue
+            if field[1] is int:
+                value = TlvHelper.encode_integer(value)
+            elif field[1] is str:
+                value = value.encode()
+            content.append(TlvHelper.encode_tlv(tag, value))
+        return TlvHelper.encode_tlv(outer_tag, b''.join(content))
+
+    def to_store_metadata_request(self):
+        return self._encode(
+            self.STORE_METADATA_REQUEST_TAG, self.STORE_METADATA_REQUEST_ORDER,
+            defaults={self.PROFILE_CLASS_TAG: self.OPERATIONAL}
+        )
+
+    def to_profile_info(self, tag_list=None):
+        """
+            tag_list: content of the tagList of ListProfileInfo / ProfileInfoListRequest, the data objects
+            to return (all of them when None).
+        """
+        tags = None if tag_list is None else set(TlvHelper.split_tags(tag_list))
+        return self._encode(self.PROFILE_INFO_TAG, self.PROFILE_INFO_ORDER, tags)
+
+    @staticmethod
+    def iccid_to_digits(iccid):
+        """
+            ICCID as printed: the nibbles of each byte are swapped in EFiccid, padded with 'F'.
+        """
+        return ''.join('{:X}{:X}'.format(byte & 0x0F, byte >> 4) for byte in iccid).rstrip('F')
+
+    @staticmethod
+    def digits_to_iccid(digits):
+        digits = digits.ljust(20, 'F')
+        return bytes(int(digits[index + 1] + digits[index], 16) for index in range(0, 20, 2))
+
+    @property
+    def iccid_digits(self):
+        return self.iccid_to_digits(self.iccid)
+
+    def size(self):
+        return sys.getsizeof(self) + sum(
+            sys.getsizeof(getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None
+        )
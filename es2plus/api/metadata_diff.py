@@ -0,0 +1,180 @@
+from api.exceptions import RpmOrderInvalidMetadataException
+from api.metadata import ProfileMetadata
+from api.tlv_helper import TlvHelper
+
+
+class MetadataDiff:
+    """
+        Difference between the stored ProfileMetadata of a Profile and an UpdateMetadataRequest ('BF2A') of an
+        RPM Command 'Update Metadata' (SGP.22 section 2.10.1).
+
+        compute() validates the request and only keeps the data objects whose value changes:
+            .   metadata: the updated ProfileMetadata, the stored record itself when nothing changes,
+            .   changed: tag: new TLV of the data objects updated,
+            .   deleted: tags of the data objects removed by tagsForDeletion,
+            .   index_update: indexed field: (old value, new value), for the profile indexes.
+        The StoreMetadataRequest is only re-encoded (to_store_metadata_request()) for a non empty diff, the
+        data objects not updated being copied as they are stored.
+    """
+    __slots__ = ('metadata', 'changed', 'deleted', 'index_update')
+
+    UPDATE_METADATA_REQUEST_TAG = bytes.fromhex('BF2A')
+    TAGS_FOR_DELETION_TAG = bytes.fromhex('5C')
+    PROFILE_POLICY_RULES_TAG = bytes.fromhex('99')
+
+    # data objects in the order of the UpdateMetadataRequest SEQUENCE
+    ORDER = {bytes.fromhex(tag): index for index, tag in enumerate((
+        '91', '92', '93', '94', '99', 'BF22', 'B6', '5C', 'BA', '9B', 'BC', 'BD', 'BF20',
+    ))}
+    # serviceProviderName and profileName (mandatory in StoreMetadataRequest), the PPRs and the rpmConfiguration
+    # (Profile Owner OID) can be updated but not deleted
+    DELETABLE = frozenset(bytes.fromhex(tag) for tag in ('93', '94', 'BF22', 'B6', '9B', 'BC', 'BD', 'BF20'))
+    # UTF8String / OCTET STRING SIZE constraints
+    MAX_SIZES = {
+        bytes.fromhex('91'): 32,
+        bytes.fromhex('92'): 64,
+        bytes.fromhex('94'): 1024,
+    }
+    ICON_TYPES = (0, 1)
+    INDEXED = ('profile_owner_oid',)
+
+    def __init__(self, metadata, changed=None, deleted=None, index_update=None):
+        self.metadata = metadata
+        self.changed = changed or {}
+        self.deleted = deleted or set()
+        self.index_update = index_update or {}
+
+    def __bool__(self):
+        return bool(self.changed or self.deleted)
+
+    def to_store_metadata_request(self):
+        return self.metadata.to_store_metadata_request()
+
+    @classmethod
+    def _requested(cls, update_der):
+        """
+            Returns ({tag: (TLV, value)}, tags for deletion) of a DER UpdateMetadataRequest, checking the
+            data objects are known, in order and not repeated.
+        """
+        try:
+            tag, value_offset, end = TlvHelper.read_tlv(update_der)
+            tlvs = list(TlvHelper.iter_tlvs(update_der, value_offset, end))
+        except IndexError:
+            raise RpmOrderInvalidMetadataException()
+        if tag != cls.UPDATE_METADATA_REQUEST_TAG or end != len(update_der) or (tlvs and tlvs[-1][3] != end):
+            raise RpmOrderInvalidMetadataException()
+
+        updates = {}
+        deletions = []
+        position = -1
+        for field_tag, offset, field_offset, field_end in tlvs:
+            index = cls.ORDER.get(field_tag)
+            if index is None or index <= position:
+                raise RpmOrderInvalidMetadataException()
+            position = index
+            if field_tag == cls.TAGS_FOR_DELETION_TAG:
+                try:
+                    deletions = TlvHelper.split_tags(update_der[field_offset:field_end])
+                except IndexError:
+                    raise RpmOrderInvalidMetadataException()
+            else:
+                updates[field_tag] = (bytes(update_der[offset:field_end]), bytes(update_der[field_offset:field_end]))
+
+        if len(set(deletions)) != len(deletions) or any(
+                tag not in cls.DELETABLE or tag in updates for tag in deletions
+        ):
+            raise RpmOrderInvalidMetadataException()
+        return updates, deletions
+
+    @classmethod
+    def _decode(cls, tag, kind, value):
+        if kind is int:
+            value = TlvHelper.decode_integer(value) if value else None
+            if value not in cls.ICON_TYPES:
+                raise RpmOrderInvalidMetadataException()
+            return value
+        if kind is str:
+            try:
+                value = value.decode()
+            except UnicodeDecodeError:
+                raise RpmOrderInvalidMetadataException()
+        if len(value) > cls.MAX_SIZES.get(tag, len(value)):
+            raise RpmOrderInvalidMetadataException()
+        return value
+
+    @staticmethod
+    def _bits(bit_string):
+        """
+            Named bits set in the contents of a DER BIT STRING, bit n as 1 << n.
+        """
+        if not bit_string:
+            return 0
+        unused, bits = bit_string[0], bit_string[1:]
+        if unused > 7 or (unused and not bits):
+            raise RpmOrderInvalidMetadataException()
+        return sum(1 << index for index in range(len(bits) * 8 - unused) if bits[index // 8] & (0x80 >> index % 8))
+
+    @classmethod
+    def _check_profile_policy_rules(cls, stored, requested):
+        """
+            Through RPM the PPRs of a Profile can only be unset (SGP.22 section 2.9.2.1), requesting a PPR
+            the Profile does not have is invalid.
+        """
+        requested_bits = cls._bits(requested)
+        if requested_bits & ~cls._bits(stored or b''):
+            raise RpmOrderInvalidMetadataException()
+
+    @classmethod
+    def compute(cls, stored, update_der):
+        """
+            stored: ProfileMetadata of the Profile, update_der: DER UpdateMetadataRequest.
+            Raises RpmOrderInvalidMetadataException when the request is invalid.
+        """
+        updates, deletions = cls._requested(update_der)
+
+        values = {name: getattr(stored, name) for name in ProfileMetadata.__slots__ if name != 'other'}
+        other = {tag: stored.other[offset:end] for tag, offset, _, end in TlvHelper.iter_tlvs(stored.other)}
+        changed = {}
+        deleted = set()
+
+        for tag, (tlv, value) in updates.items():
+            field = ProfileMetadata.FIELDS.get(tag)
+            if field is None:
+                if other.get(tag) != tlv:
+                    other[tag] = tlv
+                    changed[tag] = tlv
+                continue
+            name, kind = field
+            if tag == cls.PROFILE_POLICY_RULES_TAG:
+                cls._check_profile_policy_rules(values[name], value)
+            else:
+                value = cls._decode(tag, kind, value)
+            if values[name] != value:
+                values[name] = value
+                changed[tag] = tlv
+
+        for tag in deletions:
+            field = ProfileMetadata.FIELDS.get(tag)
+            if field is None:
+                if other.pop(tag, None) is not None:
+                    deleted.add(tag)
+            elif values[field[0]] is not None:
+                values[field[0]] = None
+                deleted.add(tag)
+
+        if (values['icon'] is None) != (values['icon_type'] is None):
+            raise RpmOrderInvalidMetadataException()
+        if not changed and not deleted:
+            return cls(stored)
+
+        rpm_configuration = changed.get(ProfileMetadata.RPM_CONFIGURATION_TAG)
+        if rpm_configuration is not None:
+            _, value_offset, end = TlvHelper.read_tlv(rpm_configuration)
+            values['profile_owner_oid'] = ProfileMetadata._profile_owner_oid(rpm_configuration, value_offset, end)
+            if values['profile_owner_oid'] is None:
+                raise RpmOrderInvalidMetadataException()
+
+        index_update = {
+            name: (getattr(stored, name), values[name]) for name in cls.INDEXED if getattr(stored, name) != values[name]
+        }
+        return cls(ProfileMetadata(other=b''.join(other.values()), **values), changed, deleted, index_update)
@@ -0,0 +1,113 @@
+import json
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+from api.admission import AdmissionController
+from api.tenants import TenantConfigCache, TenantRouter
+
+
+class TenantMiddleware:
+    """
+        Resolves the tenant of an ES2+ request from the TLS client identity (request.META key
+        ES2PLUS_CLIENT_IDENTITY_META, set by the TLS terminating proxy) against TenantConfigCache (no query), and
+        sets:
+            request.client_identity:    the TLS client identity,
+            request.tenant:             TenantConfig of the caller,
+            request.tenant_name:        database alias of the tenant, None for the default database,
+            request.profile_owner_oid:  Profile Owner OID of the caller, when configured.
+        The database of the tenant is active (TenantRouter) while the request is processed.
+
+        The functionRequesterIdentifier of the JSON header is not authenticated: it is only checked against the
+        identifiers of the tenant. A request without known client identity, or presenting the identifier of
+        another tenant, is answered 403 Forbidden. The paths starting with ES2PLUS_TENANT_EXEMPT_PATHS are
+        processed without tenant.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.exempt_paths = tuple(settings.ES2PLUS_TENANT_EXEMPT_PATHS)
+
+    @staticmethod
+    def _function_requester_identifier(request):
+        if request.content_type != 'application/json':
+            return None
+        try:
+            header = json.loads(request.body).get('header')
+        except (ValueError, AttributeError):
+            return None
+        if isinstance(header, dict):
+            return header.get('functionRequesterIdentifier')
+        return None
+
+    def resolve(self, request):
+        """
+            TenantConfig of the caller, None when its client identity is unknown or it presents the
+            functionRequesterIdentifier of another tenant.
+        """
+        tenant = TenantConfigCache.instance().resolve(request.client_identity)
+        if tenant is None:
+            return None
+        function_requester_identifier = self._function_requester_identifier(request)
+        if function_requester_identifier is not None and \
+                function_requester_identifier not in tenant.function_requester_identifiers:
+            return None
+        return tenant
+
+    def __call__(self, request):
+        request.client_identity = request.META.get(settings.ES2PLUS_CLIENT_IDENTITY_META)
+        request.tenant = request.tenant_name = request.profile_owner_oid = None
+        if request.path.startswith(self.exempt_paths):
+            return self.get_response(request)
+
+        tenant = self.resolve(request)
+        if tenant is None:
+            return HttpResponseForbidden()
+        request.tenant = tenant
+        request.tenant_name = tenant.database
+        request.profile_owner_oid = tenant.profile_owner_oid
+
+        token = TenantRouter.activate(request.tenant_name)
+        try:
+            return self.get_response(request)
+        finally:
+            TenantRouter.deactivate(token)
+
+
+class AdmissionMiddleware:
+    """
+        Admission control of the ES2+ requests per authenticated caller (the TLS client identity set by
+        TenantMiddleware, at the rate of its tenant), see AdmissionController. A throttled request is answered
+        429 Too Many Requests, a request shed because the process is saturated 503 Service Unavailable, both
+        with Retry-After. The paths starting with ES2PLUS_ADMISSION_EXEMPT_PATHS are not limited.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.exempt_paths = tuple(settings.ES2PLUS_ADMISSION_EXEMPT_PATHS)
+
+    @staticmethod
+    def _refused(status, wait):
+        response = HttpResponse(status=status)
+        response['Retry-After'] = AdmissionController.retry_after(wait)
+        return response
+
+    def __call__(self, request):
+        if request.path.startswith(self.exempt_paths):
+            return self.get_response(request)
+
+        controller = AdmissionController.instance()
+        requester = getattr(request, 'client_identity', None) or ''
+        tenant = getattr(request, 'tenant', None)
+        if tenant is None:
+            decision, wait = controller.admit(requester)
+        else:
+            decision, wait = controller.admit(requester, tenant.admission_rate, tenant.admission_burst)
+        if decision == AdmissionController.THROTTLED:
+            return self._refused(429, wait)
+        if decision == AdmissionController.SHED:
+            return self._refused(503, wait)
+        try:
+            return self.get_response(request)
+        finally:
+            controller.release()
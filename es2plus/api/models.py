@@ -5,10 +5,13 @@ from django.db import models
 
 
 class HandleNotifyState:
-    INSTALLED: str = 'Installed'
-    ENABLED: str = 'Enabled'
-    DISABLED: str = 'Disabled'
-    DELETED: str = 'Deleted'
+    """
+        State of a Profile on its eUICC, stored as a small integer (None: not installed yet), see ProfileLifecycle.
+    """
+    INSTALLED: int = 1
+    ENABLED: int = 2
+    DISABLED: int = 3
+    DELETED: int = 4
 
     @classmethod
     def as_list(cls):
@@ -17,9 +20,117 @@ class HandleNotifyState:
         )
 
 
+class InvalidProfileTransition(Exception):
+    pass
+
+
+class ProfileLifecycle:
+    """
+        State machine of the Profiles:
+            None -> Installed -> Enabled <-> Disabled -> Deleted -> Installed (downloaded again),
+        an Installed or Enabled Profile can also be deleted, an Installed one disabled. Staying in the same state
+        is allowed. The table is repeated as HandleNotifyState.SOURCES in es9plus, both being checked by the tests.
+
+        Sets of states are bitmasks, bit(state) being 1 << state (bit 0 for None): a transition is checked with
+        one AND, and applied in bulk by a single UPDATE restricted to its source states (ProfileQuerySet).
+    """
+    TRANSITIONS = {
+        None: (HandleNotifyState.INSTALLED,),
+        HandleNotifyState.INSTALLED: (HandleNotifyState.ENABLED, HandleNotifyState.DISABLED, HandleNotifyState.DELETED),
+        HandleNotifyState.ENABLED: (HandleNotifyState.DISABLED, HandleNotifyState.DELETED),
+        HandleNotifyState.DISABLED: (HandleNotifyState.ENABLED, HandleNotifyState.DELETED),
+        HandleNotifyState.DELETED: (HandleNotifyState.INSTALLED,),
+    }
+
+    @staticmethod
+    def bit(state):
+        return 1 << (state or 0)
+
+    @classmethod
+    def mask(cls, *states):
+        mask = 0
+        for state in states:
+            mask |= cls.bit(state)
+        return mask
+
+    @classmethod
+    def states(cls, mask):
+        return [state for state in cls.TRANSITIONS if mask & cls.bit(state)]
+
+    @classmethod
+    def sources(cls, target):
+        """
+            Mask of the states a Profile can move to target from (target excluded).
+        """
+        return cls.mask(*(state for state, targets in cls.TRANSITIONS.items() if target in targets))
+
+    @classmethod
+    def check(cls, current, target):
+        if current != target and not cls.sources(target) & cls.bit(current):
+            raise InvalidProfileTransition('a Profile in state {} cannot move to state {}'.format(current, target))
+
+
+class ProfileQuerySet(models.QuerySet):
+    """
+        Profiles selected by state masks, on the (linked_eid, handle_notify_state) index for a set of EIDs, e.g.
+        Profile.objects.for_eids(eids, ProfileLifecycle.mask(HandleNotifyState.ENABLED)).
+    """
+
+    def in_states(self, mask):
+        states = ProfileLifecycle.states(mask)
+        condition = models.Q(handle_notify_state__in=[state for state in states if state is not None])
+        if None in states:
+            condition |= models.Q(handle_notify_state__isnull=True)
+        return self.filter(condition)
+
+    def for_eids(self, eids, mask=None):
+        profiles = self.filter(linked_eid__in=eids)
+        return profiles if mask is None else profiles.in_states(mask)
+
+    def state_masks(self, eids):
+        """
+            {EID: bitmask of the states of its Profiles}, EIDs without Profile being absent.
+        """
+        masks = {}
+        for eid, state in self.filter(linked_eid__in=eids).values_list('linked_eid', 'handle_notify_state').distinct():
+            masks[eid] = masks.get(eid, 0) | ProfileLifecycle.bit(state)
+        return masks
+
+    def transition(self, target, iccids=None):
+        """
+            Moves the selected Profiles (those of iccids) to target, the ones not allowed to being left unchanged.
+            Returns the number of Profiles moved.
+        """
+        profiles = self if iccids is None else self.filter(iccid__in=iccids)
+        return profiles.in_states(ProfileLifecycle.sources(target)).update(handle_notify_state=target)
+
+
+class RpmCommandName:
+    ENABLE: str = 'enable'
+    DISABLE: str = 'disable'
+    DELETE: str = 'delete'
+    LIST_PROFILE_INFO: str = 'listProfileInfo'
+    UPDATE_METADATA: str = 'updateMetadata'
+    CONTACT_PCMP: str = 'contactPcmp'
+
+
 class Profile(models.Model):
     upp = models.TextField()
-    linked_eid = models.CharField()
+    linked_eid = models.CharField(max_length=32)
+    iccid = models.CharField(max_length=20, db_index=True, null=True)
+    handle_notify_state = models.PositiveSmallIntegerField(choices=HandleNotifyState.as_list(), null=True)
+    matching_id_hashed = models.CharField(max_length=64, null=True)
+    # DER StoreMetadataRequest, see api.metadata.ProfileMetadata
+    metadata = models.BinaryField(null=True)
+    # profileOwnerOid of the rpmConfiguration of the metadata
+    profile_owner_oid = models.CharField(max_length=128, db_index=True, null=True)
+
+    objects = ProfileQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['linked_eid', 'handle_notify_state'], name='api_profile_eid_state_idx'),
+        ]
 
     @classmethod
     def create_random_hex(cls, length=16):
@@ -49,3 +160,52 @@ class Profile(models.Model):
                 is_matching_id_contains_upper_case and
                 is_matching_id_contains_only_num_and_letter
         )
+
+
+
+class RpmOrderState:
+    RELEASED: str = 'Released'
+    DELIVERED: str = 'Delivered'
+    EXECUTED: str = 'Executed'
+    ERROR: str = 'Error'
+
+    @classmethod
+    def as_list(cls):
+        return (
+            (value, name) for name, value in vars(cls).items() if name.isupper()
+        )
+
+
+class RpmOrder(models.Model):
+    """
+        RPM Package released by ES2+.RpmOrder, stored as the validated DER RpmPackage so that ES9+ only has to
+        splice it into the AuthenticateClientOkRpm. The table (api_rpmorder) is shared with the RpmOrder model
+        of es9plus, which delivers the orders and records their results.
+    """
+    eid = models.CharField(max_length=32, db_index=True)
+    matching_id = models.CharField(max_length=64, unique=True)
+    rpm_package = models.BinaryField()
+    state = models.CharField(max_length=16, choices=RpmOrderState.as_list(), default=RpmOrderState.RELEASED)
+    transaction_id = models.BinaryField(null=True, db_index=True)
+    # DER certificate of the eUICC the order was delivered to, verifying its LoadRpmPackageResult in es9plus
+    euicc_certificate = models.BinaryField(null=True)
+    result = models.BinaryField(null=True)
+    # Profile Metadata updated by the 'Update Metadata' commands, stored on the Profiles by es9plus once the eUICC
+    # reports them executed: {ICCID: {'metadata': hex DER StoreMetadataRequest, 'profile_owner_oid': OID}}, the
+    # Profile Owner OID being only given for the Profiles transferred to another owner
+    metadata_updates = models.JSONField(null=True)
+
+    @staticmethod
+    def encode_metadata_updates(diffs):
+        """
+            metadata_updates of the MetadataDiffs of an RpmPackage ({ICCID: MetadataDiff}), None without any,
+            only the non empty diffs being re-encoded.
+        """
+        updates = {}
+        for iccid, diff in diffs.items():
+            if not diff:
+                continue
+            update = updates[iccid] = {'metadata': diff.to_store_metadata_request().hex()}
+            if 'profile_owner_oid' in diff.index_update:
+                update['profile_owner_oid'] = diff.metadata.profile_owner_oid
+        return updates or None
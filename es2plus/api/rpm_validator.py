@@ -0,0 +1,127 @@
+from api.exceptions import RpmOrderInvalidProfileOwnerOIDException, RpmOrderConditionalElementMissingICCIDException, \
+    RpmOrderICCIDIsUnknownException, RpmOrderEidInvalidAssociationException, \
+    RpmOrderConditionalElementMissingUpdateMetadataRequestException
+from api.metadata import ProfileMetadata
+from api.metadata_diff import MetadataDiff
+from api.models import Profile, HandleNotifyState, ProfileLifecycle, RpmCommandName
+from api.rsp_22_v3 import RSPDefinitions
+from api.tlv_helper import TlvHelper
+
+
+class RpmPackageValidator:
+    """
+        Step 6 of ES2+.RpmOrder for all the RPM Commands of an RpmPackage, with a constant number of queries:
+        the ICCIDs of the whole package are collected and their Profiles (EID, Profile Owner OID, state,
+        metadata) fetched with one query on the ICCID index, then the commands are checked in order and the
+        first error, in the order of the specification, is raised:
+            1.  Profile Owner OIDs of the 'List Profile Info' commands, which must be the one of the caller,
+            2.  per command: ICCID missing, Profile unknown or not owned by the caller, Profile not installed
+                on the eUICC, updateMetadataRequest missing or invalid.
+
+        profile: a Profile of the target eUICC (identified in step 2),
+        profile_owner_oid: Profile Owner OID of the function caller, None when it has none: it then owns no
+        Profile and presents no valid Profile Owner OID.
+    """
+    INSTALLED_STATES = ProfileLifecycle.mask(
+        HandleNotifyState.INSTALLED, HandleNotifyState.ENABLED, HandleNotifyState.DISABLED
+    )
+    PROFILE_FIELDS = ('iccid', 'linked_eid', 'profile_owner_oid', 'handle_notify_state', 'metadata')
+
+    def __init__(self, profile, tenant_name=None, profile_owner_oid=None):
+        self.profile = profile
+        self.tenant_name = tenant_name
+        self.profile_owner_oid = profile_owner_oid
+
+    @staticmethod
+    def _commands(rpm_package):
+        """
+            (identifier, content, DER RpmCommand) of the RPM Commands.
+        """
+        RSPDefinitions.RpmPackage.from_der(rpm_package)
+        rpm_script = RSPDefinitions.RpmPackage.get_val()
+        _, value_offset, end = TlvHelper.read_tlv(rpm_package)
+        return [
+            (rpm_command['rpmCommandDetails'][0], rpm_command['rpmCommandDetails'][1], rpm_package[offset:tlv_end])
+            for rpm_command, (_, offset, _, tlv_end) in zip(
+                rpm_script, TlvHelper.iter_tlvs(rpm_package, value_offset, end)
+            )
+        ]
+
+    @staticmethod
+    def _iccid(identifier, content):
+        """
+            ICCID digits of a command identifying a Profile, '' when the ICCID is missing, None for a
+            'List Profile Info' by Profile Owner OID.
+        """
+        if identifier == RpmCommandName.LIST_PROFILE_INFO:
+            criterion, value = content['searchCriteria']
+            return ProfileMetadata.iccid_to_digits(value) if criterion == 'iccid' else None
+        iccid = content.get('iccid')
+        return ProfileMetadata.iccid_to_digits(iccid) if iccid else ''
+
+    def _check_profile_owner_oids(self, commands):
+        """
+            verify that the function caller correctly presented its Profile Owner OID in the RPM Commands.
+            If not, the SM-DP+ SHALL return a status code "Profile Owner - Invalid Association".
+        """
+        profile_owner_oids = {
+            '.'.join(str(arc) for arc in content['searchCriteria'][1])
+            for identifier, content, _ in commands
+            if identifier == RpmCommandName.LIST_PROFILE_INFO and content['searchCriteria'][0] == 'profileOwnerOid'
+        }
+        if profile_owner_oids and (self.profile_owner_oid is None or profile_owner_oids != {self.profile_owner_oid}):
+            raise RpmOrderInvalidProfileOwnerOIDException()
+
+    def _profiles(self, iccids):
+        if not iccids:
+            return {}
+        return {
+            profile['iccid']: profile for profile in Profile.objects.using(self.tenant_name).filter(
+                iccid__in=iccids
+            ).values(*self.PROFILE_FIELDS)
+        }
+
+    def _check_profile(self, profile):
+        if profile is None:
+            raise RpmOrderICCIDIsUnknownException()
+        if self.profile_owner_oid is None or profile['profile_owner_oid'] != self.profile_owner_oid:
+            raise RpmOrderICCIDIsUnknownException()
+        if profile['linked_eid'] != self.profile.linked_eid or \
+                not ProfileLifecycle.bit(profile['handle_notify_state']) & self.INSTALLED_STATES:
+            raise RpmOrderEidInvalidAssociationException()
+
+    def validate(self, rpm_package):
+        """
+            Returns the non empty MetadataDiff of the 'Update Metadata' commands, {ICCID: MetadataDiff}.
+        """
+        commands = self._commands(rpm_package)
+        self._check_profile_owner_oids(commands)
+
+        iccids = [self._iccid(identifier, content) for identifier, content, _ in commands]
+        profiles = self._profiles({iccid for iccid in iccids if iccid})
+        metadata_diffs = {}
+
+        for (identifier, content, rpm_command_der), iccid in zip(commands, iccids):
+            if iccid is None:
+                continue
+            if not iccid:
+                raise RpmOrderConditionalElementMissingICCIDException()
+            profile = profiles.get(iccid)
+            self._check_profile(profile)
+            if identifier != RpmCommandName.UPDATE_METADATA:
+                continue
+            if not content.get('updateMetadataRequest'):
+                raise RpmOrderConditionalElementMissingUpdateMetadataRequestException()
+            # only the data objects actually changed are kept, stored with the RpmOrder and applied once the
+            # eUICC has executed the command (RpmOrder.metadata_updates)
+            diff = metadata_diffs.get(iccid)
+            if diff is not None:
+                stored = diff.metadata
+            elif profile['metadata']:
+                stored = ProfileMetadata.from_der(bytes(profile['metadata']))
+            else:
+                stored = ProfileMetadata(iccid=ProfileMetadata.digits_to_iccid(iccid))
+            diff = MetadataDiff.compute(stored, TlvHelper.find_tlv(rpm_command_der, '30', 'A5', 'BF2A'))
+            if diff:
+                metadata_diffs[iccid] = diff
+        return metadata_diffs
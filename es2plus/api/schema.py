@@ -0,0 +1,114 @@
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.settings import api_settings
+
+
+class RequestSchema:
+    """
+        Validator of a JSON request body compiled from the declared fields of a Serializer: one check per field,
+        applied in a single pass over the body, with the checks, messages and error codes of the DRF fields but
+        none of the per request field copies, validators and lazy messages of Serializer.is_valid().
+
+        Supports CharField (required, allow_blank, allow_null, trim_whitespace, min_length, max_length) and its
+        subclasses, whose to_internal_value() converts the checked string (e.g. Base64Field to bytes).
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self._checks = [
+            (name, self._compile(field)) for name, field in serializer_class._declared_fields.items()
+            if not field.read_only
+        ]
+        self._not_a_dict = serializer_class.default_error_messages['invalid']
+
+    @staticmethod
+    def _error(field, key, **kwargs):
+        return ErrorDetail(str(field.error_messages[key]).format(**kwargs), code=key)
+
+    @classmethod
+    def _compile(cls, field):
+        if not isinstance(field, serializers.CharField):
+            raise TypeError('{} is not supported by RequestSchema'.format(type(field).__name__))
+
+        required = field.required
+        allow_blank, allow_null, trim_whitespace = field.allow_blank, field.allow_null, field.trim_whitespace
+        min_length, max_length = field.min_length, field.max_length
+        convert = None
+        if type(field).to_internal_value is not serializers.CharField.to_internal_value:
+            # the conversion of the subclass, the string being checked here
+            convert = field.to_internal_value
+
+        required_error = cls._error(field, 'required')
+        null_error = cls._error(field, 'null')
+        blank_error = cls._error(field, 'blank')
+        invalid_error = cls._error(field, 'invalid')
+        min_length_error = min_length is not None and cls._error(field, 'min_length', min_length=min_length)
+        max_length_error = max_length is not None and cls._error(field, 'max_length', max_length=max_length)
+        null_characters_error = ErrorDetail('Null characters are not allowed.', code='null_characters_not_allowed')
+
+        def check(data, missing):
+            """
+                (value, errors); value is missing when the field is absent and not required.
+            """
+            if data is missing:
+                return missing, [required_error] if required else None
+            if data is None:
+                return None, None if allow_null else [null_error]
+            if isinstance(data, bool) or not isinstance(data, (str, int, float)):
+                return missing, [invalid_error]
+            value = data if type(data) is str else str(data)
+            if trim_whitespace:
+                value = value.strip()
+            if not value:
+                return value, None if allow_blank else [blank_error]
+            errors = []
+            if max_length is not None and len(value) > max_length:
+                errors.append(max_length_error)
+            if min_length is not None and len(value) < min_length:
+                errors.append(min_length_error)
+            if '\x00' in value:
+                errors.append(null_characters_error)
+            if not value.isascii():
+                try:
+                    value.encode()
+                except UnicodeEncodeError as exc:
+                    errors.append(ErrorDetail(
+                        'Surrogate characters are not allowed: U+{:X}.'.format(ord(value[exc.start])),
+                        code='surrogate_characters_not_allowed'
+                    ))
+            if errors:
+                return missing, errors
+            if convert is not None:
+                try:
+                    value = convert(value)
+                except ValidationError as exc:
+                    return missing, exc.detail
+            return value, None
+
+        return check
+
+    def validate(self, data):
+        """
+            The validated data of the body, as Serializer.validated_data, or ValidationError with the errors of
+            Serializer.errors.
+        """
+        if data is None:
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [ErrorDetail('No data provided', code='null')]})
+        if not isinstance(data, dict):
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [
+                ErrorDetail(str(self._not_a_dict).format(datatype=type(data).__name__), code='invalid')
+            ]})
+        missing = self
+        validated = {}
+        errors = None
+        for name, check in self._checks:
+            value, field_errors = check(data.get(name, missing), missing)
+            if field_errors:
+                if errors is None:
+                    errors = {}
+                errors[name] = field_errors
+            elif value is not missing:
+                validated[name] = value
+        if errors:
+            raise ValidationError(errors)
+        return validated
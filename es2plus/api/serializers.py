@@ -1,21 +1,33 @@
 import hashlib
 from base64 import b64decode
-from binascii import hexlify
+from binascii import hexlify, Error as BinasciiError
 
 from rest_framework import serializers
 
-from exceptions import RpmOrderMandatoryElementMissingEidException, RpmOrderUnknownEidException, \
-    RpmOrderMatchingIdInvalidException, RpmOrderMatchingIdAlreadyIsUseException, \
-    RpmOrderInvalidProfileOwnerOIDException, RpmOrderConditionalElementMissingICCIDException, \
-    RpmOrderICCIDIsUnknownException, RpmOrderConditionalElementMissingUpdateMetadataRequestException
-from utils import RpmCommandName
-from models import Profile, HandleNotifyState
-from rsp_22_v3 import RSPDefinitions
+from api.exceptions import RpmOrderMandatoryElementMissingEidException, RpmOrderUnknownEidException, \
+    RpmOrderMatchingIdInvalidException, RpmOrderMatchingIdAlreadyIsUseException
+from api.models import Profile, HandleNotifyState, ProfileLifecycle
+from api.rpm_validator import RpmPackageValidator
+
+
+class Base64Field(serializers.CharField):
+    """
+        Base64 encoded binary data, validated as bytes.
+    """
+    default_error_messages = {
+        'invalid_base64': 'Not valid base64 encoded data.',
+    }
+
+    def to_internal_value(self, data):
+        try:
+            return b64decode(super().to_internal_value(data), validate=True)
+        except BinasciiError:
+            self.fail('invalid_base64')
 
 
 class RpmOrderRequestSerializer(serializers.Serializer):
     eid = serializers.CharField(max_length=32, min_length=32, help_text="Identification of the target eUICC.")
-    rpmScript = serializers.CharField(help_text="RpmPackage as defined in section 2.10.1. SGP22-v3")
+    rpmScript = Base64Field(help_text="RpmPackage as defined in section 2.10.1. SGP22-v3")
     matchingId = serializers.CharField(
         required=False, help_text="The MatchingID as defined in section 3.7.1 SGP22-v3, when generated by the Operator."
     )
@@ -26,9 +38,12 @@ class RpmOrderRequestSerializer(serializers.Serializer):
         required=False, help_text="The Alternative SM-DS address to be used for cascaded Event Registration."
     )
 
+    ENABLED_STATES = ProfileLifecycle.mask(HandleNotifyState.ENABLED)
+
     def _get_profile(self, eid):
-        profile = Profile.objects.using(self.context.get('tenant_name')).filter(linked_eid=eid).first()
-        return profile
+        # the enabled Profile of the eUICC when there is one, on the (linked_eid, handle_notify_state) index
+        profiles = Profile.objects.using(self.context.get('tenant_name')).filter(linked_eid=eid)
+        return profiles.in_states(self.ENABLED_STATES).first() or profiles.first()
 
     def _validate_eid(self, eid):
         is_profile_exists = self._get_profile(eid)
@@ -50,50 +65,37 @@ class RpmOrderRequestSerializer(serializers.Serializer):
             return Profile.generate_matching_id()
 
     @staticmethod
-    def _validate_rpmScript(profile, rpmScript):
+    def _validate_rpmScript(profile, rpmScript, tenant_name=None, profile_owner_oid=None):
         """
             The SM-DP+ SHALL generate an RPM Package upon the request of Operator.
             The RPM Package SHALL be encoded in the ASN.1 data object as shown below.
+            rpmScript: the decoded RpmPackage (Base64Field).
+        """
+        return RpmPackageValidator(profile, tenant_name, profile_owner_oid).validate(rpmScript)
+
+    @staticmethod
+    def _smds_address(address, default):
+        """
+            An SM-DS address beginning with a full stop character (e.g., '.unspecified') is replaced by the
+            SM-DS configured for the tenant, if any.
         """
-        RSPDefinitions.RpmPackage.from_der(b64decode(rpmScript))
-        # List of RPM Command
-        rpm_script = RSPDefinitions.RpmPackage.to_json()
-
-        for rpm_command in rpm_script:
-            continue_on_failure = rpm_command.get('continueOnFailure', False)
-            rpm_command_details = rpm_command.get('rpmCommandDetails')
-
-            # Command Details
-            rpm_command_identifier = rpm_command_details[0]
-            rpm_command_content = rpm_command_details[1]
-
-            # verify that the function caller correctly presented its Profile
-            # Owner OID in the RPM Command. If not, the SM-DP+ SHALL return a status
-            # code "Profile Owner - Invalid Association".
-            if rpm_command_identifier == RpmCommandName.LIST_PROFILE_INFO:
-                searchCriteria = rpm_command_content.get('searchCriteria')
-                if 'profileOwnerOid' in searchCriteria:
-                    for index, value in enumerate(searchCriteria):
-                        if value == 'profileOwnerOid':
-                            profileOwnerOid = searchCriteria[index+1]
-                            # verify that the function caller correctly presented its ProfileOwnerOID in the RPM Command
-                            # If not, the SM-DP+ SHALL return a status code "Profile Owner - Invalid Association".
-                            if not profile.owner.oid == profileOwnerOid:
-                                raise RpmOrderInvalidProfileOwnerOIDException()
-            elif rpm_command_identifier == RpmCommandName.UPDATE_METADATA:
-                if not rpm_command_content.get('updateMetadataRequest'):
-                    raise RpmOrderConditionalElementMissingUpdateMetadataRequestException()
-            else:
-                iccid = rpm_command_content.get('iccid')
-                if not iccid:
-                    raise RpmOrderConditionalElementMissingICCIDException()
-                if profile.iccid != iccid:
-                    raise RpmOrderICCIDIsUnknownException()
+        if address and address.startswith('.') and default:
+            return default
+        return address
 
     def validate(self, data):
         profile = self._validate_eid(data.get('eid'))
-        self._validate_matchingId(profile, data.get('matchingId'))
-        self._validate_rpmScript(profile, data.get('rpmScript'))
+        data['matchingId'] = self._validate_matchingId(profile, data.get('matchingId')) or data.get('matchingId')
+        self.metadata_diffs = self._validate_rpmScript(
+            profile, data.get('rpmScript'), self.context.get('tenant_name'), self.context.get('profile_owner_oid')
+        )
+        tenant = self.context.get('tenant')
+        if tenant is not None:
+            for field, default in (
+                ('rootSmdsAddress', tenant.root_smds_address), ('altSmdsAddress', tenant.alt_smds_address)
+            ):
+                if field in data:
+                    data[field] = self._smds_address(data[field], default)
         return data
 
 
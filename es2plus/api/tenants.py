@@ -0,0 +1,176 @@
+import contextvars
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.connection import ConnectionDoesNotExist
+from django.utils.module_loading import import_string
+
+
+class TenantDatabases:
+    """
+        Database alias of a tenant: the tenant name, its database being declared in ES2PLUS_TENANT_DATABASES and
+        registered in django.db.connections on first use. Requests without tenant use the default database.
+    """
+    _lock = threading.Lock()
+
+    @classmethod
+    def alias(cls, tenant_name):
+        if not tenant_name:
+            return DEFAULT_DB_ALIAS
+        if tenant_name not in connections.settings:
+            cls.register(tenant_name, settings.ES2PLUS_TENANT_DATABASES.get(tenant_name))
+        return tenant_name
+
+    @classmethod
+    def register(cls, tenant_name, database):
+        if database is None:
+            raise ConnectionDoesNotExist('The tenant {!r} has no database'.format(tenant_name))
+        with cls._lock:
+            if tenant_name not in connections.settings:
+                # fills in the defaults (CONN_MAX_AGE, AUTOCOMMIT, TEST ...) as for settings.DATABASES
+                configured = connections.configure_settings({
+                    DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS], tenant_name: dict(database)
+                })
+                connections.settings[tenant_name] = configured[tenant_name]
+
+    @classmethod
+    def tenants(cls):
+        return list(settings.ES2PLUS_TENANT_DATABASES)
+
+
+class TenantRouter:
+    """
+        Routes the queries of the api models without explicit using() to the database of the tenant of the
+        current request, set with activate() / deactivate() (a context variable, so it follows the request
+        across threads and coroutines).
+    """
+    _tenant = contextvars.ContextVar('es2plus_tenant', default=None)
+
+    @classmethod
+    def activate(cls, tenant_name):
+        return cls._tenant.set(tenant_name)
+
+    @classmethod
+    def deactivate(cls, token):
+        cls._tenant.reset(token)
+
+    @classmethod
+    def current(cls):
+        return cls._tenant.get()
+
+    def _db(self, model):
+        tenant_name = self._tenant.get()
+        if tenant_name and model._meta.app_label == 'api':
+            return TenantDatabases.alias(tenant_name)
+        return None
+
+    def db_for_read(self, model, **hints):
+        return self._db(model)
+
+    def db_for_write(self, model, **hints):
+        return self._db(model)
+
+
+class TenantConfig:
+    """
+        Configuration of a tenant (an Operator): database alias (None for the default database), Profile Owner
+        OID of the Operator, SM-DS addresses used for '.unspecified' ones, the TLS client identities it is
+        authenticated by and the ES2+ functionRequesterIdentifier values it may present, and its admission rate.
+    """
+    __slots__ = (
+        'name', 'database', 'profile_owner_oid', 'root_smds_address', 'alt_smds_address',
+        'function_requester_identifiers', 'client_identities', 'admission_rate', 'admission_burst',
+    )
+
+    def __init__(self, name, database=None, profile_owner_oid=None, root_smds_address=None, alt_smds_address=None,
+                 function_requester_identifiers=(), client_identities=(), admission_rate=None,
+                 admission_burst=None):
+        self.name = name
+        self.database = database
+        self.profile_owner_oid = profile_owner_oid
+        self.root_smds_address = root_smds_address
+        self.alt_smds_address = alt_smds_address
+        self.function_requester_identifiers = tuple(function_requester_identifiers)
+        self.client_identities = tuple(client_identities)
+        # requests per second and burst admitted by AdmissionMiddleware, None for the ES2PLUS_ADMISSION_* defaults
+        self.admission_rate = admission_rate
+        self.admission_burst = admission_burst
+
+    @classmethod
+    def from_settings(cls, name, tenant):
+        database = tenant.get('DATABASE', name if name in settings.ES2PLUS_TENANT_DATABASES else None)
+        return cls(
+            name,
+            database=database,
+            profile_owner_oid=tenant.get('PROFILE_OWNER_OID'),
+            root_smds_address=tenant.get('ROOT_SMDS_ADDRESS'),
+            alt_smds_address=tenant.get('ALT_SMDS_ADDRESS'),
+            function_requester_identifiers=tenant.get('FUNCTION_REQUESTER_IDENTIFIERS', ()),
+            client_identities=tenant.get('CLIENT_IDENTITIES', ()),
+            admission_rate=tenant.get('ADMISSION_RATE'),
+            admission_burst=tenant.get('ADMISSION_BURST'),
+        )
+
+
+def load_tenant_configs():
+    """
+        Default ES2PLUS_TENANT_LOADER: the tenants of settings.ES2PLUS_TENANTS.
+    """
+    return [TenantConfig.from_settings(name, tenant) for name, tenant in settings.ES2PLUS_TENANTS.items()]
+
+
+class TenantConfigCache:
+    """
+        Process-local cache of the tenant configurations, indexed by TLS client identity, so resolving the
+        tenant of a request is a dict lookup.
+
+        The configurations are (re)loaded from ES2PLUS_TENANT_LOADER, a callable returning TenantConfig
+        objects, once ES2PLUS_TENANT_CACHE_TTL seconds have passed, by the first request after expiry only:
+        the other ones keep using the previous indexes meanwhile.
+    """
+    _instance = None
+
+    def __init__(self, loader=None, ttl=None):
+        self.loader = loader or import_string(settings.ES2PLUS_TENANT_LOADER)
+        self.ttl = settings.ES2PLUS_TENANT_CACHE_TTL if ttl is None else ttl
+        self._by_client_identity = {}
+        self._expires_at = 0.0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _index(self):
+        if time.monotonic() >= self._expires_at and self._lock.acquire(blocking=not self._loaded):
+            try:
+                if time.monotonic() >= self._expires_at:
+                    self.reload()
+            finally:
+                self._lock.release()
+        return self._by_client_identity
+
+    def reload(self):
+        by_client_identity = {}
+        for config in self.loader():
+            for identity in config.client_identities:
+                by_client_identity[identity] = config
+        # swapped as a whole, a concurrent lookup sees either the old or the new index
+        self._by_client_identity = by_client_identity
+        self._expires_at = time.monotonic() + self.ttl
+        self._loaded = True
+
+    def invalidate(self):
+        self._expires_at = 0.0
+
+    def resolve(self, client_identity):
+        """
+            TenantConfig of the TLS client identity of the caller, None when unknown.
+        """
+        by_client_identity = self._index()
+        return by_client_identity.get(client_identity) if client_identity else None
@@ -1,3 +1,664 @@
-from django.test import TestCase
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from base64 import b64encode
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.db import OperationalError, connection, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper as SqliteDatabaseWrapper
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from api.exceptions import Es2PlusException, RpmOrderEidInvalidAssociationException, \
+    RpmOrderICCIDIsUnknownException, RpmOrderInvalidMetadataException, RpmOrderInvalidProfileOwnerOIDException, \
+    StatusCodeRegistry
+from api.metadata import ProfileMetadata
+from api.metadata_diff import MetadataDiff
+from api.admission import AdmissionController, LocalTokenBucketBackend
+from api.backends.pool import ConnectionPool, PooledDatabaseWrapperMixin, PoolTimeout
+from api.idempotency import IdempotencyStore
+from api.middleware import AdmissionMiddleware, TenantMiddleware
+from api.models import HandleNotifyState, InvalidProfileTransition, Profile, ProfileLifecycle, RpmOrder
+from api.rpm_validator import RpmPackageValidator
+from api.rsp_22_v3 import RSPDefinitions
+from api.tenants import TenantConfig, TenantConfigCache, TenantRouter
+from api.utils import RpmOrderHelper
+
+EID = '89049032123451234512345678901235'
+OTHER_EID = '89049032123451234512345678901236'
+OWNER_OID = '2.999.10'
+OTHER_OWNER_OID = '2.999.20'
+
+
+def rpm_package(*commands):
+    RSPDefinitions.RpmPackage.set_val([{'rpmCommandDetails': command} for command in commands])
+    return RSPDefinitions.RpmPackage.to_der()
+
+
+def enable(iccid):
+    return 'enable', {'iccid': ProfileMetadata.digits_to_iccid(iccid)}
+
+
+def list_profile_info(profile_owner_oid):
+    return 'listProfileInfo', {'searchCriteria': (
+        'profileOwnerOid', tuple(int(arc) for arc in profile_owner_oid.split('.'))
+    )}
+
+
+OPERATOR_A = TenantConfig(
+    'operator-a', database='operator-a', profile_owner_oid=OWNER_OID, function_requester_identifiers=['operator-a'],
+    client_identities=['CN=es2plus.operator-a.example']
+)
+OPERATOR_B = TenantConfig(
+    'operator-b', database=None, profile_owner_oid=OTHER_OWNER_OID, function_requester_identifiers=['operator-b'],
+    client_identities=['CN=es2plus.operator-b.example']
+)
+
+
+def tenants(*configs):
+    return mock.patch.object(TenantConfigCache, '_instance', TenantConfigCache(loader=lambda: configs, ttl=300))
+
+
+def setUpModule():
+    # the api app has no migrations: its tables are created for the tests
+    with connection.schema_editor() as editor:
+        for model in (Profile, RpmOrder):
+            editor.create_model(model)
+
+
+def tearDownModule():
+    with connection.schema_editor() as editor:
+        for model in (Profile, RpmOrder):
+            editor.delete_model(model)
+
+
+class TenantMiddlewareTest(SimpleTestCase):
+
+    def setUp(self):
+        self.seen = []
+        self.middleware = TenantMiddleware(lambda request: self.seen.append(
+            (request.tenant, request.profile_owner_oid, TenantRouter.current())
+        ))
+
+    def call(self, client_identity=None, function_requester_identifier=None, path='/rpmOrder'):
+        headers = {'HTTP_X_SSL_CLIENT_S_DN': client_identity} if client_identity else {}
+        body = {'header': {'functionRequesterIdentifier': function_requester_identifier, 'functionCallIdentifier': '1'}}
+        request = RequestFactory().post(path, json.dumps(body), content_type='application/json', **headers)
+        with tenants(OPERATOR_A, OPERATOR_B):
+            return self.middleware(request)
+
+    def test_tenant_of_the_client_identity(self):
+        self.assertIsNone(self.call('CN=es2plus.operator-a.example', 'operator-a'))
+        self.assertEqual(self.seen, [(OPERATOR_A, OWNER_OID, 'operator-a')])
+
+    def test_function_requester_identifier_of_another_tenant(self):
+        self.assertEqual(self.call('CN=es2plus.operator-a.example', 'operator-b').status_code, 403)
+        self.assertEqual(self.seen, [])
+
+    def test_unknown_caller_not_resolved_from_the_body(self):
+        self.assertEqual(self.call(None, 'operator-a').status_code, 403)
+        self.assertEqual(self.call('CN=unknown.example', 'operator-a').status_code, 403)
+        self.assertEqual(self.seen, [])
+
+    def test_exempt_path(self):
+        self.assertIsNone(self.call(None, None, path='/admin/'))
+        self.assertEqual(self.seen, [(None, None, None)])
+
+
+class AdmissionMiddlewareTest(SimpleTestCase):
+
+    def setUp(self):
+        self.middleware = TenantMiddleware(AdmissionMiddleware(lambda request: HttpResponse()))
+        controller = AdmissionController(LocalTokenBucketBackend(), rate=0.001, burst=2, soft_in_flight=8,
+                                         max_in_flight=16)
+        patcher = mock.patch.object(AdmissionController, '_instance', controller)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def call(self, client_identity, function_requester_identifier):
+        body = {'header': {'functionRequesterIdentifier': function_requester_identifier, 'functionCallIdentifier': '1'}}
+        request = RequestFactory().post('/rpmOrder', json.dumps(body), content_type='application/json',
+                                        HTTP_X_SSL_CLIENT_S_DN=client_identity)
+        with tenants(OPERATOR_A, OPERATOR_B):
+            return self.middleware(request).status_code
+
+    def test_bucket_of_the_authenticated_caller(self):
+        self.assertEqual([self.call('CN=es2plus.operator-a.example', 'operator-a') for _ in range(3)], [200, 200, 429])
+        # presenting the identifier of operator-a takes nothing from its bucket
+        self.assertEqual(self.call('CN=es2plus.operator-b.example', 'operator-a'), 403)
+        self.assertEqual([self.call('CN=es2plus.operator-b.example', 'operator-b') for _ in range(3)], [200, 200, 429])
+        self.assertEqual(set(AdmissionController.instance().metrics()['requesters']), {
+            'CN=es2plus.operator-a.example', 'CN=es2plus.operator-b.example',
+        })
+
+
+class IdempotencyStoreTest(SimpleTestCase):
+    HEADER = {'functionRequesterIdentifier': 'operator-a', 'functionCallIdentifier': 'call-1'}
+
+    def setUp(self):
+        self.store = IdempotencyStore(window=60, wait=0.01, max_entries=10)
+        self.executed = []
+
+    def execute(self):
+        self.executed.append(True)
+        return HttpResponse(b'{}', content_type='application/json')
+
+    @staticmethod
+    def request(client_identity, header=HEADER):
+        return SimpleNamespace(client_identity=client_identity, data={'header': header})
+
+    def test_completed_call_replayed(self):
+        key = IdempotencyStore.key(self.request('CN=operator-a'))
+        self.assertEqual(self.store.run(key, self.execute).content, b'{}')
+        self.assertEqual(self.store.run(key, self.execute).content, b'{}')
+        self.assertEqual(len(self.executed), 1)
+
+    def test_duplicate_timing_out_is_busy(self):
+        key = IdempotencyStore.key(self.request('CN=operator-a'))
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return self.execute()
+
+        leader = threading.Thread(target=self.store.run, args=(key, slow))
+        leader.start()
+        try:
+            started.wait(5)
+            response = self.store.run(key, self.execute)
+        finally:
+            release.set()
+            leader.join()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], IdempotencyStore.BUSY_RETRY_AFTER)
+        self.assertEqual(len(self.executed), 1)
+
+    def test_callers_do_not_share_keys(self):
+        self.assertNotEqual(
+            IdempotencyStore.key(self.request('CN=operator-a')), IdempotencyStore.key(self.request('CN=operator-b'))
+        )
+
+    def test_no_key_without_authenticated_caller(self):
+        self.assertIsNone(IdempotencyStore.key(self.request(None)))
+        self.assertIsNone(IdempotencyStore.key(self.request('CN=operator-a', {'functionRequesterIdentifier': 'x'})))
+
+
+class ProfileLifecycleTest(TestCase):
+    # HandleNotifyState.SOURCES of es9plus, checked against the same table by its tests
+    SOURCES = {
+        HandleNotifyState.INSTALLED: (None, HandleNotifyState.DELETED),
+        HandleNotifyState.ENABLED: (HandleNotifyState.INSTALLED, HandleNotifyState.DISABLED),
+        HandleNotifyState.DISABLED: (HandleNotifyState.INSTALLED, HandleNotifyState.ENABLED),
+        HandleNotifyState.DELETED: (HandleNotifyState.INSTALLED, HandleNotifyState.ENABLED, HandleNotifyState.DISABLED),
+    }
+
+    def test_same_transitions_as_es9plus(self):
+        self.assertEqual(
+            {target: tuple(ProfileLifecycle.states(ProfileLifecycle.sources(target))) for target in self.SOURCES},
+            self.SOURCES
+        )
+
+    def test_sources(self):
+        self.assertEqual(
+            ProfileLifecycle.states(ProfileLifecycle.sources(HandleNotifyState.ENABLED)),
+            [HandleNotifyState.INSTALLED, HandleNotifyState.DISABLED]
+        )
+        self.assertEqual(ProfileLifecycle.states(ProfileLifecycle.sources(HandleNotifyState.INSTALLED)),
+                         [None, HandleNotifyState.DELETED])
+
+    def test_check(self):
+        ProfileLifecycle.check(None, HandleNotifyState.INSTALLED)
+        ProfileLifecycle.check(HandleNotifyState.ENABLED, HandleNotifyState.ENABLED)
+        ProfileLifecycle.check(HandleNotifyState.ENABLED, HandleNotifyState.DELETED)
+        with self.assertRaises(InvalidProfileTransition):
+            ProfileLifecycle.check(HandleNotifyState.DELETED, HandleNotifyState.ENABLED)
+        with self.assertRaises(InvalidProfileTransition):
+            ProfileLifecycle.check(None, HandleNotifyState.ENABLED)
+
+
+class ProfileQuerySetTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for iccid, eid, state in (
+                ('89001012345678900001', EID, HandleNotifyState.INSTALLED),
+                ('89001012345678900002', EID, HandleNotifyState.ENABLED),
+                ('89001012345678900003', OTHER_EID, None),
+                ('89001012345678900004', OTHER_EID, HandleNotifyState.DISABLED),
+        ):
+            Profile.objects.create(linked_eid=eid, iccid=iccid, handle_notify_state=state)
+
+    def states(self):
+        return list(Profile.objects.order_by('iccid').values_list('handle_notify_state', flat=True))
+
+    def test_state_masks(self):
+        self.assertEqual(Profile.objects.state_masks([EID, OTHER_EID, '0' * 32]), {
+            EID: ProfileLifecycle.mask(HandleNotifyState.INSTALLED, HandleNotifyState.ENABLED),
+            OTHER_EID: ProfileLifecycle.mask(None, HandleNotifyState.DISABLED),
+        })
+
+    def test_for_eids(self):
+        profiles = Profile.objects.for_eids([EID, OTHER_EID], ProfileLifecycle.mask(None, HandleNotifyState.ENABLED))
+        self.assertEqual(sorted(profiles.values_list('iccid', flat=True)),
+                         ['89001012345678900002', '89001012345678900003'])
+
+    def test_transition_only_moves_allowed_profiles(self):
+        self.assertEqual(Profile.objects.transition(HandleNotifyState.DELETED), 3)
+        self.assertEqual(self.states(), [
+            HandleNotifyState.DELETED, HandleNotifyState.DELETED, None, HandleNotifyState.DELETED,
+        ])
+
+    def test_transition_of_iccids(self):
+        self.assertEqual(Profile.objects.transition(
+            HandleNotifyState.ENABLED, ['89001012345678900001', '89001012345678900003']
+        ), 1)
+        self.assertEqual(self.states(), [
+            HandleNotifyState.ENABLED, HandleNotifyState.ENABLED, None, HandleNotifyState.DISABLED,
+        ])
+
+
+class RpmPackageValidatorTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        # the enabled Profile of the eUICC, identified in step 2, belongs to another Operator
+        cls.profile = Profile.objects.create(
+            linked_eid=EID, iccid='89001012345678900001', handle_notify_state=HandleNotifyState.ENABLED,
+            profile_owner_oid=OTHER_OWNER_OID
+        )
+        for iccid, eid, state in (
+                ('89001012345678900002', EID, HandleNotifyState.DISABLED),
+                ('89001012345678900003', EID, None),
+                ('89001012345678900004', OTHER_EID, HandleNotifyState.DISABLED),
+        ):
+            Profile.objects.create(linked_eid=eid, iccid=iccid, handle_notify_state=state, profile_owner_oid=OWNER_OID)
+
+    def validate(self, *commands, profile_owner_oid=OWNER_OID):
+        return RpmPackageValidator(self.profile, profile_owner_oid=profile_owner_oid).validate(rpm_package(*commands))
+
+    def test_owned_profile(self):
+        self.assertEqual(self.validate(list_profile_info(OWNER_OID), enable('89001012345678900002')), {})
+
+    def test_profile_of_another_owner(self):
+        with self.assertRaises(RpmOrderICCIDIsUnknownException):
+            self.validate(enable('89001012345678900001'))
+
+    def test_caller_without_profile_owner_oid(self):
+        with self.assertRaises(RpmOrderICCIDIsUnknownException):
+            self.validate(enable('89001012345678900002'), profile_owner_oid=None)
+        with self.assertRaises(RpmOrderInvalidProfileOwnerOIDException):
+            self.validate(list_profile_info(OWNER_OID), profile_owner_oid=None)
+
+    def test_profile_owner_oid_of_the_caller_only(self):
+        # the Profile Owner OID of the eUICC Profile is not the one the caller has to present
+        with self.assertRaises(RpmOrderInvalidProfileOwnerOIDException):
+            self.validate(list_profile_info(OTHER_OWNER_OID))
+        with self.assertRaises(RpmOrderInvalidProfileOwnerOIDException):
+            self.validate(list_profile_info(OWNER_OID), list_profile_info(OTHER_OWNER_OID))
+
+    def test_profile_not_installed_on_the_euicc(self):
+        for iccid in ('89001012345678900003', '89001012345678900004'):
+            with self.assertRaises(RpmOrderEidInvalidAssociationException):
+                self.validate(enable(iccid))
+
+    def test_unknown_profile(self):
+        with self.assertRaises(RpmOrderICCIDIsUnknownException):
+            self.validate(enable('89001012345678900009'))
+
+
+class ProfileMetadataTest(SimpleTestCase):
+    """
+        Round trips of the StoreMetadataRequest and ProfileInfo encoded by pycrate, with every optional field.
+    """
+    ICCID = '89001012345678900001'
+    NOTIFICATION_CONFIGURATION_INFO = [
+        {'profileManagementOperation': (0b1111, 4), 'notificationAddress': 'smdp.example.com'},
+    ]
+    PROFILE_OWNER = {'mccMnc': bytes.fromhex('02F810'), 'gid1': b'\x01', 'gid2': b'\x02'}
+    RPM_CONFIGURATION = {
+        'managingDpList': [{'managingDpOid': (2, 999, 1), 'rpmType': (0b11, 2)}],
+        'pollingAddress': 'smdp.example.com', 'profileOwnerOid': (2, 999, 10),
+    }
+
+    @classmethod
+    def store_metadata_request(cls, **fields):
+        RSPDefinitions.StoreMetadataRequest.set_val({
+            'iccid': ProfileMetadata.digits_to_iccid(cls.ICCID), 'serviceProviderName': 'Operator',
+            'profileName': 'Profile', **fields
+        })
+        return RSPDefinitions.StoreMetadataRequest.to_der()
+
+    @classmethod
+    def profile_info(cls, **fields):
+        RSPDefinitions.ProfileInfo.set_val(fields)
+        return RSPDefinitions.ProfileInfo.to_der()
+
+    def test_store_metadata_request_with_all_fields(self):
+        der = self.store_metadata_request(
+            iconType=1, icon=bytes(range(256)) * 2, profileClass=ProfileMetadata.PROVISIONING,
+            notificationConfigurationInfo=self.NOTIFICATION_CONFIGURATION_INFO, profileOwner=self.PROFILE_OWNER,
+            profilePolicyRules=(0b011, 3), rpmConfiguration=self.RPM_CONFIGURATION,
+            hriServerAddress='hri.example.com', estimatedProfileSize=40000,
+        )
+        metadata = ProfileMetadata.from_der(der)
+        self.assertEqual(
+            (metadata.iccid_digits, metadata.service_provider_name, metadata.profile_name, metadata.icon_type,
+             len(metadata.icon), metadata.profile_class, metadata.profile_owner_oid),
+            (self.ICCID, 'Operator', 'Profile', 1, 512, ProfileMetadata.PROVISIONING, '2.999.10')
+        )
+        self.assertEqual(metadata.to_store_metadata_request(), der)
+
+    def test_store_metadata_request_with_mandatory_fields(self):
+        der = self.store_metadata_request()
+        metadata = ProfileMetadata.from_der(der)
+        self.assertEqual(metadata.profile_class, ProfileMetadata.OPERATIONAL)
+        self.assertIsNone(metadata.profile_owner_oid)
+        # profileClass operational, the DEFAULT, is not encoded
+        self.assertEqual(metadata.to_store_metadata_request(), der)
+
+    def test_profile_info_with_all_fields(self):
+        der = self.profile_info(
+            iccid=ProfileMetadata.digits_to_iccid(self.ICCID),
+            isdpAid=bytes.fromhex('A0000005591010FFFFFFFF8900001100'), profileState=1, profileNickname='Nickname',
+            serviceProviderName='Operator', profileName='Profile',
+            iconType=0, icon=b'icon', profileClass=ProfileMetadata.TEST,
+            notificationConfigurationInfo=self.NOTIFICATION_CONFIGURATION_INFO, profileOwner=self.PROFILE_OWNER,
+            dpProprietaryData={'dpOid': (2, 999, 10)}, profilePolicyRules=(0b1, 1),
+            rpmConfiguration=self.RPM_CONFIGURATION, hriServerAddress='hri.example.com', enabledOnEsimPort=1,
+            profileSize=40000,
+        )
+        metadata = ProfileMetadata.from_der(der)
+        self.assertEqual(
+            (metadata.isdp_aid.hex(), metadata.profile_state, metadata.profile_nickname, metadata.profile_class),
+            ('a0000005591010ffffffff8900001100', 1, 'Nickname', ProfileMetadata.TEST)
+        )
+        self.assertEqual(metadata.to_profile_info(), der)
+        # ListProfileInfo tagList
+        self.assertEqual(metadata.to_profile_info(bytes.fromhex('5A9F7091')), self.profile_info(
+            iccid=ProfileMetadata.digits_to_iccid(self.ICCID), profileState=1, serviceProviderName='Operator',
+        ))
+
+    def test_store_metadata_request_as_profile_info(self):
+        metadata = ProfileMetadata.from_der(self.store_metadata_request(
+            profileOwner=self.PROFILE_OWNER, rpmConfiguration=self.RPM_CONFIGURATION,
+        ))
+        self.assertEqual(metadata.to_profile_info(), self.profile_info(
+            iccid=ProfileMetadata.digits_to_iccid(self.ICCID), serviceProviderName='Operator', profileName='Profile',
+            profileClass=ProfileMetadata.OPERATIONAL, profileOwner=self.PROFILE_OWNER,
+            rpmConfiguration=self.RPM_CONFIGURATION,
+        ))
+
+
+class MetadataDiffTest(SimpleTestCase):
+    ICCID = '89001012345678900001'
+
+    def setUp(self):
+        RSPDefinitions.StoreMetadataRequest.set_val({
+            'iccid': ProfileMetadata.digits_to_iccid(self.ICCID), 'serviceProviderName': 'Operator',
+            'profileName': 'Profile', 'iconType': 0, 'icon': b'icon', 'profileClass': ProfileMetadata.PROVISIONING,
+        })
+        self.stored = ProfileMetadata.from_der(RSPDefinitions.StoreMetadataRequest.to_der())
+
+    def compute(self, update):
+        RSPDefinitions.UpdateMetadataRequest.set_val(update)
+        return MetadataDiff.compute(self.stored, RSPDefinitions.UpdateMetadataRequest.to_der())
+
+    @staticmethod
+    def store_metadata_request(diff):
+        RSPDefinitions.StoreMetadataRequest.from_der(diff.to_store_metadata_request())
+        return RSPDefinitions.StoreMetadataRequest.get_val()
+
+    def test_replace(self):
+        diff = self.compute({'serviceProviderName': 'Other'})
+        self.assertEqual(set(diff.changed), {bytes.fromhex('91')})
+        self.assertEqual(diff.metadata.service_provider_name, 'Other')
+        self.assertEqual(diff.metadata.profile_name, 'Profile')
+
+    def test_unchanged_value_is_empty_diff(self):
+        diff = self.compute({'serviceProviderName': 'Operator'})
+        self.assertFalse(diff)
+        self.assertIs(diff.metadata, self.stored)
+
+    def test_add(self):
+        diff = self.compute({'hriServerAddress': 'hri.example'})
+        self.assertEqual(set(diff.changed), {bytes.fromhex('9B')})
+        self.assertEqual(self.store_metadata_request(diff)['hriServerAddress'], 'hri.example')
+
+    def test_delete(self):
+        diff = self.compute({'tagsForDeletion': bytes.fromhex('9394')})
+        self.assertEqual(diff.deleted, {bytes.fromhex('93'), bytes.fromhex('94')})
+        self.assertNotIn('icon', self.store_metadata_request(diff))
+
+    def test_delete_of_a_mandatory_tag_rejected(self):
+        for tag in ('91', '92'):
+            with self.subTest(tag=tag), self.assertRaises(RpmOrderInvalidMetadataException):
+                self.compute({'tagsForDeletion': bytes.fromhex(tag)})
+
+    def test_round_trip_through_the_asn1_definitions(self):
+        diff = self.compute({'profileName': 'Renamed', 'tagsForDeletion': bytes.fromhex('9394')})
+        der = diff.to_store_metadata_request()
+        value = self.store_metadata_request(diff)
+        self.assertEqual(value, {
+            'iccid': ProfileMetadata.digits_to_iccid(self.ICCID), 'serviceProviderName': 'Operator',
+            'profileName': 'Renamed', 'profileClass': ProfileMetadata.PROVISIONING,
+        })
+        RSPDefinitions.StoreMetadataRequest.set_val(value)
+        self.assertEqual(RSPDefinitions.StoreMetadataRequest.to_der(), der)
+
+
+class RpmOrderMetadataUpdatesTest(TestCase):
+    ICCID = '89001012345678900001'
+
+    @classmethod
+    def setUpTestData(cls):
+        RSPDefinitions.StoreMetadataRequest.set_val({
+            'iccid': ProfileMetadata.digits_to_iccid(cls.ICCID), 'serviceProviderName': 'Operator',
+            'profileName': 'Profile', 'rpmConfiguration': {
+                'managingDpList': [{'managingDpOid': (2, 999, 1)}], 'profileOwnerOid': (2, 999, 10)
+            },
+        })
+        Profile.objects.create(
+            linked_eid=EID, iccid=cls.ICCID, handle_notify_state=HandleNotifyState.ENABLED, profile_owner_oid=OWNER_OID,
+            metadata=RSPDefinitions.StoreMetadataRequest.to_der()
+        )
+
+    def rpm_order(self, *update_metadata_requests):
+        iccid = ProfileMetadata.digits_to_iccid(self.ICCID)
+        request = SimpleNamespace(tenant_name=None, tenant=None, profile_owner_oid=OWNER_OID, data={
+            'eid': EID, 'rpmScript': b64encode(rpm_package(*(
+                ('updateMetadata', {'iccid': iccid, 'updateMetadataRequest': update})
+                for update in update_metadata_requests
+            ))).decode(),
+        })
+        return RpmOrder.objects.get(matching_id=RpmOrderHelper(request).serializer_data['matchingId'])
+
+    def test_metadata_updates_stored_with_the_order(self):
+        rpm_order = self.rpm_order({'serviceProviderName': 'Other'}, {'profileName': 'Renamed'})
+        update = rpm_order.metadata_updates[self.ICCID]
+        self.assertEqual(list(update), ['metadata'])
+        metadata = ProfileMetadata.from_der(bytes.fromhex(update['metadata']))
+        self.assertEqual((metadata.service_provider_name, metadata.profile_name), ('Other', 'Renamed'))
+
+    def test_transfer_gives_the_new_profile_owner_oid(self):
+        rpm_order = self.rpm_order({'rpmConfiguration': {
+            'managingDpList': [{'managingDpOid': (2, 999, 1)}], 'profileOwnerOid': (2, 999, 20)
+        }})
+        self.assertEqual(rpm_order.metadata_updates[self.ICCID]['profile_owner_oid'], OTHER_OWNER_OID)
+
+    def test_unchanged_metadata_not_stored(self):
+        self.assertIsNone(self.rpm_order({'serviceProviderName': 'Operator'}).metadata_updates)
+
+
+class Es2PlusExceptionTest(SimpleTestCase):
+    def test_preallocated_response(self):
+        response = RpmOrderICCIDIsUnknownException().response()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.content, RpmOrderICCIDIsUnknownException.rendered)
+        self.assertEqual(json.loads(response.content), {'header': {'functionExecutionStatus': {
+            'status': 'Failed', 'statusCodeData': {
+                'subjectCode': '8.2.1', 'reasonCode': '3.9', 'message': RpmOrderICCIDIsUnknownException.message,
+            },
+        }}})
+
+    def test_preallocated_response_same_as_rendered_detail(self):
+        for exception_class in (RpmOrderEidInvalidAssociationException, RpmOrderInvalidMetadataException):
+            self.assertEqual(exception_class.rendered, StatusCodeRegistry.render(exception_class.default_detail))
+
+    def test_custom_detail_rendered(self):
+        detail = StatusCodeRegistry.detail('8.2.1', '3.9', 'ICCID 89001012345678900001 unknown')
+        response = RpmOrderICCIDIsUnknownException(detail).response()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), detail)
+
+    def test_status_code_declared_again_shares_its_body(self):
+        class ICCIDIsUnknownException(Es2PlusException):
+            subject_code = RpmOrderICCIDIsUnknownException.subject_code
+            reason_code = RpmOrderICCIDIsUnknownException.reason_code
+            message = RpmOrderICCIDIsUnknownException.message
+
+        self.assertIs(ICCIDIsUnknownException.rendered, RpmOrderICCIDIsUnknownException.rendered)
+
+    def test_status_code_declared_again_with_another_message_rejected(self):
+        with self.assertRaises(ValueError):
+            class ICCIDIsUnknownException(Es2PlusException):
+                subject_code = RpmOrderICCIDIsUnknownException.subject_code
+                reason_code = RpmOrderICCIDIsUnknownException.reason_code
+                message = 'Unknown ICCID.'
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    def setUp(self):
+        self.pool = ConnectionPool('operator-a', max_size=2, timeout=0.05)
+        self.opened = []
+
+    def connect(self):
+        connection = sqlite3.connect(':memory:', check_same_thread=False)
+        self.opened.append(connection)
+        return connection
+
+    def test_released_connection_reused(self):
+        first = self.pool.acquire(self.connect)
+        second = self.pool.acquire(self.connect)
+        self.pool.release(first)
+        self.assertIs(self.pool.acquire(self.connect), first)
+        self.pool.release(second)
+        self.assertEqual(len(self.opened), 2)
+        self.assertEqual(self.pool.metrics(), {'max_size': 2, 'in_use': 1, 'idle': 1, 'opened': 2, 'waits': 0})
+
+    def test_discarded_connection_closed(self):
+        discarded = self.pool.acquire(self.connect)
+        self.pool.release(discarded, discard=True)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            discarded.execute('SELECT 1')
+        self.assertIsNot(self.pool.acquire(self.connect), discarded)
+        self.assertEqual(self.pool.metrics()['opened'], 1)
+
+    def test_connection_idle_too_long_closed(self):
+        self.pool.max_idle = 0
+        idle = self.pool.acquire(self.connect)
+        self.pool.release(idle)
+        self.assertIsNot(self.pool.acquire(self.connect), idle)
+        self.assertEqual(self.pool.metrics()['opened'], 1)
+
+    def test_full_pool_times_out(self):
+        self.pool.acquire(self.connect)
+        self.pool.acquire(self.connect)
+        with self.assertRaises(PoolTimeout):
+            self.pool.acquire(self.connect)
+        self.assertEqual(self.pool.metrics(), {'max_size': 2, 'in_use': 2, 'idle': 0, 'opened': 2, 'waits': 1})
+
+    def test_full_pool_blocks_until_a_release(self):
+        self.pool.timeout = 5
+        first = self.pool.acquire(self.connect)
+        self.pool.acquire(self.connect)
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(self.pool.acquire(self.connect)))
+        waiter.start()
+        waiter.join(0.05)
+        self.assertTrue(waiter.is_alive())
+        self.pool.release(first)
+        waiter.join(5)
+        self.assertEqual(acquired, [first])
+        self.assertEqual(len(self.opened), 2)
+
+    def test_failed_connect_frees_its_slot(self):
+        def connect():
+            raise sqlite3.OperationalError('unable to open database file')
+
+        for _ in range(3):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.pool.acquire(connect)
+        self.assertEqual(self.pool.metrics()['in_use'], 0)
+        self.pool.acquire(self.connect)
+        self.pool.acquire(self.connect)
+
+
+class PooledSqliteDatabaseWrapper(PooledDatabaseWrapperMixin, SqliteDatabaseWrapper):
+    pass
+
+
+class PooledDatabaseWrapperTest(SimpleTestCase):
+    def setUp(self):
+        descriptor, path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(descriptor)
+        self.addCleanup(os.remove, path)
+        # the pools are shared by the wrappers of one alias, as the connections of the threads of a process
+        pools = mock.patch.dict(PooledDatabaseWrapperMixin._pools)
+        pools.start()
+        self.addCleanup(pools.stop)
+        self.settings_dict = dict(connection.settings_dict, NAME=path, POOL_SIZE=1, POOL_TIMEOUT=0.05)
+
+    def wrapper(self):
+        wrapper = PooledSqliteDatabaseWrapper(self.settings_dict, alias='operator-a')
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def test_pool_per_alias_from_the_settings(self):
+        pool = self.wrapper().pool
+        self.assertIs(self.wrapper().pool, pool)
+        self.assertEqual((pool.name, pool.max_size, pool.timeout), ('operator-a', 1, 0.05))
+
+    def test_closed_connection_back_to_the_pool(self):
+        wrapper = self.wrapper()
+        wrapper.ensure_connection()
+        raw = wrapper.connection
+        wrapper.close()
+        self.assertIsNone(wrapper.connection)
+        self.assertEqual(wrapper.pool.metrics(), {'max_size': 1, 'in_use': 0, 'idle': 1, 'opened': 1, 'waits': 0})
+        other = self.wrapper()
+        other.ensure_connection()
+        self.assertIs(other.connection, raw)
+
+    def test_closed_connection_rolled_back(self):
+        wrapper = self.wrapper()
+        wrapper.ensure_connection()
+        wrapper.connection.execute('CREATE TABLE event (id INTEGER)')
+        wrapper.set_autocommit(False)
+        wrapper.connection.execute('INSERT INTO event VALUES (1)')
+        wrapper.close()
+        other = self.wrapper()
+        with other.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM event')
+            self.assertEqual(cursor.fetchone(), (0,))
+
+    def test_connection_closed_in_atomic_block_discarded(self):
+        wrapper = self.wrapper()
+        with mock.patch('django.db.transaction.get_connection', return_value=wrapper):
+            with transaction.atomic(using='operator-a'):
+                raw = wrapper.connection
+                wrapper.close()
+        self.assertIsNone(wrapper.connection)
+        self.assertEqual(wrapper.pool.metrics(), {'max_size': 1, 'in_use': 0, 'idle': 0, 'opened': 0, 'waits': 0})
+        with self.assertRaises(sqlite3.ProgrammingError):
+            raw.execute('SELECT 1')
+
+    def test_full_pool_raises_operational_error(self):
+        self.wrapper().ensure_connection()
+        with self.assertRaises(OperationalError):
+            self.wrapper().ensure_connection()
+        self.assertEqual(self.wrapper().pool.metrics()['waits'], 1)
@@ -0,0 +1,120 @@
+class TlvHelper:
+    """
+        BER-TLV helpers for the DER structures of RSPDefinitions handled without pycrate.
+    """
+
+    @staticmethod
+    def encode_length(length):
+        """
+            BER definite length: short form below 128, otherwise '81' / '82' / '83' followed by the length.
+        """
+        if length < 0x80:
+            return length.to_bytes(1, 'big')
+        elif length < 0x100:
+            return b'\x81' + length.to_bytes(1, 'big')
+        elif length < 0x10000:
+            return b'\x82' + length.to_bytes(2, 'big')
+        return b'\x83' + length.to_bytes(3, 'big')
+
+    @staticmethod
+    def encode_tlv(tag, value):
+        return tag + TlvHelper.encode_length(len(value)) + value
+
+    @staticmethod
+    def read_tlv(data, offset=0):
+        """
+            Returns (tag, value_offset, end_offset) of the BER-TLV starting at offset.
+        """
+        tag_end = offset + 1
+        if data[offset] & 0x1F == 0x1F:
+            while data[tag_end] & 0x80:
+                tag_end += 1
+            tag_end += 1
+        length = data[tag_end]
+        value_offset = tag_end + 1
+        if length & 0x80:
+            length_size = length & 0x7F
+            length = int.from_bytes(data[value_offset:value_offset + length_size], 'big')
+            value_offset += length_size
+        return bytes(data[offset:tag_end]), value_offset, value_offset + length
+
+    @staticmethod
+    def iter_tlvs(data, offset=0, end=None):
+        """
+            Yields (tag, offset, value_offset, end_offset) of the consecutive BER-TLVs of data[offset:end].
+        """
+        end = len(data) if end is None else end
+        while offset < end:
+            tag, value_offset, tlv_end = TlvHelper.read_tlv(data, offset)
+            yield tag, offset, value_offset, tlv_end
+            offset = tlv_end
+
+    @staticmethod
+    def find_tlv(data, *tags):
+        """
+            Returns the BER-TLV reached by following tags (hex strings, e.g. 'A5', 'BF2A'), the first
+            matching TLV being taken at each level, or None when it is absent.
+        """
+        start, end = 0, len(data)
+        for depth, tag in enumerate(bytes.fromhex(tag) for tag in tags):
+            offset = start
+            while offset < end:
+                found, value_offset, tlv_end = TlvHelper.read_tlv(data, offset)
+                if found == tag:
+                    break
+                offset = tlv_end
+            else:
+                return None
+            if depth == len(tags) - 1:
+                return bytes(data[offset:tlv_end])
+            start, end = value_offset, tlv_end
+
+    @staticmethod
+    def split_tags(data):
+        """
+            Tags of a tag list (e.g. tagList '5C'), as bytes.
+        """
+        tags = []
+        offset = 0
+        while offset < len(data):
+            end = offset + 1
+            if data[offset] & 0x1F == 0x1F:
+                while data[end] & 0x80:
+                    end += 1
+                end += 1
+            tags.append(bytes(data[offset:end]))
+            offset = end
+        return tags
+
+    @staticmethod
+    def encode_integer(value):
+        return value.to_bytes(value.bit_length() // 8 + 1, 'big', signed=True)
+
+    @staticmethod
+    def decode_integer(data):
+        return int.from_bytes(data, 'big', signed=True)
+
+    @staticmethod
+    def encode_oid(oid):
+        arcs = [int(arc) for arc in oid.split('.')]
+        encoded = bytearray()
+        for arc in [arcs[0] * 40 + arcs[1]] + arcs[2:]:
+            chunk = [arc & 0x7F]
+            arc >>= 7
+            while arc:
+                chunk.append(0x80 | (arc & 0x7F))
+                arc >>= 7
+            encoded.extend(reversed(chunk))
+        return bytes(encoded)
+
+    @staticmethod
+    def decode_oid(data):
+        arcs = []
+        arc = 0
+        for byte in data:
+            arc = (arc << 7) | (byte & 0x7F)
+            if not byte & 0x80:
+                arcs.append(arc)
+                arc = 0
+        first = min(arcs[0] // 40, 2)
+        return '.'.join(str(value) for value in [first, arcs[0] - first * 40] + arcs[1:])
@@ -1,36 +1,44 @@
-from serializers import RpmOrderRequestSerializer, RpmOrderResponseSerializer
+from django.db import IntegrityError, transaction
 
-
-class RpmCommandName:
-    ENABLE: str = 'enable'
-    DISABLE: str = 'disable'
-    DELETE: str = 'delete'
-    LIST_PROFILE_INFO: str = 'listProfileInfo'
-    UPDATE_METADATA: str = 'updateMetadata'
-    CONTACT_PCMP: str = 'contactPcmp'
+from api.exceptions import RpmOrderMatchingIdAlreadyIsUseException
+from api.models import RpmOrder
+from api.renderers import Es2PlusResponseBuilder
+from api.schema import RequestSchema
+from api.serializers import RpmOrderRequestSerializer
+from api.tenants import TenantDatabases
 
 
 class RpmOrderHelper:
-    RESPONSE_SERIALIZER = RpmOrderResponseSerializer
+    REQUEST_SCHEMA = RequestSchema(RpmOrderRequestSerializer)
+    RESPONSE_BUILDER = Es2PlusResponseBuilder('matchingId')
 
     def __init__(self, request):
-        self.tenant_name = request.tenant_name
+        self.tenant_name = TenantDatabases.alias(request.tenant_name)
 
+        # the fields are checked (and rpmScript decoded) by the compiled schema, the serializer only runs the
+        # RpmOrder steps of validate()
         rpm_order_serializer = RpmOrderRequestSerializer(
-            data=request.data, context={'tenant_name': self.tenant_name}
+            context={
+                'tenant_name': self.tenant_name,
+                'profile_owner_oid': getattr(request, 'profile_owner_oid', None),
+                'tenant': getattr(request, 'tenant', None),
+            }
         )
-        rpm_order_serializer.is_valid(raise_exception=True)
-        self.serializer_data = rpm_order_serializer.data
+        self.serializer_data = rpm_order_serializer.validate(self.REQUEST_SCHEMA.validate(request.data))
+        self.metadata_diffs = rpm_order_serializer.metadata_diffs
+        # released for ES9+.AuthenticateClient, the RpmPackage being kept in DER as validated
+        try:
+            with transaction.atomic(using=self.tenant_name):
+                RpmOrder.objects.using(self.tenant_name).create(
+                    eid=self.serializer_data['eid'],
+                    matching_id=self.serializer_data['matchingId'],
+                    rpm_package=self.serializer_data['rpmScript'],
+                    metadata_updates=RpmOrder.encode_metadata_updates(self.metadata_diffs),
+                )
+        except IntegrityError:
+            raise RpmOrderMatchingIdAlreadyIsUseException()
 
     @property
     def response(self):
-        _response = self.RESPONSE_SERIALIZER(
-            {
-                'header': {
-                    "functionExecutionStatus": {"status": "Executed-Success"}
-                },
-                'matchingId': self.serializer_data.matchingId
-            }
-        ).data
-
-        return _response
+        # same output as RpmOrderResponseSerializer, rendered directly
+        return self.RESPONSE_BUILDER.response(matchingId=self.serializer_data['matchingId'])
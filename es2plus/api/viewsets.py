@@ -1,10 +1,23 @@
 from rest_framework import viewsets
-from rest_framework.response import Response
 
+from api.exceptions import Es2PlusException
+from api.idempotency import IdempotencyStore
 from api.utils import RpmOrderHelper
 
 
-class RpmOrderViewSet(viewsets.ViewSet):
+class Es2PlusViewSetMixin:
+    """
+        Answers the ES2+ failures with their preallocated response, the other exceptions going through the
+        DRF exception handling.
+    """
+
+    def handle_exception(self, exc):
+        if isinstance(exc, Es2PlusException):
+            return exc.response()
+        return super().handle_exception(exc)
+
+
+class RpmOrderViewSet(Es2PlusViewSetMixin, viewsets.ViewSet):
     """
         This function is used to instruct the SM-DP+ of a new RPM Package.
 
@@ -64,5 +77,12 @@ class RpmOrderViewSet(viewsets.ViewSet):
     """
     rpm_order_helper = RpmOrderHelper
 
+    def _rpm_order(self, request):
+        try:
+            return self.rpm_order_helper(request).response
+        except Es2PlusException as exc:
+            # a failed function execution is a final response as well, replayed to the retries
+            return exc.response()
+
     def create(self, request):
-        Response(self.rpm_order_helper(request).response)
\ No newline at end of file
+        return IdempotencyStore.instance().run(IdempotencyStore.key(request), lambda: self._rpm_order(request))
\ No newline at end of file
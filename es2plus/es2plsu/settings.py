@@ -49,6 +49,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.TenantMiddleware',
+    'api.middleware.AdmissionMiddleware',
 ]
 
 ROOT_URLCONF = 'es2plsu.urls'
@@ -82,6 +84,57 @@ DATABASES = {
     }
 }
 
+# Tenants
+# Each tenant (request.tenant_name) has its own database, registered on first use. With the pooled
+# PostgreSQL backend a tenant has its own pool of connections: at most POOL_SIZE of them, a request waiting
+# POOL_TIMEOUT seconds for a free one, so a busy tenant cannot exhaust the connections of the others.
+# Keep CONN_MAX_AGE to 0: the connection then goes back to the pool at the end of each request.
+#
+# ES2PLUS_TENANT_DATABASES = {
+#     'operator-a': {
+#         'ENGINE': 'api.backends.postgresql',
+#         'NAME': 'es2plus_operator_a',
+#         'USER': 'es2plus',
+#         'PASSWORD': '',
+#         'HOST': 'localhost',
+#         'PORT': '5432',
+#         'POOL_SIZE': 10,
+#         'POOL_TIMEOUT': 5,
+#     },
+# }
+
+ES2PLUS_TENANT_DATABASES = {}
+
+DATABASE_ROUTERS = ['api.tenants.TenantRouter']
+
+# Operators (tenants), resolved by api.middleware.TenantMiddleware from the TLS client identity (request.META
+# key ES2PLUS_CLIENT_IDENTITY_META, set by the TLS terminating proxy), the ES2+ functionRequesterIdentifier having
+# to be one of FUNCTION_REQUESTER_IDENTIFIERS. Other callers get 403, except on ES2PLUS_TENANT_EXEMPT_PATHS.
+# DATABASE defaults to the tenant name when it is in ES2PLUS_TENANT_DATABASES, to the default database otherwise.
+# The configurations come from ES2PLUS_TENANT_LOADER and are cached ES2PLUS_TENANT_CACHE_TTL seconds.
+#
+# ES2PLUS_TENANTS = {
+#     'operator-a': {
+#         'FUNCTION_REQUESTER_IDENTIFIERS': ['operator-a'],
+#         'CLIENT_IDENTITIES': ['CN=es2plus.operator-a.example,O=Operator A'],
+#         'PROFILE_OWNER_OID': '2.999.10',
+#         'ROOT_SMDS_ADDRESS': 'smds.example',
+#         'ALT_SMDS_ADDRESS': None,
+#         'ADMISSION_RATE': 20,
+#         'ADMISSION_BURST': 40,
+#     },
+# }
+
+ES2PLUS_TENANTS = {}
+
+ES2PLUS_TENANT_LOADER = 'api.tenants.load_tenant_configs'
+
+ES2PLUS_TENANT_CACHE_TTL = 300
+
+ES2PLUS_CLIENT_IDENTITY_META = 'HTTP_X_SSL_CLIENT_S_DN'
+
+ES2PLUS_TENANT_EXEMPT_PATHS = ['/admin/']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -123,3 +176,47 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# REST framework
+# ES2+ responses are rendered with ES2PLUS_JSON_ENCODER, a callable returning the JSON bytes of a value
+# (api.renderers.default_dumps: orjson when installed, the standard json module otherwise).
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+ES2PLUS_JSON_ENCODER = 'api.renderers.default_dumps'
+
+
+# ES2+ function calls retried by the Operator (same functionRequesterIdentifier and functionCallIdentifier)
+# over the same TLS connection identity get the response of the first execution for ES2PLUS_IDEMPOTENCY_WINDOW
+# seconds, the duplicates received while it executes waiting up to ES2PLUS_IDEMPOTENCY_WAIT seconds for it, then
+# getting 503 Service Unavailable (api.idempotency.IdempotencyStore)
+
+ES2PLUS_IDEMPOTENCY_WINDOW = 600
+
+ES2PLUS_IDEMPOTENCY_WAIT = 30
+
+ES2PLUS_IDEMPOTENCY_MAX_ENTRIES = 100000
+
+
+# Admission control per TLS client identity (api.middleware.AdmissionMiddleware): token bucket of
+# ES2PLUS_ADMISSION_RATE requests per second, ES2PLUS_ADMISSION_BURST at once (per tenant ADMISSION_RATE /
+# ADMISSION_BURST), then 429. Above ES2PLUS_ADMISSION_SOFT_IN_FLIGHT requests in flight in a worker the requesters
+# low on tokens are shed first (503), above ES2PLUS_ADMISSION_MAX_IN_FLIGHT all of them.
+
+ES2PLUS_ADMISSION_BACKEND = 'api.admission.LocalTokenBucketBackend'
+
+ES2PLUS_ADMISSION_RATE = 50
+
+ES2PLUS_ADMISSION_BURST = 100
+
+ES2PLUS_ADMISSION_SOFT_IN_FLIGHT = 32
+
+ES2PLUS_ADMISSION_MAX_IN_FLIGHT = 64
+
+ES2PLUS_ADMISSION_EXEMPT_PATHS = ['/admin/']
@@ -1,6 +1,20 @@
 from django.apps import AppConfig
+from django.core.signals import request_started
+
+
+def start_operator_notifier(**kwargs):
+    """
+        Starts delivering the operator notifications left pending by a previous run, on the first request
+        handled by the server rather than whenever the app is loaded (management commands, tests).
+    """
+    request_started.disconnect(dispatch_uid='api.start_operator_notifier')
+    from api.es9 import HandleNotification
+    HandleNotification.ingestor().notifier.start()
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        request_started.connect(start_operator_notifier, dispatch_uid='api.start_operator_notifier')
@@ -0,0 +1,117 @@
+import hashlib
+
+from ecdsa import SigningKey, VerifyingKey, ECDH
+
+from api.codec import Asn1Codec
+from api.der_template import DerTemplate
+from api.rsp_22_v3 import RSPDefinitions
+from api.scp11 import SCP11
+from api.tlv_helper import TlvHelper
+
+
+class BoundProfilePackageBuilder:
+    """
+        Bound Profile Package generation (SGP.22 section 2.5.4).
+
+        1.  Generate the one-time key pair otSK.DP.ECKA / otPK.DP.ECKA on the curve of the eUICC.
+        2.  Compute the shared secret ShS from otSK.DP.ECKA and otPK.EUICC.ECKA and derive the initial MAC
+            chaining value, S-ENC and S-MAC with the X9.63 Key Derivation Function.
+        3.  Build the InitialiseSecureChannelRequest signed with SK.DPpb.ECDSA over its data objects and
+            otPK.EUICC.ECKA (tag '5F49').
+        4.  Protect ConfigureISDP ('87', encrypted), StoreMetadata ('88', MAC only) and the Profile Package
+            segments ('86', encrypted).
+
+        build() returns the DER parts of the BoundProfilePackage, rendered in the GetBoundProfilePackageOk
+        template.
+    """
+    REMOTE_OP_ID_INSTALL_BPP = 1
+    SEGMENT_SIZE = SCP11.MAX_PAYLOAD_LENGTH
+    METADATA_SEGMENT_SIZE = 1012
+
+    _request_template = None
+
+    def __init__(self, transaction_id, eid, euicc_otpk, curve, smdp_oid):
+        self.transaction_id = transaction_id
+        self.eid = eid
+        self.euicc_otpk = euicc_otpk
+        self.curve = curve
+        self.smdp_oid = smdp_oid
+
+        self.ot_sk_smdp_ecka = SigningKey.generate(curve=curve)
+        self.ot_pk_smdp_ecka = b'\x04' + self.ot_sk_smdp_ecka.get_verifying_key().to_string()
+        self.scp = SCP11(*self._session_keys())
+
+    def _session_keys(self):
+        ecdh = ECDH(
+            curve=self.curve, private_key=self.ot_sk_smdp_ecka,
+            public_key=VerifyingKey.from_string(self.euicc_otpk, curve=self.curve)
+        )
+        shared_secret = ecdh.generate_sharedsecret_bytes()
+        shared_info = bytes.fromhex(SCP11.shared_info(self.eid.encode()))
+        key_data = b''.join(
+            hashlib.sha256(shared_secret + counter.to_bytes(4, 'big') + shared_info).digest()
+            for counter in (1, 2, 3)
+        )
+        return key_data[0:16].hex(), key_data[16:32].hex(), key_data[32:48].hex()
+
+    @classmethod
+    def initialise_secure_channel_request_value(cls, transaction_id, smdp_otpk, smdp_sign):
+        return {
+            'remoteOpId': cls.REMOTE_OP_ID_INSTALL_BPP,
+            'transactionId': transaction_id,
+            'controlRefTemplate': {
+                'keyType': bytes.fromhex(SCP11.KEY_TYPE),
+                'keyLen': bytes.fromhex(SCP11.KEY_LENGTH),
+                'hostId': bytes.fromhex(SCP11.HOST_ID),
+            },
+            'smdpOtpk': smdp_otpk,
+            'smdpSign': smdp_sign,
+        }
+
+    @classmethod
+    def request_template(cls):
+        if cls._request_template is None:
+            cls._request_template = DerTemplate(
+                RSPDefinitions.InitialiseSecureChannelRequest,
+                lambda slot: cls.initialise_secure_channel_request_value(
+                    slot('transactionId'), slot('smdpOtpk', size=65), slot('smdpSign', size=64)
+                )
+            )
+        return cls._request_template
+
+    def initialise_secure_channel_request(self, sign):
+        """
+            The data objects are rendered once: signed (followed by otPK.EUICC.ECKA) and then embedded with
+            the smdpSign TLV appended.
+        """
+        der = self.request_template().render(
+            transactionId=self.transaction_id, smdpOtpk=self.ot_pk_smdp_ecka, smdpSign=b''
+        )
+        # data objects of the request without the trailing empty smdpSign ('5F37 00')
+        tag, value_offset, end = TlvHelper.read_tlv(der)
+        data_objects = der[value_offset:end - 3]
+        smdp_sign = sign(
+            data_objects + b'\x5F\x49' + TlvHelper.encode_length(len(self.euicc_otpk)) + self.euicc_otpk
+        )
+        value = data_objects + b'\x5F\x37' + TlvHelper.encode_length(len(smdp_sign)) + smdp_sign
+        return tag + TlvHelper.encode_length(len(value)) + value
+
+    @staticmethod
+    def _segments(data, size):
+        return [data[index:index + size] for index in range(0, len(data), size)]
+
+    def build(self, profile_metadata, upp, sign):
+        configure_isdp = Asn1Codec.encode(
+            RSPDefinitions.ConfigureISDPRequest, {'dpProprietaryData': {'dpOid': self.smdp_oid}}
+        )
+        return {
+            'initialiseSecureChannelRequest': self.initialise_secure_channel_request(sign),
+            'firstSequenceOf87': [self.scp.wrap('87', configure_isdp)],
+            'sequenceOf88': [
+                self.scp.wrap('88', segment, encrypt=False)
+                for segment in self._segments(profile_metadata, self.METADATA_SEGMENT_SIZE)
+            ],
+            'sequenceOf86': [
+                self.scp.wrap('86', segment) for segment in self._segments(upp, self.SEGMENT_SIZE)
+            ],
+        }
@@ -0,0 +1,162 @@
+import hashlib
+from datetime import datetime, timezone
+
+from ecdsa import VerifyingKey, NIST256p, BRAINPOOLP256r1, BadSignatureError
+from ecdsa.util import sigdecode_der, sigdecode_string
+from pycrate_core.utils import PycrateErr
+
+from api.codec import Asn1Codec
+from api.exceptions import InvalidCertificateError
+from api.rsp_22_v3 import PKIX1Explicit88
+from api.tlv_helper import TlvHelper
+
+
+class Certificate:
+    """
+        X.509 certificate of the eSIM PKI (CERT.CI.ECDSA, CERT.EUM.ECDSA, CERT.EUICC.ECDSA, CERT.DPauth.ECDSA ...)
+        decoded with PKIX1Explicit88.Certificate.
+
+        Certificates are signed with ecdsa-with-SHA256 (DER encoded ECDSA-Sig-Value), while the RSP signatures
+        (serverSignature1, euiccSignature1 ...) use the plain r || s format. A malformed certificate or a
+        public key on an unsupported curve raises InvalidCertificateError.
+    """
+    CURVES = {
+        bytes.fromhex('2A8648CE3D030107'): NIST256p,
+        bytes.fromhex('2B2403030208010107'): BRAINPOOLP256r1,
+    }
+    SUBJECT_KEY_IDENTIFIER = (2, 5, 29, 14)
+    AUTHORITY_KEY_IDENTIFIER = (2, 5, 29, 35)
+    SERIAL_NUMBER = (2, 5, 4, 5)
+
+    def __init__(self, der):
+        self.der = bytes(der)
+        try:
+            self.value = Asn1Codec.decode(PKIX1Explicit88.Certificate, self.der)
+
+            _, value_offset, _ = TlvHelper.read_tlv(self.der)
+            _, _, tbs_end = TlvHelper.read_tlv(self.der, value_offset)
+            self.tbs_der = self.der[value_offset:tbs_end]
+
+            tbs = self.value['tbsCertificate']
+            public_key_info = tbs['subjectPublicKeyInfo']
+            self.curve = self.CURVES.get(public_key_info['algorithm']['parameters'][1])
+            self.public_key = self._bit_string(public_key_info['subjectPublicKey'])
+            self.signature = self._bit_string(self.value['signature'])
+            self.not_before = self._time(tbs['validity']['notBefore'])
+            self.not_after = self._time(tbs['validity']['notAfter'])
+            self.extensions = {
+                extension['extnID']: extension['extnValue'] for extension in tbs.get('extensions', [])
+            }
+        except (PycrateErr, KeyError, IndexError, TypeError, ValueError) as error:
+            raise InvalidCertificateError('malformed certificate') from error
+        if self.curve is None:
+            raise InvalidCertificateError('unsupported curve')
+
+    @classmethod
+    def from_value(cls, value):
+        try:
+            der = Asn1Codec.encode(PKIX1Explicit88.Certificate, value)
+        except PycrateErr as error:
+            raise InvalidCertificateError('malformed certificate') from error
+        return cls(der)
+
+    @property
+    def fingerprint(self):
+        return hashlib.sha256(self.der).digest()
+
+    @property
+    def serial_number(self):
+        return self.value['tbsCertificate']['serialNumber']
+
+    @property
+    def subject_key_identifier(self):
+        extension = self.extensions.get(self.SUBJECT_KEY_IDENTIFIER)
+        if extension is None:
+            return None
+        _, value_offset, end = TlvHelper.read_tlv(extension)
+        return extension[value_offset:end]
+
+    @property
+    def authority_key_identifier(self):
+        extension = self.extensions.get(self.AUTHORITY_KEY_IDENTIFIER)
+        if extension is None:
+            return None
+        _, value_offset, _ = TlvHelper.read_tlv(extension)
+        _, key_identifier_offset, end = TlvHelper.read_tlv(extension, value_offset)
+        return extension[key_identifier_offset:end]
+
+    @property
+    def eid(self):
+        """
+            The EID is carried in the serialNumber attribute of the CERT.EUICC.ECDSA subject.
+        """
+        for relative_name in self.value['tbsCertificate']['subject'][1]:
+            for attribute in relative_name:
+                if attribute['type'] == self.SERIAL_NUMBER:
+                    return attribute['value'][1].decode()
+        return None
+
+    @staticmethod
+    def _bit_string(value):
+        integer, bit_length = value
+        return integer.to_bytes(bit_length // 8, 'big')
+
+    @staticmethod
+    def _time(value):
+        kind, (year, month, day, hour, minute, second, _) = value
+        year = int(year)
+        if kind == 'utcTime':
+            year += 2000 if year < 50 else 1900
+        return datetime(year, int(month), int(day), int(hour), int(minute), int(second or 0), tzinfo=timezone.utc)
+
+    def is_valid_at(self, moment=None):
+        moment = moment or datetime.now(timezone.utc)
+        return self.not_before <= moment <= self.not_after
+
+    def verifying_key(self):
+        return VerifyingKey.from_string(self.public_key, curve=self.curve, hashfunc=hashlib.sha256)
+
+    def verify(self, signature, data):
+        """
+            Verify an RSP signature (r || s) computed with the private key of this certificate.
+        """
+        try:
+            return self.verifying_key().verify(signature, data, sigdecode=sigdecode_string)
+        except (BadSignatureError, ValueError):
+            return False
+
+    def issued(self, certificate):
+        """
+            Verify that certificate is signed by the private key of this certificate.
+        """
+        try:
+            return self.verifying_key().verify(certificate.signature, certificate.tbs_der, sigdecode=sigdecode_der)
+        except (BadSignatureError, ValueError):
+            return False
+
+
+class CertificateRevocationList:
+    """
+        CRL published by the eSIM CA (PKIX1Explicit88.CertificateList), listing the serial numbers of the
+        revoked EUM and SM-DP+ certificates. Signed like a certificate, so Certificate.issued() verifies it.
+        A malformed CRL raises InvalidCertificateError.
+    """
+
+    def __init__(self, der):
+        self.der = bytes(der)
+        try:
+            self.value = Asn1Codec.decode(PKIX1Explicit88.CertificateList, self.der)
+
+            _, value_offset, _ = TlvHelper.read_tlv(self.der)
+            _, _, tbs_end = TlvHelper.read_tlv(self.der, value_offset)
+            self.tbs_der = self.der[value_offset:tbs_end]
+
+            tbs = self.value['tbsCertList']
+            self.signature = Certificate._bit_string(self.value['signature'])
+            self.this_update = Certificate._time(tbs['thisUpdate'])
+            self.next_update = Certificate._time(tbs['nextUpdate']) if 'nextUpdate' in tbs else None
+            self.revoked_serial_numbers = frozenset(
+                revoked['userCertificate'] for revoked in tbs.get('revokedCertificates', [])
+            )
+        except (PycrateErr, KeyError, IndexError, TypeError, ValueError) as error:
+            raise InvalidCertificateError('malformed CRL') from error
@@ -0,0 +1,121 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from api.certificate import CertificateRevocationList
+from api.exceptions import InvalidCertificateError
+
+logger = logging.getLogger(__name__)
+
+
+class ChainVerificationCache:
+    """
+        Memoizes the successful CERT.EUM.ECDSA -> CERT.CI.ECDSA verifications, keyed by the SHA-256 of both
+        certificates, so that authenticateClient only verifies the eUICC certificate with the EUM public key.
+
+        An entry expires after ttl seconds or at the end of the EUM certificate validity, whichever comes first,
+        and is dropped as soon as a CRL of the CI revokes the EUM certificate. The CRL file (when configured)
+        is reloaded whenever it changes on disk, checked at most every crl_check_interval seconds. A CRL which
+        cannot be read, is malformed or is not signed by the CI is logged and ignored, the revocations loaded
+        before staying in force, and is read again at the next check. A CRL past its nextUpdate stays in force
+        as well, a warning being logged at every check until a newer one is published.
+    """
+    MAX_ENTRIES = 1024
+    TTL = 3600
+    CRL_CHECK_INTERVAL = 60
+
+    def __init__(self, max_entries=None, ttl=None, crl_path=None, crl_check_interval=None, clock=time.time):
+        self.max_entries = max_entries or self.MAX_ENTRIES
+        self.ttl = ttl or self.TTL
+        self.crl_path = Path(crl_path) if crl_path else None
+        self.crl_check_interval = crl_check_interval or self.CRL_CHECK_INTERVAL
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._revoked = {}
+        self._crl_mtime = None
+        self._crl_next_update = None
+        self._next_crl_check = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def is_verified(self, ci_certificate, eum_certificate):
+        self.refresh_crl(ci_certificate)
+        key = (ci_certificate.fingerprint, eum_certificate.fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False
+
+    def is_revoked(self, ci_certificate, certificate):
+        self.refresh_crl(ci_certificate)
+        return certificate.serial_number in self._revoked.get(ci_certificate.fingerprint, ())
+
+    def add(self, ci_certificate, eum_certificate):
+        expires_at = min(self.clock() + self.ttl, eum_certificate.not_after.timestamp())
+        key = (ci_certificate.fingerprint, eum_certificate.fingerprint)
+        with self._lock:
+            self._entries[key] = (expires_at, eum_certificate.serial_number)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def apply_crl(self, ci_certificate, crl):
+        """
+            Record the serial numbers revoked by a CRL issued by ci_certificate and drop the cached chains
+            of the revoked EUM certificates. Returns False (and changes nothing) when the CRL signature does
+            not verify with the CI public key.
+        """
+        if not ci_certificate.issued(crl):
+            return False
+        revoked = crl.revoked_serial_numbers
+        with self._lock:
+            self._revoked[ci_certificate.fingerprint] = revoked
+            for key in [
+                key for key, (_, serial_number) in self._entries.items()
+                if key[0] == ci_certificate.fingerprint and serial_number in revoked
+            ]:
+                del self._entries[key]
+        return True
+
+    def refresh_crl(self, ci_certificate):
+        now = self.clock()
+        if self.crl_path is None or now < self._next_crl_check:
+            return
+        self._next_crl_check = now + self.crl_check_interval
+        try:
+            mtime = os.stat(self.crl_path).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime != self._crl_mtime:
+            self.load_crl(ci_certificate, mtime)
+        if self._crl_next_update is not None and self._crl_next_update <= now:
+            logger.warning('CRL %s is past its nextUpdate, kept until a newer one is published', self.crl_path)
+
+    def load_crl(self, ci_certificate, mtime):
+        try:
+            crl = CertificateRevocationList(self.crl_path.read_bytes())
+        except (OSError, InvalidCertificateError):
+            logger.exception('CRL %s not loaded, the previous revocations are kept', self.crl_path)
+            return
+        if not self.apply_crl(ci_certificate, crl):
+            logger.warning('CRL %s not signed by the CI, the previous revocations are kept', self.crl_path)
+            return
+        self._crl_mtime = mtime
+        self._crl_next_update = crl.next_update.timestamp() if crl.next_update is not None else None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,22 @@
+import threading
+
+
+class Asn1Codec:
+    """
+        The pycrate objects of rsp_22_v3 are module level singletons which keep the last decoded / encoded
+        value, and constructed types share their component objects. Every DER conversion done from the
+        ES9+ worker threads goes through this lock so two sessions never interleave on the same object.
+    """
+    lock = threading.Lock()
+
+    @classmethod
+    def decode(cls, asn1_object, der):
+        with cls.lock:
+            asn1_object.from_der(der)
+            return asn1_object.get_val()
+
+    @classmethod
+    def encode(cls, asn1_object, value):
+        with cls.lock:
+            asn1_object.set_val(value)
+            return asn1_object.to_der()
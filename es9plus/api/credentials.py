@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from django.conf import settings
+
+from api.certificate import Certificate
+from api.signing import PrecomputedSigningKey
+
+
+class SmdpCredentials:
+    """
+        Certificates and private keys of the SM-DP+ (CERT.DPauth.ECDSA, SK.DPauth.ECDSA, CERT.DPpb.ECDSA,
+        SK.DPpb.ECDSA) and certificate of the eSIM CA (CERT.CI.ECDSA), loaded once per process from the paths
+        configured in settings.
+    """
+    _instance = None
+
+    def __init__(self):
+        self.ci_certificate = Certificate(Path(settings.CERT_CI_ECDSA).read_bytes())
+        self.dp_auth_certificate = Certificate(Path(settings.CERT_DPAUTH_ECDSA).read_bytes())
+        self.dp_pb_certificate = Certificate(Path(settings.CERT_DPPB_ECDSA).read_bytes())
+        self.dp_auth_key = PrecomputedSigningKey.from_pem(settings.SK_DPAUTH_ECDSA, settings.ES9PLUS_SIGNING_NONCES)
+        self.dp_pb_key = PrecomputedSigningKey.from_pem(settings.SK_DPPB_ECDSA, settings.ES9PLUS_SIGNING_NONCES)
+        self.smdp_oid = tuple(int(arc) for arc in settings.SMDP_OID.split('.'))
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def sign_dp_auth(self, data):
+        return self.dp_auth_key.sign(data)
+
+    def sign_dp_pb(self, data):
+        return self.dp_pb_key.sign(data)
@@ -0,0 +1,139 @@
+import os
+
+from api.codec import Asn1Codec
+from api.tlv_helper import TlvHelper
+
+
+class Slot:
+    """
+        Variable field of a DerTemplate, rendered with the tag found in the template:
+            .   VALUE: contents of a primitive (OCTET STRING ...) field,
+            .   ENCODED: DER of the component type (e.g. a StoreMetadataRequest stored as DER), its tag is
+                replaced by the tag of the field when they differ,
+            .   ITEMS: SEQUENCE OF, a list with the contents of the items.
+    """
+    VALUE = 'value'
+    ENCODED = 'encoded'
+    ITEMS = 'items'
+
+    def __init__(self, name, kind, tag, item_tag=None):
+        self.name = name
+        self.kind = kind
+        self.tag = tag
+        self.item_tag = item_tag
+
+    def render(self, value):
+        if self.kind == self.ENCODED:
+            tag, value_offset, end = TlvHelper.read_tlv(value)
+            if tag == self.tag:
+                return value
+            value = value[value_offset:end]
+        elif self.kind == self.ITEMS:
+            value = b''.join(self.item_tag + TlvHelper.encode_length(len(item)) + item for item in value)
+        return self.tag + TlvHelper.encode_length(len(value)) + value
+
+
+class DerTemplate:
+    """
+        DER encoder for a response whose skeleton is fixed (SM-DP+ certificate, address, tags) with a few
+        variable fields.
+
+        The template is compiled once from the RSPDefinitions type: a sample value, built by sample(slot)
+        with a random marker in place of each variable field, is encoded with pycrate and its TLVs are split
+        into static bytes and slots. render() then only re-encodes the lengths of the TLVs enclosing a slot.
+
+        slot(name, size=16): marker for a VALUE field (size matching the size constraint of the field),
+        slot(name, encoded=(asn1_object, value)): a valid value for an ENCODED field,
+        slot(name, items=True, size=16): a one item SEQUENCE OF.
+    """
+
+    def __init__(self, asn1_object, sample):
+        self._markers = {}
+        self.parts = self._compile(Asn1Codec.encode(asn1_object, sample(self._slot)))
+        missing = {name for name, _ in self._markers.values()} - set(self._slot_names(self.parts))
+        if missing:
+            raise ValueError('slots not found in the template: {}'.format(', '.join(sorted(missing))))
+
+    def _slot(self, name, size=16, encoded=None, items=False):
+        for marker, (slot_name, _) in self._markers.items():
+            if slot_name == name:
+                break
+        else:
+            if encoded is not None:
+                asn1_object, value = encoded
+                der = Asn1Codec.encode(asn1_object, value)
+                _, value_offset, end = TlvHelper.read_tlv(der)
+                marker, kind = der[value_offset:end], Slot.ENCODED
+            else:
+                marker, kind = os.urandom(size), Slot.ITEMS if items else Slot.VALUE
+            self._markers[marker] = (name, kind)
+        if encoded is not None:
+            return encoded[1]
+        return [marker] if items else marker
+
+    def _compile(self, der, start=0, end=None):
+        end = len(der) if end is None else end
+        parts = []
+        offset = start
+        while offset < end:
+            tag, value_offset, tlv_end = TlvHelper.read_tlv(der, offset)
+            content = der[value_offset:tlv_end]
+            slot = self._markers.get(content)
+            if slot is not None and slot[1] != Slot.ITEMS:
+                parts.append(Slot(slot[0], slot[1], tag))
+            elif tag[0] & 0x20:
+                children = self._compile(der, value_offset, tlv_end)
+                items = self._items_slot(tag, der, value_offset, tlv_end)
+                if items is not None:
+                    parts.append(items)
+                elif any(not isinstance(child, bytes) for child in children):
+                    parts.append((tag, children))
+                else:
+                    parts.append(der[offset:tlv_end])
+            else:
+                parts.append(der[offset:tlv_end])
+            offset = tlv_end
+        return self._merge(parts)
+
+    def _items_slot(self, tag, der, value_offset, end):
+        if value_offset == end:
+            return None
+        item_tag, item_value_offset, item_end = TlvHelper.read_tlv(der, value_offset)
+        slot = self._markers.get(der[item_value_offset:item_end])
+        if item_end != end or slot is None or slot[1] != Slot.ITEMS:
+            return None
+        return Slot(slot[0], Slot.ITEMS, tag, item_tag)
+
+    @staticmethod
+    def _merge(parts):
+        merged = []
+        for part in parts:
+            if isinstance(part, bytes) and merged and isinstance(merged[-1], bytes):
+                merged[-1] += part
+            else:
+                merged.append(part)
+        return merged
+
+    @classmethod
+    def _slot_names(cls, parts):
+        for part in parts:
+            if isinstance(part, Slot):
+                yield part.name
+            elif isinstance(part, tuple):
+                yield from cls._slot_names(part[1])
+
+    def _render(self, parts, values):
+        chunks = []
+        for part in parts:
+            if isinstance(part, bytes):
+                chunks.append(part)
+            elif isinstance(part, Slot):
+                chunks.append(part.render(values[part.name]))
+            else:
+                tag, children = part
+                content = self._render(children, values)
+                chunks.append(tag + TlvHelper.encode_length(len(content)) + content)
+        return b''.join(chunks)
+
+    def render(self, **values):
+        return self._render(self.parts, values)
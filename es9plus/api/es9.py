@@ -0,0 +1,762 @@
+import logging
+import os
+
+from django.conf import settings
+from django.db.models import Q
+from pycrate_asn1rt.err import ASN1Err
+
+from api.bpp import BoundProfilePackageBuilder
+from api.certificate import Certificate
+from api.chain_cache import ChainVerificationCache
+from api.codec import Asn1Codec
+from api.credentials import SmdpCredentials
+from api.der_template import DerTemplate
+from api.exceptions import Es9PlusFunctionError, InvalidCertificateError
+from api.models import DownloadOrder, DownloadOrderState, HandleNotifyState, Profile, RpmOrder, RpmOrderState
+from api.notifications import Ingestion, NotificationIngestor, NotificationPoint, OperatorNotifier, RowUpdate
+from api.rsp_22_v3 import RSPDefinitions
+from api.tlv_helper import TlvHelper
+from api.session_store import RspSession, SessionStore, SqliteSharedStore
+from api.verification import SignatureCheck, SignatureVerificationService
+
+logger = logging.getLogger(__name__)
+
+
+class Es9PlusFunction:
+    """
+        ES9+ function over the ASN.1 binding: the request body is the DER of REQUEST, the response body the
+        DER of RESPONSE, a function error is returned as the ERROR alternative of the RESPONSE CHOICE.
+
+        handle() is blocking (DER decoding, crypto, database) and is run in the ES9+ worker pool.
+
+        The successful responses are rendered from a DerTemplate of RESPONSE compiled from sample(), the
+        error responses are encoded once per code.
+
+        Each signed structure is serialized once: the DER signed by the SM-DP+ (serverSigned1, smdpSigned2)
+        is embedded as is in the response, the signatures of the eUICC are verified over the DER of the
+        signed structure taken from the request body (process() receives it along with the decoded request).
+    """
+    REQUEST = None
+    RESPONSE = None
+    ERROR = None
+
+    INVALID_INPUT_DATA = 124
+    FUNCTION_PROVIDER_BUSY = 126
+    UNDEFINED_ERROR = 127
+
+    sessions = SessionStore(
+        SqliteSharedStore(settings.ES9PLUS_SESSION_SHARED_DB),
+        settings.ES9PLUS_SESSION_CACHE_SIZE, settings.ES9PLUS_SESSION_TTL
+    )
+    verifier = SignatureVerificationService(
+        settings.ES9PLUS_VERIFY_PROCESSES, settings.ES9PLUS_VERIFY_BATCH_SIZE, settings.ES9PLUS_VERIFY_BATCH_DELAY
+    )
+
+    _template = None
+    _errors = {}
+
+    @classmethod
+    def sample(cls, slot):
+        raise NotImplementedError
+
+    @classmethod
+    def template(cls):
+        if cls._template is None:
+            cls._template = DerTemplate(cls.RESPONSE, cls.sample)
+        return cls._template
+
+    @classmethod
+    def error(cls, code):
+        error = cls._errors.get((cls, code))
+        if error is None:
+            error = cls._errors[(cls, code)] = Asn1Codec.encode(cls.RESPONSE, (cls.ERROR, code))
+        return error
+
+    @classmethod
+    def busy(cls):
+        return cls.error(cls.FUNCTION_PROVIDER_BUSY)
+
+    @classmethod
+    def handle(cls, body):
+        try:
+            request = Asn1Codec.decode(cls.REQUEST, body)
+        except ASN1Err:
+            return cls.error(cls.INVALID_INPUT_DATA)
+        try:
+            return cls.process(request, body)
+        except Es9PlusFunctionError as error:
+            return cls.error(error.code)
+
+    @classmethod
+    def process(cls, request, der):
+        raise NotImplementedError
+
+    @classmethod
+    def get_session(cls, transaction_id, error_code, require=None):
+        session = cls.sessions.get(transaction_id, require)
+        if session is None:
+            raise Es9PlusFunctionError(error_code)
+        return session
+
+    @staticmethod
+    def euicc_certificate(session):
+        return Certificate(session.euicc_certificate)
+
+    @classmethod
+    def verify_euicc_signature(cls, session, signature, data):
+        return cls.verifier.verify(SignatureCheck.rsp(cls.euicc_certificate(session), signature, data))
+
+
+class InitiateAuthentication(Es9PlusFunction):
+    """
+        On reception of this function call, the SM-DP+ SHALL:
+        1.  Verify that the SM-DP+ address matches its own address, otherwise return invalidDpAddress.
+        2.  Verify that it supports one of the eSIM CA RootCA Public Key Identifiers of euiccInfo1, otherwise
+            return ciPKIdNotSupported.
+        3.  Generate a TransactionID and a serverChallenge, build serverSigned1 and sign it with SK.DPauth.ECDSA.
+        4.  Return the serverSigned1, serverSignature1, the CI PKID to be used and CERT.DPauth.ECDSA.
+    """
+    REQUEST = RSPDefinitions.InitiateAuthenticationRequest
+    RESPONSE = RSPDefinitions.InitiateAuthenticationResponse
+    ERROR = 'initiateAuthenticationError'
+
+    INVALID_DP_ADDRESS = 1
+    CI_PKID_NOT_SUPPORTED = 3
+
+    _server_signed1_template = None
+
+    @classmethod
+    def server_signed1(cls, transaction_id, euicc_challenge, server_challenge):
+        return {
+            'transactionId': transaction_id,
+            'euiccChallenge': euicc_challenge,
+            'serverAddress': settings.SMDP_ADDRESS,
+            'serverChallenge': server_challenge,
+        }
+
+    @classmethod
+    def server_signed1_template(cls):
+        if cls._server_signed1_template is None:
+            cls._server_signed1_template = DerTemplate(
+                RSPDefinitions.ServerSigned1,
+                lambda slot: cls.server_signed1(slot('transactionId'), slot('euiccChallenge'), slot('serverChallenge'))
+            )
+        return cls._server_signed1_template
+
+    @classmethod
+    def sample(cls, slot):
+        credentials = SmdpCredentials.get()
+        server_signed1 = cls.server_signed1(bytes(16), bytes(16), bytes(16))
+        return ('initiateAuthenticationOk', {
+            'transactionId': slot('transactionId'),
+            'serverSigned1': slot('serverSigned1', encoded=(RSPDefinitions.ServerSigned1, server_signed1)),
+            'serverSignature1': slot('serverSignature1', size=64),
+            'euiccCiPKIdToBeUsed': credentials.ci_certificate.subject_key_identifier,
+            'serverCertificate': credentials.dp_auth_certificate.value,
+        })
+
+    @classmethod
+    def process(cls, request, der):
+        if request['smdpAddress'] != settings.SMDP_ADDRESS:
+            raise Es9PlusFunctionError(cls.INVALID_DP_ADDRESS)
+
+        credentials = SmdpCredentials.get()
+        ci_pkid = credentials.ci_certificate.subject_key_identifier
+        if ci_pkid not in request['euiccInfo1']['euiccCiPKIdListForVerification']:
+            raise Es9PlusFunctionError(cls.CI_PKID_NOT_SUPPORTED)
+
+        transaction_id = os.urandom(16)
+        server_challenge = os.urandom(16)
+        server_signed1 = cls.server_signed1_template().render(
+            transactionId=transaction_id, euiccChallenge=request['euiccChallenge'], serverChallenge=server_challenge
+        )
+
+        cls.sessions.put(RspSession(transaction_id, request['euiccChallenge'], server_challenge))
+        return cls.template().render(
+            transactionId=transaction_id,
+            serverSigned1=server_signed1,
+            serverSignature1=credentials.sign_dp_auth(server_signed1),
+        )
+
+
+class AuthenticateClient(Es9PlusFunction):
+    """
+        On reception of this function call, the SM-DP+ SHALL:
+        1.  Verify that the transactionId is known and that it matches the one of euiccSigned1.
+        2.  Verify the EUM certificate (CERT.EUM.ECDSA) with the CI public key and the eUICC certificate
+            (CERT.EUICC.ECDSA) with the EUM public key, including their validity period.
+        3.  Verify euiccSignature1 over euiccSigned1 with the eUICC public key and that serverChallenge and
+            serverAddress match the ones of the RSP session.
+        4.  Identify the pending download order from the MatchingID (or from the EID when there is none).
+        5.  Generate smdpSigned2, sign it with SK.DPpb.ECDSA and return it with the Profile Metadata and
+            CERT.DPpb.ECDSA.
+        Without download order, the pending RPM order of the eUICC is delivered instead: its RpmPackage, stored
+        as DER by ES2+.RpmOrder, is placed in smdpSigned3 with the transactionId and signed with SK.DPpb.ECDSA
+        (AuthenticateClientOkRpm), only the TLV lengths being encoded.
+    """
+    REQUEST = RSPDefinitions.AuthenticateClientRequest
+    RESPONSE = RSPDefinitions.AuthenticateClientResponseEs9
+    ERROR = 'authenticateClientError'
+
+    EUM_CERTIFICATE_INVALID = 1
+    EUM_CERTIFICATE_EXPIRED = 2
+    EUICC_CERTIFICATE_INVALID = 3
+    EUICC_CERTIFICATE_EXPIRED = 4
+    EUICC_SIGNATURE_INVALID = 5
+    MATCHING_ID_REFUSED = 6
+    EID_MISMATCH = 7
+    NO_ELIGIBLE_PROFILE = 8
+    INVALID_TRANSACTION_ID = 10
+
+    EUICC_SIGNED1 = ('BF3B', 'BF38', 'A0', '30')
+
+    chain_cache = ChainVerificationCache(
+        ttl=settings.ES9PLUS_CHAIN_CACHE_TTL, crl_path=settings.CRL_CI_ECDSA
+    )
+    _smdp_signed2_template = None
+    _smdp_signed3_template = None
+    _rpm_template = None
+
+    RPM_PACKAGE_SAMPLE = [{'rpmCommandDetails': ('enable', {'iccid': bytes(10)})}]
+
+    @classmethod
+    def smdp_signed2_template(cls):
+        if cls._smdp_signed2_template is None:
+            cls._smdp_signed2_template = DerTemplate(
+                RSPDefinitions.SmdpSigned2, lambda slot: {'transactionId': slot('transactionId'), 'ccRequiredFlag': False}
+            )
+        return cls._smdp_signed2_template
+
+    @classmethod
+    def smdp_signed3_template(cls):
+        if cls._smdp_signed3_template is None:
+            cls._smdp_signed3_template = DerTemplate(RSPDefinitions.SmdpSigned3, lambda slot: {
+                'transactionId': slot('transactionId'),
+                'rpmPackage': slot('rpmPackage', encoded=(RSPDefinitions.RpmPackage, cls.RPM_PACKAGE_SAMPLE)),
+            })
+        return cls._smdp_signed3_template
+
+    @classmethod
+    def rpm_template(cls):
+        if cls._rpm_template is None:
+            cls._rpm_template = DerTemplate(cls.RESPONSE, lambda slot: ('authenticateClientOkRpm', {
+                'transactionId': slot('transactionId'),
+                'smdpSigned3': slot('smdpSigned3', encoded=(
+                    RSPDefinitions.SmdpSigned3, {'transactionId': bytes(16), 'rpmPackage': cls.RPM_PACKAGE_SAMPLE}
+                )),
+                'smdpSignature3': slot('smdpSignature3', size=64),
+            }))
+        return cls._rpm_template
+
+    @classmethod
+    def sample(cls, slot):
+        profile_metadata = {'iccid': bytes(10), 'serviceProviderName': '', 'profileName': ''}
+        return ('authenticateClientOk', {
+            'transactionId': slot('transactionId'),
+            'profileMetadata': slot(
+                'profileMetadata', encoded=(RSPDefinitions.StoreMetadataRequest, profile_metadata)
+            ),
+            'smdpSigned2': slot('smdpSigned2', encoded=(
+                RSPDefinitions.SmdpSigned2, {'transactionId': bytes(16), 'ccRequiredFlag': False}
+            )),
+            'smdpSignature2': slot('smdpSignature2', size=64),
+            'smdpCertificate': SmdpCredentials.get().dp_pb_certificate.value,
+        })
+
+    @classmethod
+    def verify_signatures(cls, eum_certificate, euicc_certificate, euicc_signature1, euicc_signed1_der):
+        """
+            The EUM -> CI part of the chain is shared by all the eUICCs of an EUM and verified once per
+            chain_cache entry, the eUICC certificate and euiccSignature1 are verified on every call.
+            The signature checks are submitted together to the verifier and reported in the order of the
+            specification.
+        """
+        ci_certificate = SmdpCredentials.get().ci_certificate
+        checks = []
+        chain_verified = cls.chain_cache.is_verified(ci_certificate, eum_certificate)
+        if not chain_verified:
+            if not eum_certificate.is_valid_at():
+                raise Es9PlusFunctionError(cls.EUM_CERTIFICATE_EXPIRED)
+            if cls.chain_cache.is_revoked(ci_certificate, eum_certificate):
+                raise Es9PlusFunctionError(cls.EUM_CERTIFICATE_INVALID)
+            checks.append((SignatureCheck.certificate(ci_certificate, eum_certificate), cls.EUM_CERTIFICATE_INVALID))
+        if not euicc_certificate.is_valid_at():
+            raise Es9PlusFunctionError(cls.EUICC_CERTIFICATE_EXPIRED)
+        checks.append((SignatureCheck.certificate(eum_certificate, euicc_certificate), cls.EUICC_CERTIFICATE_INVALID))
+        checks.append((
+            SignatureCheck.rsp(euicc_certificate, euicc_signature1, euicc_signed1_der), cls.EUICC_SIGNATURE_INVALID
+        ))
+
+        results = cls.verifier.verify_all([check for check, _ in checks])
+        for (_, error_code), valid in zip(checks, results):
+            if not valid:
+                raise Es9PlusFunctionError(error_code)
+        if not chain_verified:
+            cls.chain_cache.add(ci_certificate, eum_certificate)
+
+    @staticmethod
+    def certificate(value, error_code):
+        try:
+            return Certificate.from_value(value)
+        except InvalidCertificateError:
+            raise Es9PlusFunctionError(error_code)
+
+    @classmethod
+    def get_download_order(cls, matching_id, eid):
+        orders = DownloadOrder.objects.filter(state=DownloadOrderState.RELEASED)
+        if not matching_id:
+            order = orders.filter(eid=eid).first()
+            if order is None:
+                raise Es9PlusFunctionError(cls.NO_ELIGIBLE_PROFILE)
+            return order
+
+        order = orders.filter(matching_id=matching_id).first()
+        if order is None:
+            raise Es9PlusFunctionError(cls.MATCHING_ID_REFUSED)
+        if order.eid and order.eid != eid:
+            raise Es9PlusFunctionError(cls.EID_MISMATCH)
+        return order
+
+    @staticmethod
+    def get_rpm_order(matching_id, eid):
+        orders = RpmOrder.objects.filter(state=RpmOrderState.RELEASED, eid=eid)
+        if matching_id:
+            orders = orders.filter(matching_id=matching_id)
+        return orders.only('pk', 'rpm_package').first()
+
+    @classmethod
+    def deliver_rpm_package(cls, session, rpm_order):
+        """
+            The AuthenticateClientOkRpm response delivering rpm_order, None when it is no longer RELEASED
+            (delivered meanwhile in a concurrent session).
+        """
+        transaction_id = session.transaction_id
+        if not RpmOrder.objects.filter(pk=rpm_order.pk, state=RpmOrderState.RELEASED).update(
+            state=RpmOrderState.DELIVERED, transaction_id=transaction_id, euicc_certificate=session.euicc_certificate
+        ):
+            return None
+        smdp_signed3 = cls.smdp_signed3_template().render(
+            transactionId=transaction_id, rpmPackage=bytes(rpm_order.rpm_package)
+        )
+        smdp_signature3 = SmdpCredentials.get().sign_dp_pb(smdp_signed3)
+
+        session.rpm_order_id = rpm_order.pk
+        cls.sessions.put(session)
+        return cls.rpm_template().render(
+            transactionId=transaction_id, smdpSigned3=smdp_signed3, smdpSignature3=smdp_signature3
+        )
+
+    @classmethod
+    def process(cls, request, der):
+        transaction_id = request['transactionId']
+        session = cls.get_session(transaction_id, cls.INVALID_TRANSACTION_ID)
+
+        response_type, response = request['authenticateServerResponse']
+        if response_type != 'authenticateResponseOk':
+            cls.sessions.delete(transaction_id)
+            raise Es9PlusFunctionError(cls.UNDEFINED_ERROR)
+
+        euicc_signed1 = response['euiccSigned1']
+        if euicc_signed1['transactionId'] != transaction_id:
+            raise Es9PlusFunctionError(cls.INVALID_TRANSACTION_ID)
+
+        eum_certificate = cls.certificate(response['nextCertInChain'], cls.EUM_CERTIFICATE_INVALID)
+        euicc_certificate = cls.certificate(response['euiccCertificate'], cls.EUICC_CERTIFICATE_INVALID)
+        euicc_signed1_der = TlvHelper.find_tlv(der, *cls.EUICC_SIGNED1)
+        cls.verify_signatures(eum_certificate, euicc_certificate, response['euiccSignature1'], euicc_signed1_der)
+        if not (
+            euicc_signed1['serverChallenge'] == session.server_challenge and
+            euicc_signed1['serverAddress'] == settings.SMDP_ADDRESS
+        ):
+            raise Es9PlusFunctionError(cls.EUICC_SIGNATURE_INVALID)
+
+        eid = euicc_certificate.eid
+        _, ctx_params = euicc_signed1['ctxParams1']
+        matching_id = ctx_params.get('matchingId')
+        try:
+            order = cls.get_download_order(matching_id, eid)
+        except Es9PlusFunctionError:
+            rpm_order = cls.get_rpm_order(matching_id, eid)
+            if rpm_order is None:
+                raise
+            session.eid = eid
+            session.euicc_certificate = euicc_certificate.der
+            response = cls.deliver_rpm_package(session, rpm_order)
+            if response is None:
+                raise
+            return response
+
+        credentials = SmdpCredentials.get()
+        smdp_signed2 = cls.smdp_signed2_template().render(transactionId=transaction_id)
+        smdp_signature2 = credentials.sign_dp_pb(smdp_signed2)
+
+        session.eid = eid
+        session.download_order_id = order.pk
+        session.euicc_certificate = euicc_certificate.der
+        session.smdp_signature2 = smdp_signature2
+        cls.sessions.put(session)
+        return cls.template().render(
+            transactionId=transaction_id,
+            profileMetadata=bytes(order.profile_metadata),
+            smdpSigned2=smdp_signed2,
+            smdpSignature2=smdp_signature2,
+        )
+
+
+class GetBoundProfilePackage(Es9PlusFunction):
+    """
+        On reception of this function call, the SM-DP+ SHALL:
+        1.  Verify that the transactionId is known and has been authenticated.
+        2.  Verify euiccSignature2 computed over euiccSigned2 and smdpSignature2 (including tag and length).
+        3.  Generate the Bound Profile Package with otPK.EUICC.ECKA and mark the download order as downloaded.
+    """
+    REQUEST = RSPDefinitions.GetBoundProfilePackageRequest
+    RESPONSE = RSPDefinitions.GetBoundProfilePackageResponse
+    ERROR = 'getBoundProfilePackageError'
+
+    EUICC_SIGNATURE_INVALID = 1
+    INVALID_TRANSACTION_ID = 95
+
+    EUICC_SIGNED2 = ('BF3A', 'BF21', 'A0', '30')
+
+    @classmethod
+    def sample(cls, slot):
+        initialise_secure_channel_request = BoundProfilePackageBuilder.initialise_secure_channel_request_value(
+            bytes(16), bytes(65), bytes(64)
+        )
+        return ('getBoundProfilePackageOk', {
+            'transactionId': slot('transactionId'),
+            'boundProfilePackage': {
+                'initialiseSecureChannelRequest': slot('initialiseSecureChannelRequest', encoded=(
+                    RSPDefinitions.InitialiseSecureChannelRequest, initialise_secure_channel_request
+                )),
+                'firstSequenceOf87': slot('firstSequenceOf87', items=True),
+                'sequenceOf88': slot('sequenceOf88', items=True),
+                'sequenceOf86': slot('sequenceOf86', items=True),
+            },
+        })
+
+    @classmethod
+    def process(cls, request, der):
+        transaction_id = request['transactionId']
+        session = cls.get_session(transaction_id, cls.INVALID_TRANSACTION_ID, 'download_order_id')
+        if session.download_order_id is None:
+            raise Es9PlusFunctionError(cls.INVALID_TRANSACTION_ID)
+
+        response_type, response = request['prepareDownloadResponse']
+        if response_type != 'downloadResponseOk':
+            cls.sessions.delete(transaction_id)
+            raise Es9PlusFunctionError(cls.UNDEFINED_ERROR)
+
+        euicc_signed2 = response['euiccSigned2']
+        euicc_certificate = cls.euicc_certificate(session)
+        signed_data = (
+            TlvHelper.find_tlv(der, *cls.EUICC_SIGNED2) +
+            b'\x5F\x37\x40' + session.smdp_signature2
+        )
+        if (
+            euicc_signed2['transactionId'] != transaction_id or
+            not cls.verifier.verify(SignatureCheck.rsp(euicc_certificate, response['euiccSignature2'], signed_data))
+        ):
+            raise Es9PlusFunctionError(cls.EUICC_SIGNATURE_INVALID)
+
+        credentials = SmdpCredentials.get()
+        order = DownloadOrder.objects.get(pk=session.download_order_id)
+        builder = BoundProfilePackageBuilder(
+            transaction_id, session.eid, euicc_signed2['euiccOtpk'], euicc_certificate.curve, credentials.smdp_oid
+        )
+        bound_profile_package = builder.build(
+            bytes(order.profile_metadata), bytes(order.upp), credentials.sign_dp_pb
+        )
+
+        order.eid = session.eid
+        order.state = DownloadOrderState.DOWNLOADED
+        order.transaction_id = transaction_id
+        order.euicc_certificate = session.euicc_certificate
+        order.save(update_fields=['eid', 'state', 'transaction_id', 'euicc_certificate'])
+        session.euicc_otpk = euicc_signed2['euiccOtpk']
+        cls.sessions.put(session)
+        return cls.template().render(transactionId=transaction_id, **bound_profile_package)
+
+
+class HandleNotification(Es9PlusFunction):
+    """
+        The LPAd delivers the pending notifications (ProfileInstallationResult, other signed notifications,
+        LoadRpmPackageResult). This function has no output data.
+
+        The notifications are queued to the NotificationIngestor and answered right away. Once decoded and
+        verified in its worker threads:
+            .   a ProfileInstallationResult (euiccSignPIR) completes the download order downloaded in its RSP
+                session (DownloadOrder.transaction_id) and marks the Profile installed,
+            .   an other signed notification (euiccNotificationSignature, eUICC and EUM certificates verified
+                as in AuthenticateClient) moves the Profile to the state of its profileManagementOperation,
+                when allowed from its current state (HandleNotifyState.SOURCES),
+            .   a LoadRpmPackageResultSigned (euiccSignRPR) is matched to the RPM order delivered in the
+                AuthenticateClientOkRpm of its RSP session (RpmOrder.transaction_id) and its result stored, the
+                Profile Metadata of the 'Update Metadata' commands executed successfully being stored as
+                prepared by es2plus,
+        in batched transactions, which also store the ES2+.HandleNotification calls to the Operator.
+        The results are matched to their orders in the database, the RSP session having possibly expired when the
+        eUICC delivers them; the notifications matching no order or not verified are logged and dropped.
+    """
+    REQUEST = RSPDefinitions.HandleNotification
+
+    PROFILE_INSTALLATION_RESULT_DATA = ('BF3D', 'A0', 'BF37', 'BF27')
+    LOAD_RPM_PACKAGE_RESULT_DATA = ('BF3D', 'A0', 'A1', 'A0')
+    TBS_OTHER_NOTIFICATION = ('BF3D', 'A0', '30', 'A0')
+
+    UPDATE_METADATA_OK = 0
+
+    # NotificationEvent bits of profileManagementOperation, by bit number
+    NOTIFICATION_EVENTS = (
+        HandleNotifyState.INSTALLED,
+        HandleNotifyState.ENABLED,
+        HandleNotifyState.DISABLED,
+        HandleNotifyState.DELETED,
+        HandleNotifyState.ENABLED,
+        HandleNotifyState.DISABLED,
+        HandleNotifyState.DELETED,
+    )
+
+    _ingestor = None
+
+    @classmethod
+    def ingestor(cls):
+        if cls._ingestor is None:
+            cls._ingestor = NotificationIngestor(
+                cls.ingest, settings.ES9PLUS_NOTIFICATION_WORKERS, settings.ES9PLUS_NOTIFICATION_MAX_PENDING,
+                settings.ES9PLUS_NOTIFICATION_BATCH_SIZE, settings.ES9PLUS_NOTIFICATION_BATCH_DELAY,
+                notifier=OperatorNotifier(
+                    settings.ES9PLUS_OPERATOR_NOTIFICATION_URL, settings.ES9PLUS_OPERATOR_NOTIFICATION_URLS,
+                    settings.ES9PLUS_OPERATOR_NOTIFICATION_RETRIES, settings.ES9PLUS_OPERATOR_NOTIFICATION_BACKOFF,
+                    settings.ES9PLUS_OPERATOR_NOTIFICATION_TIMEOUT, settings.ES9PLUS_OPERATOR_NOTIFICATION_CONCURRENCY,
+                    settings.ES9PLUS_OPERATOR_NOTIFICATION_BATCH_SIZE, settings.ES9PLUS_OPERATOR_NOTIFICATION_LEASE,
+                    settings.ES9PLUS_OPERATOR_NOTIFICATION_POLL_INTERVAL
+                )
+            )
+        return cls._ingestor
+
+    @classmethod
+    def handle(cls, body):
+        cls.ingestor().submit(body)
+        return None
+
+    @classmethod
+    def ingest(cls, body):
+        try:
+            request = Asn1Codec.decode(cls.REQUEST, body)
+        except ASN1Err:
+            return None
+        return cls.process(request, body)
+
+    @classmethod
+    def process(cls, request, der):
+        notification_type, notification = request['pendingNotification']
+        if notification_type == 'profileInstallationResult':
+            return cls.profile_installation_result(
+                notification, TlvHelper.find_tlv(der, *cls.PROFILE_INSTALLATION_RESULT_DATA)
+            )
+        if notification_type == 'otherSignedNotification':
+            return cls.other_signed_notification(notification, TlvHelper.find_tlv(der, *cls.TBS_OTHER_NOTIFICATION))
+        if notification_type == 'loadRpmPackageResultSigned':
+            return cls.load_rpm_package_result(notification, TlvHelper.find_tlv(der, *cls.LOAD_RPM_PACKAGE_RESULT_DATA))
+        return None
+
+    @staticmethod
+    def iccid_to_digits(iccid):
+        """
+            ICCID as printed: the nibbles of each byte are swapped, padded with 'F'.
+        """
+        return ''.join('{:X}{:X}'.format(byte & 0x0F, byte >> 4) for byte in iccid).rstrip('F')
+
+    @classmethod
+    def notification_state(cls, profile_management_operation):
+        value, length = profile_management_operation
+        for bit, state in enumerate(cls.NOTIFICATION_EVENTS[:length]):
+            if value >> (length - 1 - bit) & 1:
+                return state
+        return None
+
+    @classmethod
+    def profile_installation_result(cls, notification, result_data_der):
+        result_data = notification['profileInstallationResultData']
+        transaction_id = result_data['transactionId']
+        order = DownloadOrder.objects.filter(
+            transaction_id=transaction_id, state=DownloadOrderState.DOWNLOADED
+        ).values_list('pk', 'eid', 'iccid', 'euicc_certificate').first()
+        if order is None:
+            logger.warning('ProfileInstallationResult %s matching no downloaded order dropped', transaction_id.hex())
+            return None
+        order_id, eid, order_iccid, euicc_certificate = order
+
+        if not cls.verify_order_signature(euicc_certificate, notification['euiccSignPIR'], result_data_der):
+            logger.warning('ProfileInstallationResult %s not verified, dropped', transaction_id.hex())
+            return None
+        cls.sessions.delete(transaction_id)
+
+        result_type, _ = result_data['finalResult']
+        installed = result_type == 'successResult'
+        iccid = result_data['notificationMetadata'].get('iccid')
+        if iccid:
+            iccid = cls.iccid_to_digits(iccid)
+        else:
+            iccid = order_iccid
+
+        updates = [RowUpdate(DownloadOrder, 'pk', order_id, {
+            'state': DownloadOrderState.INSTALLED if installed else DownloadOrderState.ERROR
+        }, Q(state=DownloadOrderState.DOWNLOADED))]
+        if installed and iccid:
+            updates.append(RowUpdate(
+                Profile, 'iccid', iccid, {'handle_notify_state': HandleNotifyState.INSTALLED},
+                HandleNotifyState.allowed(HandleNotifyState.INSTALLED)
+            ))
+        return Ingestion(updates, [OperatorNotifier.event(
+            NotificationPoint.BPP_INSTALLATION, eid, iccid, installed, result_data_der
+        )])
+
+    @classmethod
+    def other_signed_notification(cls, notification, tbs_other_notification_der):
+        try:
+            eum_certificate = AuthenticateClient.certificate(
+                notification['nextCertInChain'], AuthenticateClient.EUM_CERTIFICATE_INVALID
+            )
+            euicc_certificate = AuthenticateClient.certificate(
+                notification['euiccCertificate'], AuthenticateClient.EUICC_CERTIFICATE_INVALID
+            )
+            AuthenticateClient.verify_signatures(
+                eum_certificate, euicc_certificate, notification['euiccNotificationSignature'],
+                tbs_other_notification_der
+            )
+        except Es9PlusFunctionError:
+            return None
+
+        metadata = notification['tbsOtherNotification']
+        state = cls.notification_state(metadata['profileManagementOperation'])
+        iccid = metadata.get('iccid')
+        if state is None or not iccid:
+            return None
+        iccid = cls.iccid_to_digits(iccid)
+        eid = euicc_certificate.eid
+        return Ingestion(
+            [RowUpdate(
+                Profile, 'iccid', iccid, {'handle_notify_state': state},
+                Q(linked_eid=eid) & HandleNotifyState.allowed(state)
+            )],
+            [OperatorNotifier.event(
+                NotificationPoint.PROFILE_STATE_CHANGE, eid, iccid, True, tbs_other_notification_der,
+                profileState=HandleNotifyState.label(state)
+            )]
+        )
+
+    @classmethod
+    def load_rpm_package_result(cls, notification, result_data_der):
+        result_data = notification['loadRpmPackageResultDataSigned']
+        transaction_id = result_data['transactionId']
+        order = RpmOrder.objects.filter(
+            transaction_id=transaction_id, state=RpmOrderState.DELIVERED
+        ).values_list('pk', 'eid', 'euicc_certificate').first()
+        if order is None:
+            logger.warning('LoadRpmPackageResult %s matching no delivered RPM order dropped', transaction_id.hex())
+            return None
+        order_id, eid, euicc_certificate = order
+
+        if not cls.verify_order_signature(euicc_certificate, notification['euiccSignRPR'], result_data_der):
+            logger.warning('LoadRpmPackageResult %s not verified, dropped', transaction_id.hex())
+            return None
+        cls.sessions.delete(transaction_id)
+
+        result_type, results = result_data['finalResult']
+        executed = result_type == 'rpmPackageExecutionResult'
+        updates = [RowUpdate(RpmOrder, 'pk', order_id, {
+            'state': RpmOrderState.EXECUTED if executed else RpmOrderState.ERROR,
+            'result': result_data_der,
+        }, Q(state=RpmOrderState.DELIVERED))]
+        if executed:
+            updates.extend(cls.metadata_updates(order_id, eid, results))
+        return Ingestion(updates, [OperatorNotifier.event(
+            NotificationPoint.RPM_PACKAGE_EXECUTION, eid, None, executed, result_data_der
+        )])
+
+    @classmethod
+    def verify_order_signature(cls, euicc_certificate, signature, data):
+        """
+            Verifies a result signed by the eUICC with the certificate (DER) stored on its order, False without one.
+        """
+        if euicc_certificate is None:
+            return False
+        return cls.verifier.verify(SignatureCheck.rsp(Certificate(bytes(euicc_certificate)), signature, data))
+
+    @classmethod
+    def metadata_updates(cls, rpm_order_id, eid, results):
+        """
+            Profile updates storing the RpmOrder.metadata_updates of the Profiles whose 'Update Metadata'
+            commands all succeeded (updateMetadataResult ok), results being the RpmCommandResults.
+        """
+        succeeded = {}
+        for result in results:
+            result_type, value = result['rpmCommandResultData']
+            if result_type == 'updateMetadataResult' and result.get('iccid'):
+                iccid = cls.iccid_to_digits(result['iccid'])
+                succeeded[iccid] = succeeded.get(iccid, True) and value == cls.UPDATE_METADATA_OK
+        if not any(succeeded.values()):
+            return []
+        metadata_updates = RpmOrder.objects.filter(pk=rpm_order_id).values_list('metadata_updates', flat=True).first()
+        updates = []
+        for iccid, update in (metadata_updates or {}).items():
+            if not succeeded.get(iccid):
+                continue
+            values = {'metadata': bytes.fromhex(update['metadata'])}
+            if 'profile_owner_oid' in update:
+                values['profile_owner_oid'] = update['profile_owner_oid']
+            updates.append(RowUpdate(Profile, 'iccid', iccid, values, Q(linked_eid=eid)))
+        return updates
+
+
+class CancelSession(Es9PlusFunction):
+    """
+        On reception of this function call, the SM-DP+ SHALL:
+        1.  Verify that the transactionId is known.
+        2.  If a CancelSessionResponseOk is provided, verify euiccCancelSessionSignature and that the smdpOid
+            is the one of the SM-DP+.
+        3.  Terminate the RSP session. A postponed or timed out download (or RPM order) keeps the order
+            available, any other reason puts it in error.
+    """
+    REQUEST = RSPDefinitions.CancelSessionRequestEs9
+    RESPONSE = RSPDefinitions.CancelSessionResponseEs9
+    ERROR = 'cancelSessionError'
+
+    INVALID_TRANSACTION_ID = 1
+    EUICC_SIGNATURE_INVALID = 2
+
+    EUICC_CANCEL_SESSION_SIGNED = ('BF41', 'A1', 'BF41', 'A0', '30')
+
+    POSTPONED = 1
+    TIMEOUT = 2
+
+    @classmethod
+    def process(cls, request, der):
+        transaction_id = request['transactionId']
+        session = cls.get_session(transaction_id, cls.INVALID_TRANSACTION_ID)
+
+        response_type, response = request['cancelSessionResponse']
+        if response_type == 'cancelSessionResponseOk':
+            signed = response['euiccCancelSessionSigned']
+            signed_der = TlvHelper.find_tlv(der, *cls.EUICC_CANCEL_SESSION_SIGNED)
+            if session.euicc_certificate is not None and not cls.verify_euicc_signature(
+                session, response['euiccCancelSessionSignature'], signed_der
+            ):
+                raise Es9PlusFunctionError(cls.EUICC_SIGNATURE_INVALID)
+            if signed['transactionId'] != transaction_id or signed['smdpOid'] != SmdpCredentials.get().smdp_oid:
+                raise Es9PlusFunctionError(cls.INVALID_INPUT_DATA)
+
+            if session.download_order_id is not None and signed['reason'] not in (cls.POSTPONED, cls.TIMEOUT):
+                DownloadOrder.objects.filter(pk=session.download_order_id).update(state=DownloadOrderState.ERROR)
+            if session.rpm_order_id is not None:
+                # a postponed or timed out RPM order is delivered again in the next session
+                RpmOrder.objects.filter(pk=session.rpm_order_id, state=RpmOrderState.DELIVERED).update(
+                    state=RpmOrderState.RELEASED if signed['reason'] in (cls.POSTPONED, cls.TIMEOUT)
+                    else RpmOrderState.ERROR
+                )
+
+        cls.sessions.delete(transaction_id)
+        return Asn1Codec.encode(cls.RESPONSE, ('cancelSessionOk', {}))
@@ -0,0 +1,21 @@
+class Es9PlusFunctionError(Exception):
+    """
+        Raised while processing an ES9+ function, code is the value of the error alternative of the
+        function response (e.g. authenticateClientError euiccSignatureInvalid(5)).
+    """
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+
+class FunctionProviderBusyException(Exception):
+    pass
+
+
+class InvalidCertificateError(ValueError):
+    """
+        Raised by api.certificate.Certificate for a DER which is not a certificate of the eSIM PKI: malformed
+        structure, or public key on a curve other than NIST P-256 and brainpoolP256r1, and by
+        api.certificate.CertificateRevocationList for a malformed CRL.
+    """
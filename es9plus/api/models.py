@@ -1,3 +1,133 @@
 from django.db import models
 
-# Create your models here.
+
+class DownloadOrderState:
+    RELEASED: str = 'Released'
+    DOWNLOADED: str = 'Downloaded'
+    INSTALLED: str = 'Installed'
+    ERROR: str = 'Error'
+
+    @classmethod
+    def as_list(cls):
+        return (
+            (value, name) for name, value in vars(cls).items() if name.isupper()
+        )
+
+
+class DownloadOrder(models.Model):
+    """
+        Profile download order prepared through ES2+ and consumed by the LPAd over ES9+.
+        profile_metadata holds the DER of the StoreMetadataRequest, upp the Unprotected Profile Package.
+        transaction_id and euicc_certificate (DER) are those of the RSP session the Bound Profile Package was
+        downloaded in, its ProfileInstallationResult being matched and verified with them.
+    """
+    eid = models.CharField(max_length=32, null=True, blank=True, db_index=True)
+    matching_id = models.CharField(max_length=64, unique=True)
+    iccid = models.CharField(max_length=20)
+    profile_metadata = models.BinaryField()
+    upp = models.BinaryField()
+    state = models.CharField(max_length=16, choices=DownloadOrderState.as_list(), default=DownloadOrderState.RELEASED)
+    transaction_id = models.BinaryField(null=True, db_index=True)
+    euicc_certificate = models.BinaryField(null=True)
+
+
+class RpmOrderState:
+    RELEASED: str = 'Released'
+    DELIVERED: str = 'Delivered'
+    EXECUTED: str = 'Executed'
+    ERROR: str = 'Error'
+
+    @classmethod
+    def as_list(cls):
+        return (
+            (value, name) for name, value in vars(cls).items() if name.isupper()
+        )
+
+
+class RpmOrder(models.Model):
+    """
+        RPM Package ordered through ES2+.RpmOrder (validated, DER RpmPackage) and delivered to the eUICC in the
+        AuthenticateClientOkRpm of ES9+.AuthenticateClient, its LoadRpmPackageResultSigned coming back later
+        through ES9+.HandleNotification (result, DER LoadRpmPackageResultDataSigned), when the metadata_updates
+        of its successful 'Update Metadata' commands are stored on the Profiles. The result is matched to the order
+        by transaction_id and verified with its euicc_certificate (DER), both stored when it is delivered.
+        The table (api_rpmorder) is shared with the RpmOrder model of es2plus, which releases the orders.
+    """
+    eid = models.CharField(max_length=32, db_index=True)
+    matching_id = models.CharField(max_length=64, unique=True)
+    rpm_package = models.BinaryField()
+    state = models.CharField(max_length=16, choices=RpmOrderState.as_list(), default=RpmOrderState.RELEASED)
+    transaction_id = models.BinaryField(null=True, db_index=True)
+    euicc_certificate = models.BinaryField(null=True)
+    result = models.BinaryField(null=True)
+    # {ICCID: {'metadata': hex DER StoreMetadataRequest, 'profile_owner_oid': OID, only when transferred}}
+    metadata_updates = models.JSONField(null=True)
+
+
+class HandleNotifyState:
+    """
+        State of a Profile, stored as a small integer (None: not installed yet), with the transitions of the
+        ProfileLifecycle of es2plus: SOURCES are the states a Profile can move to a state from, kept equal to
+        ProfileLifecycle.TRANSITIONS by the tests of both projects.
+    """
+    INSTALLED: int = 1
+    ENABLED: int = 2
+    DISABLED: int = 3
+    DELETED: int = 4
+
+    SOURCES = {
+        INSTALLED: (None, DELETED),
+        ENABLED: (INSTALLED, DISABLED),
+        DISABLED: (INSTALLED, ENABLED),
+        DELETED: (INSTALLED, ENABLED, DISABLED),
+    }
+
+    @classmethod
+    def as_list(cls):
+        return (
+            (value, name) for name, value in vars(cls).items() if name.isupper() and isinstance(value, int)
+        )
+
+    @classmethod
+    def label(cls, state):
+        return next(name.capitalize() for value, name in cls.as_list() if value == state)
+
+    @classmethod
+    def allowed(cls, target):
+        """
+            Condition on the Profiles allowed to move to target.
+        """
+        sources = cls.SOURCES[target]
+        condition = models.Q(handle_notify_state__in=[state for state in sources if state is not None])
+        if None in sources:
+            condition |= models.Q(handle_notify_state__isnull=True)
+        return condition
+
+
+class Profile(models.Model):
+    """
+        State of the Profiles on the eUICCs, as reported by the notifications of ES9+.HandleNotification.
+        The table (api_profile) belongs to the Profile model of es2plus, only the columns updated here are declared.
+    """
+    linked_eid = models.CharField(max_length=32)
+    iccid = models.CharField(max_length=20, db_index=True, null=True)
+    handle_notify_state = models.PositiveSmallIntegerField(choices=HandleNotifyState.as_list(), null=True)
+    metadata = models.BinaryField(null=True)
+    profile_owner_oid = models.CharField(max_length=128, db_index=True, null=True)
+
+    class Meta:
+        managed = False
+
+
+class OperatorNotification(models.Model):
+    """
+        ES2+.HandleNotification call waiting to be delivered to an Operator endpoint (body: the JSON request),
+        see api.notifications.OperatorNotifier. coalesce_key identifies the calls superseded by a newer one
+        (the ICCID, for the Profile state changes). A call being sent is leased until locked_until.
+    """
+    endpoint = models.CharField(max_length=255)
+    coalesce_key = models.CharField(max_length=64, null=True, db_index=True)
+    body = models.TextField()
+    attempts = models.PositiveIntegerField(default=0)
+    due_at = models.DateTimeField(db_index=True)
+    locked_until = models.DateTimeField(null=True)
@@ -0,0 +1,480 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import requests
+from django.conf import settings
+from django.db import InterfaceError, OperationalError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone as django_timezone
+from requests.adapters import HTTPAdapter
+
+from api.exceptions import FunctionProviderBusyException
+from api.models import OperatorNotification, Profile
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationPoint:
+    """
+        notificationPointId of the ES2+.HandleNotification calls: 1 to 4 as in SGP.22, the eUICC notifications of
+        Profile state changes and the RPM Package results having their own.
+    """
+    ELIGIBILITY_AND_RETRY_LIMIT_CHECK: int = 1
+    CONFIRMATION_FAILURE: int = 2
+    BPP_DOWNLOAD: int = 3
+    BPP_INSTALLATION: int = 4
+    PROFILE_STATE_CHANGE: int = 5
+    RPM_PACKAGE_EXECUTION: int = 6
+
+
+class RowUpdate:
+    """
+        UPDATE of one row produced by a verified notification: model.objects.filter(condition, <lookup>=key)
+        .update(**values), condition being a Q object.
+    """
+    __slots__ = ('model', 'lookup', 'key', 'values', 'condition')
+
+    def __init__(self, model, lookup, key, values, condition=None):
+        self.model = model
+        self.lookup = lookup
+        self.key = key
+        self.values = values
+        self.condition = condition or Q()
+
+    @property
+    def row(self):
+        return self.model, self.lookup, self.key
+
+    @property
+    def statement(self):
+        return self.model, self.lookup, self.condition, tuple(self.values.items())
+
+
+class Ingestion:
+    """
+        Outcome of one notification: the row updates to apply and the ES2+.HandleNotification events to send
+        to the Operator once they are committed.
+    """
+    __slots__ = ('updates', 'events')
+
+    def __init__(self, updates=(), events=()):
+        self.updates = list(updates)
+        self.events = list(events)
+
+
+class NotificationIngestor:
+    """
+        Ingestion of the notifications delivered by ES9+.HandleNotification, off the request path: the LPAd gets
+        its answer as soon as the notification is queued.
+
+            .   workers threads decode the notifications and verify their signatures (the checks going to the
+                SignatureVerificationService like the ones of the RSP sessions), process(body) returning an
+                Ingestion,
+            .   one writer thread applies the row updates of up to batch_size notifications (or whatever is
+                ready after batch_delay seconds) in one transaction, the rows getting the same values under the
+                same condition being updated by a single UPDATE ... WHERE IN (see statements()),
+            .   the ES2+.HandleNotification calls of the batch are stored by the OperatorNotifier in the same
+                transaction, and sent once it is committed.
+
+        The LPAd having its answer already, a batch is not given up on a transient database error (OperationalError:
+        database locked, connection lost ...): it is written again after RETRY_DELAY, 2 * RETRY_DELAY ... seconds
+        (at most MAX_RETRY_DELAY), the notifications behind it waiting meanwhile. On any other error the
+        notifications of the batch are written one by one, only the failing ones being dropped.
+
+        Above max_pending notifications in progress, submit() raises FunctionProviderBusyException. With
+        workers = 0 a notification is processed and written in the calling thread, the LPAd getting 503 on a
+        transient database error instead of it being retried.
+    """
+    BATCH_SIZE = 200
+    BATCH_DELAY = 0.05
+    RETRY_DELAY = 0.5
+    MAX_RETRY_DELAY = 30.0
+
+    def __init__(self, process, workers, max_pending, batch_size=None, batch_delay=None, notifier=None):
+        self.process = process
+        self.workers = workers
+        self.max_pending = max_pending
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.batch_delay = batch_delay or self.BATCH_DELAY
+        self.notifier = notifier
+        self._executor = None
+        self._writer = None
+        self._ready = []
+        self._condition = threading.Condition()
+        self.pending = 0
+        self.ingested = 0
+        self.dropped = 0
+        self.batches = 0
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='es9plus-notification')
+        return self._executor
+
+    def submit(self, body):
+        with self._condition:
+            if self.pending >= self.max_pending:
+                raise FunctionProviderBusyException()
+            self.pending += 1
+        if not self.workers:
+            self._ingest(body)
+            self._write(self._take(1), retry=False)
+            return
+        with self._condition:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='es9plus-notification-writer', daemon=True)
+                self._writer.start()
+        self.executor.submit(self._ingest, body)
+
+    def _ingest(self, body):
+        try:
+            ingestion = self.process(body)
+        except Exception:
+            logger.exception('notification processing failed')
+            ingestion = None
+        with self._condition:
+            if ingestion is None:
+                # not decodable, not verified or not matching a session: nothing to write
+                self.pending -= 1
+                self.dropped += 1
+                self._condition.notify_all()
+                return
+            self._ready.append((ingestion, time.monotonic()))
+            self._condition.notify_all()
+
+    def _take(self, count):
+        with self._condition:
+            batch, self._ready = self._ready[:count], self._ready[count:]
+        return [ingestion for ingestion, _ in batch]
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                while not self._ready:
+                    self._condition.wait()
+                deadline = self._ready[0][1] + self.batch_delay
+                while len(self._ready) < self.batch_size and time.monotonic() < deadline:
+                    self._condition.wait(deadline - time.monotonic())
+            self._write(self._take(self.batch_size))
+
+    @staticmethod
+    def statements(ingestions):
+        """
+            The updates of a batch as rounds of {(model, lookup, condition, values): [keys]}, executed in order.
+
+            An update is conditional on the current state of its row (e.g. the states a Profile can move to
+            ENABLED from), so the updates of a row are not coalesced: the n-th one goes to the n-th round, after
+            the ones it may depend on. Only an update repeating the previous one of its row is left out, it
+            cannot change the row again.
+        """
+        rows = {}
+        for ingestion in ingestions:
+            for update in ingestion.updates:
+                updates = rows.setdefault(update.row, [])
+                if not updates or updates[-1].statement != update.statement:
+                    updates.append(update)
+        rounds = []
+        for updates in rows.values():
+            for position, update in enumerate(updates):
+                if position == len(rounds):
+                    rounds.append({})
+                rounds[position].setdefault(update.statement, []).append(update.key)
+        return rounds
+
+    def _apply(self, ingestions):
+        with transaction.atomic():
+            for statements in self.statements(ingestions):
+                for (model, lookup, condition, values), keys in statements.items():
+                    model.objects.filter(condition, **{lookup + '__in': keys}).update(**dict(values))
+            if self.notifier is not None:
+                self.notifier.enqueue([event for ingestion in ingestions for event in ingestion.events])
+
+    def _apply_retried(self, ingestions, retry=True):
+        """
+            Number of ingestions written.
+        """
+        delay = self.RETRY_DELAY
+        while True:
+            try:
+                self._apply(ingestions)
+                return len(ingestions)
+            except (OperationalError, InterfaceError) as error:
+                connection.close()
+                if not retry:
+                    raise FunctionProviderBusyException() from error
+                logger.warning('notification batch of %d not written, retried in %.1fs', len(ingestions), delay,
+                               exc_info=True)
+                time.sleep(delay)
+                delay = min(delay * 2, self.MAX_RETRY_DELAY)
+            except Exception:
+                if len(ingestions) == 1:
+                    logger.exception('notification not written')
+                    return 0
+                logger.exception('notification batch of %d not written, writing them one by one', len(ingestions))
+                return sum(self._apply_retried([ingestion], retry) for ingestion in ingestions)
+
+    def _write(self, ingestions, retry=True):
+        if not ingestions:
+            return
+        written = 0
+        try:
+            written = self._apply_retried(ingestions, retry)
+        finally:
+            if written and self.notifier is not None:
+                self.notifier.wake()
+            with self._condition:
+                self.pending -= len(ingestions)
+                self.ingested += written
+                self.dropped += len(ingestions) - written
+                if written:
+                    self.batches += 1
+                self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """
+            Waits until the notifications submitted so far are written (or dropped), False on timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self.pending == 0, timeout)
+
+    def metrics(self):
+        with self._condition:
+            return {
+                'pending': self.pending,
+                'ingested': self.ingested,
+                'dropped': self.dropped,
+                'batches': self.batches,
+            }
+
+
+class OperatorNotifier:
+    """
+        Delivers the ES2+.HandleNotification calls to the Operators.
+
+        The calls are stored (OperatorNotification) in the transaction of the notification batch producing them,
+        so a committed state change is notified even across a restart. A Profile state change replaces the call
+        of a previous one still pending for the same ICCID: the Operator gets the latest state of the Profile
+        instead of every intermediate transition of a mass enable / disable. A call already being sent is not
+        replaced, the new one being sent after it.
+
+        The endpoint of a call is the one of the Profile Owner OID of the Profile (urls), url otherwise, calls
+        without endpoint are not stored. A dispatcher thread claims the due calls, up to batch_size at a time
+        (they are leased for lease seconds, so another process does not send them meanwhile), and sends them
+        with up to concurrency calls in flight per endpoint, each endpoint having its own requests session and
+        pool of keep-alive connections. Delivered calls are deleted in bulk, failed ones (connection error,
+        timeout, HTTP error status) are due again after backoff, 2 * backoff, 4 * backoff ... seconds and
+        dropped after retries retries. The functionCallIdentifier of a call is the same for all its attempts.
+    """
+    HEADERS = {
+        'Content-Type': 'application/json',
+        'X-Admin-Protocol': 'gsma/rsp/v2.2.0',
+    }
+
+    def __init__(self, url=None, urls=None, retries=5, backoff=1.0, timeout=10.0, concurrency=8, batch_size=100,
+                 lease=300.0, poll_interval=1.0):
+        self.url = url
+        self.urls = urls or {}
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self._sessions = {}
+        self._executors = {}
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._dispatcher = None
+        self._woken = False
+        self._in_flight = 0
+        self._done = []
+        self.sent = 0
+        self.failed = 0
+
+    @staticmethod
+    def event(notification_point, eid, iccid, success, result_data, **fields):
+        """
+            Body of an ES2+.HandleNotification call, result_data being the DER of the notification.
+        """
+        return {
+            'header': {
+                'functionRequesterIdentifier': settings.SMDP_OID,
+                'functionCallIdentifier': uuid.uuid4().hex,
+            },
+            'eid': eid,
+            'iccid': iccid,
+            'notificationPointId': notification_point,
+            'notificationPointStatus': {'status': 'Executed-Success' if success else 'Failed'},
+            'resultData': b64encode(result_data).decode(),
+            'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            **fields,
+        }
+
+    @staticmethod
+    def coalesce_key(event):
+        if event['notificationPointId'] == NotificationPoint.PROFILE_STATE_CHANGE:
+            return event['iccid']
+        return None
+
+    def endpoint(self, profile_owner_oid):
+        return self.urls.get(profile_owner_oid, self.url)
+
+    def enqueue(self, events):
+        """
+            Stores the calls of events, in the transaction of the caller.
+        """
+        iccids = {event['iccid'] for event in events if event['iccid']}
+        owners = {}
+        if iccids and self.urls:
+            owners = dict(Profile.objects.filter(iccid__in=iccids).values_list('iccid', 'profile_owner_oid'))
+        now = django_timezone.now()
+        notifications = []
+        latest = {}
+        for event in events:
+            endpoint = self.endpoint(owners.get(event['iccid']))
+            if not endpoint:
+                continue
+            notification = OperatorNotification(
+                endpoint=endpoint, coalesce_key=self.coalesce_key(event), body=json.dumps(event), due_at=now
+            )
+            if notification.coalesce_key is None:
+                notifications.append(notification)
+            else:
+                latest[notification.coalesce_key] = notification
+        if latest:
+            OperatorNotification.objects.filter(self.unleased(now), coalesce_key__in=list(latest)).delete()
+        OperatorNotification.objects.bulk_create(notifications + list(latest.values()))
+
+    @staticmethod
+    def unleased(now):
+        return Q(locked_until__isnull=True) | Q(locked_until__lt=now)
+
+    def start(self):
+        with self._condition:
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_loop, name='es9plus-operator-notifier', daemon=True
+                )
+                self._dispatcher.start()
+
+    def wake(self):
+        self.start()
+        with self._condition:
+            self._woken = True
+            self._condition.notify_all()
+
+    def session(self, endpoint):
+        session = self._sessions.get(endpoint)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(endpoint)
+                if session is None:
+                    session = requests.Session()
+                    session.headers.update(self.HEADERS)
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    self._sessions[endpoint] = session
+                    self._executors[endpoint] = ThreadPoolExecutor(
+                        max_workers=self.concurrency, thread_name_prefix='es9plus-operator'
+                    )
+        return session
+
+    def send(self, notification):
+        try:
+            response = self.session(notification.endpoint).post(
+                notification.endpoint, data=notification.body.encode(), timeout=self.timeout
+            )
+            sent = response.ok
+        except requests.exceptions.RequestException:
+            sent = False
+        with self._condition:
+            self._in_flight -= 1
+            self._done.append((notification, sent))
+            self._condition.notify_all()
+
+    def _claim(self, limit):
+        now = django_timezone.now()
+        locked_until = now + timedelta(seconds=self.lease)
+        due = OperatorNotification.objects.filter(self.unleased(now), due_at__lte=now)
+        notifications = list(due.order_by('due_at')[:limit])
+        if not notifications:
+            return notifications
+        # a conditional UPDATE rather than SELECT ... FOR UPDATE (not available with SQLite): when another
+        # process claims some of these calls meanwhile, only the ones leased here are sent
+        keys = [notification.pk for notification in notifications]
+        claimed = due.filter(pk__in=keys).update(locked_until=locked_until)
+        if claimed < len(notifications):
+            notifications = list(OperatorNotification.objects.filter(pk__in=keys, locked_until=locked_until))
+        return notifications
+
+    def _complete(self):
+        with self._condition:
+            done, self._done = self._done, []
+        if not done:
+            return
+        now = django_timezone.now()
+        finished, retried = [], []
+        for notification, sent in done:
+            if sent or notification.attempts >= self.retries:
+                finished.append(notification.pk)
+            else:
+                notification.attempts += 1
+                notification.due_at = now + timedelta(seconds=self.backoff * 2 ** (notification.attempts - 1))
+                notification.locked_until = None
+                retried.append(notification)
+        with transaction.atomic():
+            OperatorNotification.objects.filter(pk__in=finished).delete()
+            OperatorNotification.objects.bulk_update(retried, ['attempts', 'due_at', 'locked_until'])
+        sent = sum(1 for _, delivered in done if delivered)
+        failed = len(finished) - sent
+        if failed:
+            logger.warning('%d operator notifications not delivered after %d attempts', failed, self.retries + 1)
+        with self._condition:
+            self.sent += sent
+            self.failed += failed
+
+    def _dispatch(self):
+        self._complete()
+        claimed = []
+        capacity = self.batch_size - self._in_flight
+        if capacity > 0:
+            claimed = self._claim(capacity)
+        for notification in claimed:
+            self.session(notification.endpoint)
+            with self._condition:
+                self._in_flight += 1
+            self._executors[notification.endpoint].submit(self.send, notification)
+        return claimed
+
+    def _dispatch_loop(self):
+        while True:
+            try:
+                claimed = self._dispatch()
+            except Exception:
+                logger.exception('operator notifications not dispatched')
+                connection.close()
+                claimed = []
+            with self._condition:
+                if not self._done and not self._woken and (not claimed or self._in_flight >= self.batch_size):
+                    self._condition.wait(self.poll_interval)
+                self._woken = False
+
+    def flush(self, timeout=None):
+        """
+            Waits until all the stored calls are delivered or dropped, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while OperatorNotification.objects.exists() or self._in_flight or self._done:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
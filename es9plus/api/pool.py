@@ -0,0 +1,42 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from api.exceptions import FunctionProviderBusyException
+
+
+class BoundedExecutor:
+    """
+        Runs the blocking part of the ES9+ functions (DER decoding, certificate and signature checks,
+        BPP generation, database access) off the event loop.
+
+        The event loop only reads request bodies and writes responses, so one worker process keeps many
+        LPAd sessions in flight while at most max_workers requests are being computed. Once max_pending
+        requests are queued or running, new ones are refused with FunctionProviderBusyException so the
+        LPAd retries later instead of piling up on a saturated worker.
+    """
+
+    def __init__(self, max_workers, max_pending):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor = None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='es9plus')
+        return self._executor
+
+    async def run(self, function, *args):
+        if self.pending >= self.max_pending:
+            raise FunctionProviderBusyException()
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -5,7 +5,7 @@ from Crypto.Cipher import AES
 from Crypto.Hash import CMAC
 from ecdsa import SigningKey, BRAINPOOLP256r1, VerifyingKey, ECDH
 
-from es9plus.api.tlv_helper import TlvHelper
+from api.tlv_helper import TlvHelper
 
 
 class SCP11:
@@ -175,6 +175,20 @@ class SCP11:
         # If the algorithm is AES-CBC-128 or SM4-CBC, the C-MAC value is the 8 most significant bytes
         return message + mac[0:16]
 
+    def wrap(self, tag, data, encrypt=True):
+        """
+            Protect one segment of the Bound Profile Package, data and result are bytes.
+            Returns the value of the '86'/'87'/'88' TLV: the (encrypted) data followed by the 8 bytes C-MAC,
+            the MAC chaining value is updated for the next segment.
+        """
+        if encrypt:
+            data = self.encrypt(data.hex())
+            self.counter += 1
+        length = self.tlv_helper.encode_length(len(data) + 8)
+        mac = self.generate_aes_cmac(self.imcv + tag + length.hex() + data.hex(), self.s_cmac)
+        self.imcv = mac
+        return data + bytes.fromhex(mac[0:16])
+
     @staticmethod
     def generate_aes_cmac(message_data, cmac_key):
         cmac = CMAC.new(bytearray.fromhex(cmac_key), ciphermod=AES)
@@ -0,0 +1,237 @@
+import marshal
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+class RspSession:
+    """
+        State of one RSP session, keyed by the TransactionID generated in ES9+.InitiateAuthentication and
+        completed by ES9+.AuthenticateClient (EID, eUICC certificate, selected download order or RPM order) and
+        ES9+.GetBoundProfilePackage (otPK.EUICC.ECKA). version counts the writes of the session to the store.
+    """
+    __slots__ = (
+        'transaction_id', 'euicc_challenge', 'server_challenge', 'eid', 'download_order_id',
+        'euicc_certificate', 'smdp_signature2', 'euicc_otpk', 'rpm_order_id', 'version',
+    )
+
+    def __init__(self, transaction_id, euicc_challenge, server_challenge, eid=None, download_order_id=None,
+                 euicc_certificate=None, smdp_signature2=None, euicc_otpk=None, rpm_order_id=None, version=0):
+        self.transaction_id = transaction_id
+        self.euicc_challenge = euicc_challenge
+        self.server_challenge = server_challenge
+        self.eid = eid
+        self.download_order_id = download_order_id
+        self.euicc_certificate = euicc_certificate
+        self.smdp_signature2 = smdp_signature2
+        self.euicc_otpk = euicc_otpk
+        self.rpm_order_id = rpm_order_id
+        self.version = version
+
+    def to_bytes(self):
+        return marshal.dumps(tuple(getattr(self, name) for name in self.__slots__))
+
+    @classmethod
+    def from_bytes(cls, data):
+        return cls(*marshal.loads(data))
+
+    def size(self):
+        return sys.getsizeof(self) + sum(sys.getsizeof(getattr(self, name)) for name in self.__slots__)
+
+
+class LocalSessionCache:
+    """
+        Process-local tier: least recently used sessions are evicted above max_entries, entries older than
+        ttl seconds are dropped on access.
+    """
+
+    def __init__(self, max_entries, ttl, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, session = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return session
+
+    def put(self, key, session):
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, session)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def sessions(self):
+        with self._lock:
+            return [session for _, session in self._entries.values()]
+
+
+class SqliteSharedStore:
+    """
+        Local stand-in for the shared tier, exposing the subset of the Redis client used by the
+        SessionStore (get, set with ex, incr, expire, delete) so a redis.Redis instance can replace it as is.
+        The database is opened on first use, not when the store is created.
+    """
+    PURGE_EVERY = 1000
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _connect(self):
+        # called with the lock held
+        if self._connection is None:
+            connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS rsp_session (key BLOB PRIMARY KEY, value BLOB, expires_at REAL)'
+            )
+            self._connection = connection
+        return self._connection
+
+    def get(self, name):
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT value FROM rsp_session WHERE key = ? AND expires_at > ?', (name, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, name, value, ex=None):
+        expires_at = time.time() + ex if ex else float('inf')
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                'INSERT OR REPLACE INTO rsp_session (key, value, expires_at) VALUES (?, ?, ?)', (name, value, expires_at)
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                connection.execute('DELETE FROM rsp_session WHERE expires_at <= ?', (time.time(),))
+        return True
+
+    def incr(self, name):
+        """
+            Increments the integer value of name in a single statement, atomic across the processes sharing the
+            database, a missing or expired value counting as 0. As in Redis, the expiry of the value is kept.
+        """
+        now = time.time()
+        with self._lock:
+            return self._connect().execute(
+                'INSERT INTO rsp_session (key, value, expires_at) VALUES (?, 1, ?) ON CONFLICT (key) DO UPDATE SET '
+                'value = CASE WHEN expires_at > ? THEN CAST(value AS INTEGER) + 1 ELSE 1 END, '
+                'expires_at = CASE WHEN expires_at > ? THEN expires_at ELSE excluded.expires_at END RETURNING value',
+                (name, float('inf'), now, now)
+            ).fetchone()[0]
+
+    def expire(self, name, seconds):
+        with self._lock:
+            return self._connect().execute(
+                'UPDATE rsp_session SET expires_at = ? WHERE key = ? AND expires_at > ?',
+                (time.time() + seconds, name, time.time())
+            ).rowcount > 0
+
+    def delete(self, *names):
+        with self._lock:
+            return self._connect().executemany(
+                'DELETE FROM rsp_session WHERE key = ?', ((name,) for name in names)
+            ).rowcount
+
+
+class SessionStore:
+    """
+        RSP session store with two tiers:
+            .   a process-local LRU + TTL cache, which serves the calls of a session that stays on the same
+                worker process without reading (and decoding) the session from the shared tier,
+            .   a shared tier (write-through) for the calls of a session routed to another worker.
+
+        Every ES9+ call changes the state of its session, so a local copy is only used while it is the
+        latest one: the shared tier holds the version of each session under a separate small key, read on
+        every lookup (a local hit costs that one read), and the session itself is read again when the version
+        differs (updated by another worker) or is missing (session deleted by another worker, e.g. cancelled or
+        completed). The version is incremented atomically in the shared tier (INCR), so two workers writing the
+        same session never give their copies the same version.
+    """
+    VERSION_SUFFIX = b':version'
+
+    def __init__(self, shared, max_entries, ttl):
+        self.shared = shared
+        self.ttl = ttl
+        self.local = LocalSessionCache(max_entries, ttl)
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def get(self, transaction_id, require=None):
+        """
+            require names the field the calling function relies on: a local copy without it was left behind by
+            a call served on another worker, the shared tier is read again in that case.
+        """
+        session = self.local.get(transaction_id)
+        if session is not None and (require is None or getattr(session, require) is not None) and \
+                self._shared_version(transaction_id) == session.version:
+            self.local_hits += 1
+            return session
+
+        data = self.shared.get(transaction_id)
+        if data is None:
+            self.local.delete(transaction_id)
+            self.misses += 1
+            return None
+        self.shared_hits += 1
+        session = RspSession.from_bytes(data)
+        self.local.put(transaction_id, session)
+        return session
+
+    @classmethod
+    def _version_key(cls, transaction_id):
+        return bytes(transaction_id) + cls.VERSION_SUFFIX
+
+    def _shared_version(self, transaction_id):
+        version = self.shared.get(self._version_key(transaction_id))
+        return None if version is None else int(version)
+
+    def put(self, session):
+        version_key = self._version_key(session.transaction_id)
+        session.version = int(self.shared.incr(version_key))
+        self.shared.expire(version_key, self.ttl)
+        self.local.put(session.transaction_id, session)
+        # a worker reading the new version before the session is written caches the previous session with its
+        # older version, read again on the next lookup
+        self.shared.set(session.transaction_id, session.to_bytes(), ex=self.ttl)
+
+    def delete(self, transaction_id):
+        self.local.delete(transaction_id)
+        self.shared.delete(transaction_id, self._version_key(transaction_id))
+
+    def metrics(self):
+        lookups = self.local_hits + self.shared_hits + self.misses
+        sessions = self.local.sessions()
+        return {
+            'local_hits': self.local_hits,
+            'shared_hits': self.shared_hits,
+            'misses': self.misses,
+            'hit_rate': (self.local_hits + self.shared_hits) / lookups if lookups else 0.0,
+            'local_hit_rate': self.local_hits / lookups if lookups else 0.0,
+            'local_sessions': len(sessions),
+            'memory_per_session': sum(session.size() for session in sessions) / len(sessions) if sessions else 0,
+        }
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import secrets
+import threading
+from collections import deque
+from pathlib import Path
+
+from ecdsa import SigningKey
+
+
+class PrecomputedSigningKey:
+    """
+        SM-DP+ static key (SK.DPauth.ECDSA, SK.DPpb.ECDSA) parsed once per worker process.
+
+        The r part of an ECDSA signature only depends on the nonce k (r = (k.G).x mod n), so the scalar
+        multiplication is done ahead of time: (r, k^-1) pairs are precomputed in a background thread and
+        a signature costs s = k^-1 (e + r.d) mod n. Every nonce is random and used at most once; when the
+        pool is empty the pair is computed on the fly. A process forked from the one holding the key (e.g.
+        a pre-forking server loading the credentials before forking its workers) drops the inherited pairs,
+        the parent and its other children using them too, and restarts its own refill.
+
+        The signature is returned as r || s as required for the RSP signatures (serverSignature1,
+        smdpSignature2, smdpSign).
+    """
+    NONCES = 256
+
+    def __init__(self, signing_key, nonces=None):
+        self.signing_key = signing_key
+        self.nonces = nonces or self.NONCES
+        self.generator = signing_key.curve.generator
+        self.order = self.generator.order()
+        self.secret = signing_key.privkey.secret_multiplier
+        self.size = (self.order.bit_length() + 7) // 8
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._pairs = deque()
+        self._lock = threading.Lock()
+        self._refilling = False
+
+    @classmethod
+    def from_pem(cls, path, nonces=None):
+        return cls(SigningKey.from_pem(Path(path).read_text()), nonces)
+
+    def _pair(self):
+        while True:
+            k = secrets.randbelow(self.order - 1) + 1
+            r = (self.generator * k).x() % self.order
+            if r:
+                return r, pow(k, -1, self.order)
+
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            self._reset()
+
+    def precompute(self, count=None):
+        self._check_fork()
+        count = count or self.nonces
+        while len(self._pairs) < count:
+            self._pairs.append(self._pair())
+
+    def _refill(self):
+        try:
+            self.precompute()
+        finally:
+            self._refilling = False
+
+    def _next_pair(self):
+        self._check_fork()
+        try:
+            pair = self._pairs.popleft()
+        except IndexError:
+            pair = self._pair()
+        if len(self._pairs) < self.nonces // 2 and not self._refilling:
+            with self._lock:
+                if not self._refilling:
+                    self._refilling = True
+                    threading.Thread(target=self._refill, name='es9plus-nonces', daemon=True).start()
+        return pair
+
+    def _digest(self, data):
+        digest = hashlib.sha256(data).digest()
+        return int.from_bytes(digest, 'big') >> max(0, len(digest) * 8 - self.order.bit_length())
+
+    def sign(self, data):
+        e = self._digest(data)
+        while True:
+            r, k_inverse = self._next_pair()
+            s = k_inverse * (e + r * self.secret) % self.order
+            if s:
+                return r.to_bytes(self.size, 'big') + s.to_bytes(self.size, 'big')
@@ -1,3 +1,748 @@
-from django.test import TestCase
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+from unittest import mock
 
-# Create your tests here.
+from django.db import OperationalError, connection
+from django.test import SimpleTestCase, TestCase
+from ecdsa import NIST256p, SigningKey
+from ecdsa.util import sigdecode_string
+
+from api.bpp import BoundProfilePackageBuilder
+from api.certificate import Certificate
+from api.chain_cache import ChainVerificationCache
+from api.codec import Asn1Codec
+from api.es9 import AuthenticateClient, HandleNotification, InitiateAuthentication
+from api.exceptions import Es9PlusFunctionError, FunctionProviderBusyException, InvalidCertificateError
+from api.models import (
+    DownloadOrder, DownloadOrderState, HandleNotifyState, OperatorNotification, Profile, RpmOrder, RpmOrderState,
+)
+from api.notifications import Ingestion, NotificationIngestor, NotificationPoint, OperatorNotifier, RowUpdate
+from api.rsp_22_v3 import PKIX1Explicit88, RSPDefinitions
+from api.session_store import RspSession, SessionStore, SqliteSharedStore
+from api.signing import PrecomputedSigningKey
+from api.tlv_helper import TlvHelper
+from api.verification import SignatureVerificationService
+
+
+def setUpModule():
+    # the api app has no migrations (Profile is not even managed here): its tables are created for the tests
+    with connection.schema_editor() as editor:
+        for model in (DownloadOrder, RpmOrder, Profile, OperatorNotification):
+            editor.create_model(model)
+
+
+def tearDownModule():
+    with connection.schema_editor() as editor:
+        for model in (DownloadOrder, RpmOrder, Profile, OperatorNotification):
+            editor.delete_model(model)
+
+
+class NotificationIngestorTest(TestCase):
+    EID = '89049032123451234512345678901235'
+
+    def setUp(self):
+        for iccid in ('89001012345678900001', '89001012345678900002'):
+            Profile.objects.create(linked_eid=self.EID, iccid=iccid)
+        # the Ingestion is submitted as the notification body, process() returning it as is
+        self.ingestor = NotificationIngestor(lambda ingestion: ingestion, workers=0, max_pending=10)
+
+    @staticmethod
+    def installed(iccid, values=None):
+        return Ingestion([RowUpdate(
+            Profile, 'iccid', iccid, values or {'handle_notify_state': HandleNotifyState.INSTALLED},
+            HandleNotifyState.allowed(HandleNotifyState.INSTALLED)
+        )])
+
+    def state(self, iccid):
+        return Profile.objects.get(iccid=iccid).handle_notify_state
+
+    def test_batch_written(self):
+        self.ingestor.pending = 2
+        self.ingestor._write([self.installed('89001012345678900001'), self.installed('89001012345678900002')])
+        self.assertEqual(self.state('89001012345678900001'), HandleNotifyState.INSTALLED)
+        self.assertEqual(self.state('89001012345678900002'), HandleNotifyState.INSTALLED)
+        self.assertEqual(self.ingestor.metrics(), {'pending': 0, 'ingested': 2, 'dropped': 0, 'batches': 1})
+
+    def test_transient_error_retried(self):
+        apply = self.ingestor._apply
+        calls = []
+
+        def locked_once(ingestions):
+            calls.append(ingestions)
+            if len(calls) == 1:
+                raise OperationalError('database is locked')
+            apply(ingestions)
+
+        self.ingestor.pending = 1
+        with mock.patch.object(self.ingestor, '_apply', side_effect=locked_once), \
+                mock.patch('api.notifications.time.sleep') as sleep, \
+                self.assertLogs('api.notifications', 'WARNING'):
+            self.ingestor._write([self.installed('89001012345678900001')])
+        self.assertEqual(len(calls), 2)
+        sleep.assert_called_once_with(NotificationIngestor.RETRY_DELAY)
+        self.assertEqual(self.state('89001012345678900001'), HandleNotifyState.INSTALLED)
+        self.assertEqual(self.ingestor.metrics()['ingested'], 1)
+        self.assertEqual(self.ingestor.metrics()['dropped'], 0)
+
+    def test_failing_notification_dropped_alone(self):
+        self.ingestor.pending = 2
+        with self.assertLogs('api.notifications', 'ERROR'):
+            self.ingestor._write([
+                self.installed('89001012345678900001', {'no_such_column': 1}),
+                self.installed('89001012345678900002'),
+            ])
+        self.assertIsNone(self.state('89001012345678900001'))
+        self.assertEqual(self.state('89001012345678900002'), HandleNotifyState.INSTALLED)
+        self.assertEqual(self.ingestor.metrics(), {'pending': 0, 'ingested': 1, 'dropped': 1, 'batches': 1})
+
+    def test_transient_error_in_request_thread_is_busy(self):
+        with mock.patch.object(self.ingestor, '_apply', side_effect=OperationalError('database is locked')):
+            with self.assertRaises(FunctionProviderBusyException):
+                self.ingestor.submit(self.installed('89001012345678900001'))
+        self.assertEqual(self.ingestor.metrics(), {'pending': 0, 'ingested': 0, 'dropped': 1, 'batches': 0})
+
+    @staticmethod
+    def moved(iccid, state):
+        return Ingestion([RowUpdate(
+            Profile, 'iccid', iccid, {'handle_notify_state': state}, HandleNotifyState.allowed(state)
+        )])
+
+    def test_transitions_of_a_row_applied_in_order(self):
+        iccid = '89001012345678900001'
+        self.ingestor.pending = 3
+        self.ingestor._write([
+            self.installed(iccid), self.moved(iccid, HandleNotifyState.ENABLED),
+            self.moved(iccid, HandleNotifyState.DISABLED),
+        ])
+        self.assertEqual(self.state(iccid), HandleNotifyState.DISABLED)
+
+    def test_transition_not_allowed_skipped(self):
+        self.ingestor.pending = 2
+        self.ingestor._write([
+            self.moved('89001012345678900001', HandleNotifyState.ENABLED), self.installed('89001012345678900002'),
+        ])
+        self.assertIsNone(self.state('89001012345678900001'))
+        self.assertEqual(self.state('89001012345678900002'), HandleNotifyState.INSTALLED)
+
+    def test_enabled_profile_deleted(self):
+        iccid = '89001012345678900001'
+        self.ingestor.pending = 3
+        self.ingestor._write([
+            self.installed(iccid), self.moved(iccid, HandleNotifyState.ENABLED),
+            self.moved(iccid, HandleNotifyState.DELETED),
+        ])
+        self.assertEqual(self.state(iccid), HandleNotifyState.DELETED)
+
+    def test_statements_grouped_per_round(self):
+        first, second = '89001012345678900001', '89001012345678900002'
+        rounds = NotificationIngestor.statements([
+            self.installed(first), self.installed(second), self.installed(second),
+            self.moved(first, HandleNotifyState.ENABLED),
+        ])
+        self.assertEqual([list(statements.values()) for statements in rounds], [
+            [[first, second]], [[first]],
+        ])
+
+
+class HandleNotifyStateTest(SimpleTestCase):
+    def test_same_transitions_as_es2plus(self):
+        # ProfileLifecycle.TRANSITIONS of es2plus, checked against the same table by its tests
+        self.assertEqual(HandleNotifyState.SOURCES, {
+            HandleNotifyState.INSTALLED: (None, HandleNotifyState.DELETED),
+            HandleNotifyState.ENABLED: (HandleNotifyState.INSTALLED, HandleNotifyState.DISABLED),
+            HandleNotifyState.DISABLED: (HandleNotifyState.INSTALLED, HandleNotifyState.ENABLED),
+            HandleNotifyState.DELETED: (
+                HandleNotifyState.INSTALLED, HandleNotifyState.ENABLED, HandleNotifyState.DISABLED,
+            ),
+        })
+
+
+class OperatorNotifierTest(TestCase):
+    EID = '89049032123451234512345678901235'
+    ICCID = '89001012345678900001'
+    URL = 'http://operator.example/gsma/rsp2/es2plus/handleDownloadProgressInfo'
+    NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+    def setUp(self):
+        self.notifier = OperatorNotifier(self.URL, retries=2, backoff=1.0, lease=60.0)
+        now = mock.patch('api.notifications.django_timezone.now', side_effect=lambda: self.now)
+        now.start()
+        self.addCleanup(now.stop)
+        self.now = self.NOW
+
+    def state_change(self, state):
+        return OperatorNotifier.event(
+            NotificationPoint.PROFILE_STATE_CHANGE, self.EID, self.ICCID, True, b'notification', profileState=state
+        )
+
+    def installation(self):
+        return OperatorNotifier.event(NotificationPoint.BPP_INSTALLATION, self.EID, self.ICCID, True, b'result')
+
+    def bodies(self):
+        return [json.loads(body) for body in OperatorNotification.objects.order_by('pk').values_list('body', flat=True)]
+
+    def deliver(self, *results):
+        """
+            Sends the due calls, the Operator answering each of them with the next of results (HTTP status).
+        """
+        claimed = self.notifier._claim(self.notifier.batch_size)
+        session = mock.Mock()
+        session.post.side_effect = [mock.Mock(ok=status < 300) for status in results]
+        with mock.patch.object(self.notifier, 'session', return_value=session):
+            for notification in claimed:
+                self.notifier.send(notification)
+        self.notifier._complete()
+        return claimed
+
+    def test_calls_stored(self):
+        self.notifier.enqueue([self.installation(), self.state_change('Enabled')])
+        self.assertEqual([body['notificationPointId'] for body in self.bodies()], [
+            NotificationPoint.BPP_INSTALLATION, NotificationPoint.PROFILE_STATE_CHANGE,
+        ])
+        self.assertEqual(set(OperatorNotification.objects.values_list('endpoint', flat=True)), {self.URL})
+
+    def test_calls_without_endpoint_not_stored(self):
+        OperatorNotifier().enqueue([self.installation()])
+        self.assertFalse(OperatorNotification.objects.exists())
+
+    def test_pending_state_change_replaced(self):
+        self.notifier.enqueue([self.state_change('Enabled'), self.installation()])
+        self.notifier.enqueue([self.state_change('Disabled')])
+        self.assertEqual([body.get('profileState') for body in self.bodies()], [None, 'Disabled'])
+
+    def test_state_change_being_sent_not_replaced(self):
+        self.notifier.enqueue([self.state_change('Enabled')])
+        self.assertEqual(len(self.notifier._claim(10)), 1)
+        self.notifier.enqueue([self.state_change('Disabled')])
+        self.assertEqual([body['profileState'] for body in self.bodies()], ['Enabled', 'Disabled'])
+
+    def test_claimed_calls_leased(self):
+        self.notifier.enqueue([self.installation()])
+        self.assertEqual(len(self.notifier._claim(10)), 1)
+        self.assertEqual(self.notifier._claim(10), [])
+        # the process which claimed them stopped: they are claimed again once the lease expires
+        self.now += timedelta(seconds=61)
+        self.assertEqual(len(self.notifier._claim(10)), 1)
+
+    def test_delivered_calls_deleted(self):
+        self.notifier.enqueue([self.installation(), self.state_change('Enabled')])
+        self.assertEqual(len(self.deliver(200, 200)), 2)
+        self.assertFalse(OperatorNotification.objects.exists())
+        self.assertEqual((self.notifier.sent, self.notifier.failed), (2, 0))
+
+    def test_failed_call_retried_with_backoff(self):
+        self.notifier.enqueue([self.installation()])
+        self.deliver(503)
+        notification = OperatorNotification.objects.get()
+        self.assertEqual((notification.attempts, notification.locked_until), (1, None))
+        self.assertEqual(notification.due_at, self.NOW + timedelta(seconds=1))
+        self.assertEqual(self.deliver(), [])
+
+        self.now += timedelta(seconds=1)
+        self.deliver(503)
+        notification = OperatorNotification.objects.get()
+        self.assertEqual(notification.attempts, 2)
+        self.assertEqual(notification.due_at, self.now + timedelta(seconds=2))
+
+        self.now += timedelta(seconds=2)
+        self.deliver(200)
+        self.assertFalse(OperatorNotification.objects.exists())
+        self.assertEqual((self.notifier.sent, self.notifier.failed), (1, 0))
+
+    def test_call_dropped_after_the_retries(self):
+        self.notifier.enqueue([self.installation()])
+        with self.assertLogs('api.notifications', 'WARNING'):
+            for delay in (0, 1, 2):
+                self.now += timedelta(seconds=delay)
+                self.deliver(503)
+        self.assertFalse(OperatorNotification.objects.exists())
+        self.assertEqual((self.notifier.sent, self.notifier.failed), (0, 1))
+
+
+class RpmMetadataUpdatesTest(TestCase):
+    EID = '89049032123451234512345678901235'
+    ICCID = '89001012345678900001'
+    # the ICCID of an RpmCommandResult, nibbles swapped
+    ICCID_BCD = bytes.fromhex('98000121436587090010')
+
+    def setUp(self):
+        Profile.objects.create(linked_eid=self.EID, iccid=self.ICCID, metadata=b'stored', profile_owner_oid='2.999.10')
+        self.rpm_order = RpmOrder.objects.create(
+            eid=self.EID, matching_id='ABCDE-FGHIJ-KLMNO-PQRST', state=RpmOrderState.DELIVERED,
+            metadata_updates={self.ICCID: {'metadata': b'updated'.hex(), 'profile_owner_oid': '2.999.20'}}
+        )
+
+    def results(self, *update_metadata_results):
+        return [{'iccid': self.ICCID_BCD, 'rpmCommandResultData': ('updateMetadataResult', result)}
+                for result in update_metadata_results]
+
+    def apply(self, results):
+        ingestor = NotificationIngestor(lambda ingestion: ingestion, workers=0, max_pending=10)
+        ingestor.submit(Ingestion(HandleNotification.metadata_updates(self.rpm_order.pk, self.EID, results)))
+        return Profile.objects.values_list('metadata', 'profile_owner_oid').get(iccid=self.ICCID)
+
+    def test_metadata_stored_once_executed(self):
+        metadata, profile_owner_oid = self.apply(self.results(HandleNotification.UPDATE_METADATA_OK))
+        self.assertEqual((bytes(metadata), profile_owner_oid), (b'updated', '2.999.20'))
+
+    def test_metadata_kept_when_a_command_failed(self):
+        metadata, profile_owner_oid = self.apply(self.results(HandleNotification.UPDATE_METADATA_OK, 7))
+        self.assertEqual((bytes(metadata), profile_owner_oid), (b'stored', '2.999.10'))
+
+    def test_no_query_without_update_metadata_results(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(HandleNotification.metadata_updates(self.rpm_order.pk, self.EID, [
+                {'iccid': self.ICCID_BCD, 'rpmCommandResultData': ('enableResult', 0)},
+            ]), [])
+
+
+class DeliverRpmPackageTest(TestCase):
+    EID = '89049032123451234512345678901235'
+
+    def setUp(self):
+        self.rpm_order = RpmOrder.objects.create(
+            eid=self.EID, matching_id='ABCDE-FGHIJ-KLMNO-PQRST', state=RpmOrderState.RELEASED,
+            rpm_package=Asn1Codec.encode(RSPDefinitions.RpmPackage, AuthenticateClient.RPM_PACKAGE_SAMPLE)
+        )
+        self.credentials = mock.Mock()
+        self.credentials.sign_dp_pb.return_value = bytes(64)
+
+    def deliver(self, transaction_id):
+        session = RspSession(transaction_id, bytes(16), bytes(16), eid=self.EID, euicc_certificate=b'euicc certificate')
+        with mock.patch('api.es9.SmdpCredentials.get', return_value=self.credentials), \
+                mock.patch.object(AuthenticateClient, 'sessions') as sessions:
+            response = AuthenticateClient.deliver_rpm_package(session, self.rpm_order)
+        return response, sessions
+
+    def test_released_order_delivered(self):
+        response, sessions = self.deliver(bytes(range(16)))
+        self.assertIsNotNone(response)
+        sessions.put.assert_called_once()
+        self.rpm_order.refresh_from_db()
+        self.assertEqual(self.rpm_order.state, RpmOrderState.DELIVERED)
+        self.assertEqual(bytes(self.rpm_order.transaction_id), bytes(range(16)))
+        self.assertEqual(bytes(self.rpm_order.euicc_certificate), b'euicc certificate')
+
+    def test_order_delivered_once(self):
+        self.deliver(bytes(range(16)))
+        self.credentials.reset_mock()
+        response, sessions = self.deliver(bytes(16))
+        self.assertIsNone(response)
+        self.credentials.sign_dp_pb.assert_not_called()
+        sessions.put.assert_not_called()
+        self.rpm_order.refresh_from_db()
+        self.assertEqual(bytes(self.rpm_order.transaction_id), bytes(range(16)))
+
+
+class ProfileInstallationResultTest(TestCase):
+    EID = '89049032123451234512345678901235'
+    ICCID = '89001012345678900001'
+    TRANSACTION_ID = bytes(range(16))
+
+    def setUp(self):
+        self.download_order = DownloadOrder.objects.create(
+            eid=self.EID, matching_id='ABCDE-FGHIJ-KLMNO-PQRST', iccid=self.ICCID, state=DownloadOrderState.DOWNLOADED,
+            transaction_id=self.TRANSACTION_ID, euicc_certificate=CertificateTest.CI_DER
+        )
+        Profile.objects.create(linked_eid=self.EID, iccid=self.ICCID)
+        self.ingestor = NotificationIngestor(lambda ingestion: ingestion, workers=0, max_pending=10)
+
+    def profile_installation_result(self, transaction_id, verified=True):
+        # the RSP session has expired: the session store is empty
+        with mock.patch.object(HandleNotification, 'verifier') as verifier, \
+                mock.patch.object(HandleNotification, 'sessions', SessionStore(SqliteSharedStore(':memory:'), 10, 60)):
+            verifier.verify.return_value = verified
+            ingestion = HandleNotification.profile_installation_result({
+                'profileInstallationResultData': {
+                    'transactionId': transaction_id, 'finalResult': ('successResult', {}), 'notificationMetadata': {},
+                },
+                'euiccSignPIR': bytes(64),
+            }, b'result data')
+        if ingestion is not None:
+            self.ingestor.submit(ingestion)
+        return ingestion
+
+    def test_result_matched_to_the_order_after_the_session_expired(self):
+        self.assertIsNotNone(self.profile_installation_result(self.TRANSACTION_ID))
+        self.download_order.refresh_from_db()
+        self.assertEqual(self.download_order.state, DownloadOrderState.INSTALLED)
+        self.assertEqual(Profile.objects.get(iccid=self.ICCID).handle_notify_state, HandleNotifyState.INSTALLED)
+
+    def test_unknown_transaction_logged_and_dropped(self):
+        with self.assertLogs('api.es9', 'WARNING'):
+            self.assertIsNone(self.profile_installation_result(bytes(16)))
+
+    def test_result_not_verified_dropped(self):
+        with self.assertLogs('api.es9', 'WARNING'):
+            self.assertIsNone(self.profile_installation_result(self.TRANSACTION_ID, verified=False))
+        self.download_order.refresh_from_db()
+        self.assertEqual(self.download_order.state, DownloadOrderState.DOWNLOADED)
+
+
+class RpmPackageResultTest(TestCase):
+    EID = '89049032123451234512345678901235'
+    TRANSACTION_ID = bytes(range(16))
+
+    def setUp(self):
+        self.rpm_order = RpmOrder.objects.create(
+            eid=self.EID, matching_id='ABCDE-FGHIJ-KLMNO-PQRST', state=RpmOrderState.DELIVERED,
+            transaction_id=self.TRANSACTION_ID, euicc_certificate=CertificateTest.CI_DER
+        )
+        self.ingestor = NotificationIngestor(lambda ingestion: ingestion, workers=0, max_pending=10)
+
+    def load_rpm_package_result(self, transaction_id, verified=True):
+        # the RSP session has expired: the session store is empty
+        with mock.patch.object(HandleNotification, 'verifier') as verifier, \
+                mock.patch.object(HandleNotification, 'sessions', SessionStore(SqliteSharedStore(':memory:'), 10, 60)):
+            verifier.verify.return_value = verified
+            ingestion = HandleNotification.load_rpm_package_result({
+                'loadRpmPackageResultDataSigned': {
+                    'transactionId': transaction_id, 'finalResult': ('rpmPackageExecutionResult', []),
+                },
+                'euiccSignRPR': bytes(64),
+            }, b'result data')
+        if ingestion is not None:
+            self.ingestor.submit(ingestion)
+        return ingestion
+
+    def test_result_matched_to_the_order_after_the_session_expired(self):
+        self.assertIsNotNone(self.load_rpm_package_result(self.TRANSACTION_ID))
+        self.rpm_order.refresh_from_db()
+        self.assertEqual(self.rpm_order.state, RpmOrderState.EXECUTED)
+        self.assertEqual(bytes(self.rpm_order.result), b'result data')
+
+    def test_unknown_transaction_logged_and_dropped(self):
+        with self.assertLogs('api.es9', 'WARNING'):
+            self.assertIsNone(self.load_rpm_package_result(bytes(16)))
+
+    def test_result_not_verified_dropped(self):
+        with self.assertLogs('api.es9', 'WARNING'):
+            self.assertIsNone(self.load_rpm_package_result(self.TRANSACTION_ID, verified=False))
+        self.rpm_order.refresh_from_db()
+        self.assertEqual(self.rpm_order.state, RpmOrderState.DELIVERED)
+
+
+class DerTemplateTest(SimpleTestCase):
+    """
+        The templates render the same DER as pycrate, with variable fields around the boundaries of the length
+        encoding (contents of 127 / 128 and 255 / 256 bytes) at every level of nesting.
+    """
+    TRANSACTION_ID = bytes(range(16))
+
+    @staticmethod
+    def contents_length(der):
+        _, value_offset, end = TlvHelper.read_tlv(der)
+        return end - value_offset
+
+    @classmethod
+    def rpm_packages(cls, lengths):
+        """
+            RpmPackages by length of their contents: an 'Update Metadata' command of a growing icon, followed by
+            a small one filling the lengths skipped when the TLVs of the first one get a longer length field.
+        """
+        packages = {}
+        for icon_length in range(lengths.start - 60, lengths.stop):
+            for small_icon_length in range(4):
+                package = [{'rpmCommandDetails': ('updateMetadata', {
+                    'iccid': bytes(10), 'updateMetadataRequest': {'icon': bytes(length)},
+                })} for length in (icon_length, small_icon_length)]
+                length = cls.contents_length(Asn1Codec.encode(RSPDefinitions.RpmPackage, package))
+                if length in lengths:
+                    packages.setdefault(length, package)
+        return packages
+
+    def test_server_signed1(self):
+        for length in (1, 8, 16):
+            values = (bytes(range(length)), os.urandom(16), os.urandom(16))
+            self.assertEqual(
+                InitiateAuthentication.server_signed1_template().render(
+                    transactionId=values[0], euiccChallenge=values[1], serverChallenge=values[2]
+                ),
+                Asn1Codec.encode(RSPDefinitions.ServerSigned1, InitiateAuthentication.server_signed1(*values))
+            )
+
+    def test_smdp_signed2(self):
+        for length in (1, 16):
+            transaction_id = bytes(range(length))
+            self.assertEqual(
+                AuthenticateClient.smdp_signed2_template().render(transactionId=transaction_id),
+                Asn1Codec.encode(RSPDefinitions.SmdpSigned2, {'transactionId': transaction_id, 'ccRequiredFlag': False})
+            )
+
+    def test_smdp_signed3_and_authenticate_client_ok_rpm(self):
+        packages = self.rpm_packages(range(100, 300))
+        self.assertEqual(set(packages), set(range(100, 300)))
+        for length, package in packages.items():
+            with self.subTest(length=length):
+                smdp_signed3 = {'transactionId': self.TRANSACTION_ID, 'rpmPackage': package}
+                rendered = AuthenticateClient.smdp_signed3_template().render(
+                    transactionId=self.TRANSACTION_ID, rpmPackage=Asn1Codec.encode(RSPDefinitions.RpmPackage, package)
+                )
+                self.assertEqual(rendered, Asn1Codec.encode(RSPDefinitions.SmdpSigned3, smdp_signed3))
+                signature = os.urandom(64)
+                self.assertEqual(
+                    AuthenticateClient.rpm_template().render(
+                        transactionId=self.TRANSACTION_ID, smdpSigned3=rendered, smdpSignature3=signature
+                    ),
+                    Asn1Codec.encode(AuthenticateClient.RESPONSE, ('authenticateClientOkRpm', {
+                        'transactionId': self.TRANSACTION_ID, 'smdpSigned3': smdp_signed3, 'smdpSignature3': signature,
+                    }))
+                )
+
+    def test_initialise_secure_channel_request(self):
+        smdp_otpk = b'\x04' + os.urandom(64)
+        # an empty smdpSign is rendered first, to sign the data objects
+        for smdp_sign in (b'', os.urandom(64)):
+            self.assertEqual(
+                BoundProfilePackageBuilder.request_template().render(
+                    transactionId=self.TRANSACTION_ID, smdpOtpk=smdp_otpk, smdpSign=smdp_sign
+                ),
+                Asn1Codec.encode(
+                    RSPDefinitions.InitialiseSecureChannelRequest,
+                    BoundProfilePackageBuilder.initialise_secure_channel_request_value(
+                        self.TRANSACTION_ID, smdp_otpk, smdp_sign
+                    )
+                )
+            )
+
+
+class SignatureVerificationServiceTest(SimpleTestCase):
+    def setUp(self):
+        self.executors = []
+        self.service = SignatureVerificationService(processes=1, batch_size=2)
+        patcher = mock.patch('api.verification.ProcessPoolExecutor', side_effect=self.executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def executor(self, **kwargs):
+        executor = mock.Mock()
+
+        def submit(function, checks):
+            result = Future()
+            # the first `broken` pools break on their first batch
+            if len(self.executors) <= self.broken:
+                result.set_exception(BrokenProcessPool('a process of the pool terminated abruptly'))
+            else:
+                result.set_result(function(checks))
+            return result
+
+        executor.submit.side_effect = submit
+        self.executors.append(executor)
+        return executor
+
+    @staticmethod
+    def checks(*valid):
+        return [mock.Mock(**{'run.return_value': value}) for value in valid]
+
+    def test_batch_retried_on_a_new_pool(self):
+        self.broken = 1
+        self.assertEqual(self.service.verify_all(self.checks(True, False)), [True, False])
+        self.assertEqual(len(self.executors), 2)
+        self.executors[0].shutdown.assert_called_once_with(wait=False)
+        self.assertIs(self.service._executor, self.executors[1])
+
+    def test_batch_failed_when_the_new_pool_breaks_too(self):
+        self.broken = 2
+        with self.assertRaises(BrokenProcessPool):
+            self.service.verify_all(self.checks(True, True))
+        self.assertIsNone(self.service._executor)
+        self.assertEqual(self.service.verify_all(self.checks(True, True)), [True, True])
+
+
+class PrecomputedSigningKeyTest(SimpleTestCase):
+    def setUp(self):
+        self.signing_key = SigningKey.generate(curve=NIST256p)
+        self.key = PrecomputedSigningKey(self.signing_key, nonces=4)
+
+    def verify(self, signature, data):
+        return self.signing_key.get_verifying_key().verify(
+            signature, data, hashfunc=hashlib.sha256, sigdecode=sigdecode_string
+        )
+
+    def test_signature_valid(self):
+        self.key.precompute()
+        self.assertTrue(self.verify(self.key.sign(b'smdpSigned2'), b'smdpSigned2'))
+
+    def test_pairs_of_the_parent_not_used_after_fork(self):
+        self.key.precompute()
+        inherited = {r for r, _ in self.key._pairs}
+        with mock.patch('api.signing.os.getpid', return_value=os.getpid() + 1):
+            signature = self.key.sign(b'smdpSigned2')
+            self.assertTrue(inherited.isdisjoint(r for r, _ in self.key._pairs))
+        self.assertNotIn(int.from_bytes(signature[:self.key.size], 'big'), inherited)
+        self.assertTrue(self.verify(signature, b'smdpSigned2'))
+
+
+class SessionStoreTest(SimpleTestCase):
+    TRANSACTION_ID = bytes(range(16))
+
+    def setUp(self):
+        shared = SqliteSharedStore(':memory:')
+        # two worker processes sharing the shared tier
+        self.worker, self.other_worker = SessionStore(shared, 10, 60), SessionStore(shared, 10, 60)
+        self.worker.put(RspSession(self.TRANSACTION_ID, bytes(16), bytes(16)))
+
+    def test_unchanged_session_served_locally(self):
+        self.assertIsNotNone(self.worker.get(self.TRANSACTION_ID))
+        self.assertEqual((self.worker.local_hits, self.worker.shared_hits), (1, 0))
+
+    def test_session_updated_on_another_worker_read_again(self):
+        session = self.other_worker.get(self.TRANSACTION_ID)
+        session.eid = '89049032123451234512345678901235'
+        self.other_worker.put(session)
+        self.assertEqual(self.worker.get(self.TRANSACTION_ID).eid, '89049032123451234512345678901235')
+        self.assertEqual((self.worker.local_hits, self.worker.shared_hits), (0, 1))
+
+    def test_session_deleted_on_another_worker_not_served(self):
+        self.other_worker.delete(self.TRANSACTION_ID)
+        self.assertIsNone(self.worker.get(self.TRANSACTION_ID))
+        self.assertEqual(len(self.worker.local), 0)
+
+    def test_concurrent_writes_get_distinct_versions(self):
+        session, other_session = self.worker.get(self.TRANSACTION_ID), self.other_worker.get(self.TRANSACTION_ID)
+        self.worker.put(session)
+        other_session.eid = '89049032123451234512345678901235'
+        self.other_worker.put(other_session)
+        self.assertEqual((session.version, other_session.version), (2, 3))
+        self.assertEqual(self.worker.get(self.TRANSACTION_ID).eid, '89049032123451234512345678901235')
+
+    def test_shared_store_opened_on_first_use(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'sessions.sqlite3')
+            shared = SqliteSharedStore(path)
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(shared.incr(b'counter'), 1)
+            self.assertTrue(os.path.exists(path))
+
+
+class CertificateTest(SimpleTestCase):
+    # self-signed NIST P-256 CI certificate
+    CI_DER = bytes.fromhex(
+        '3082018C30820132A00302010202144A1497D6FD38D065ECBADA366C33EAB643A1ADE7300A06082A8648CE3D0403023024311030'
+        '0E06035504030C07546573742043493110300E060355040A0C0752535054455354301E170D3236313031393136313433305A170D'
+        '3336313031363136313433305A30243110300E06035504030C07546573742043493110300E060355040A0C075253505445535430'
+        '59301306072A8648CE3D020106082A8648CE3D030107034200045EB91C79B1219A3379D9A256AEF9C98E2CDD8EC42330196DFD9B'
+        '2D99E803ABAD1A0337CE9A5FD37665076C276D4713AC6D364CCC58FD3D591AA38529D348F5B0A3423040300F0603551D130101FF'
+        '040530030101FF301D0603551D0E0416041490F26647964EA59C668539DEBF6A9B2C4C634EEB300E0603551D0F0101FF04040302'
+        '0106300A06082A8648CE3D0403020348003045022100A34558791DC2388780649B36147ED1298E02EB8DB65EBDB5B9A932FBE421'
+        '03D002203448E5FB8709C6A3437512EFBCED5794C6F6DCD3450A20868D4D7E1D644DF81A'
+    )
+
+    def test_certificate_decoded(self):
+        self.assertIs(Certificate(self.CI_DER).curve, NIST256p)
+
+    def test_unsupported_curve_rejected(self):
+        # prime256v1 (1.2.840.10045.3.1.7) replaced by prime239v3 (1.2.840.10045.3.1.6)
+        der = self.CI_DER.replace(bytes.fromhex('2A8648CE3D030107'), bytes.fromhex('2A8648CE3D030106'))
+        with self.assertRaises(InvalidCertificateError):
+            Certificate(der)
+        with self.assertRaises(Es9PlusFunctionError) as raised:
+            AuthenticateClient.certificate(
+                Asn1Codec.decode(PKIX1Explicit88.Certificate, der), AuthenticateClient.EUM_CERTIFICATE_INVALID
+            )
+        self.assertEqual(raised.exception.code, AuthenticateClient.EUM_CERTIFICATE_INVALID)
+
+    def test_malformed_certificate_rejected(self):
+        with self.assertRaises(InvalidCertificateError):
+            Certificate(self.CI_DER[:-80])
+
+
+class ChainVerificationCacheTest(SimpleTestCase):
+    # CERT.EUM.ECDSA issued by CertificateTest.CI_DER and two CRLs of that CI (nextUpdate 2026-11-18), the first
+    # one revoking the EUM certificate
+    EUM_DER = bytes.fromhex(
+        '308201B130820157A00302010202142565E65EC48C7209ED7DC5E71BAAE001E5AFCD45300A06082A8648CE3D0403023024311030'
+        '0E06035504030C07546573742043493110300E060355040A0C0752535054455354301E170D3236313031393136313433305A170D'
+        '3336313031363136313433305A30253111300F06035504030C08546573742045554D3110300E060355040A0C0752535054455354'
+        '3059301306072A8648CE3D020106082A8648CE3D030107034200042CD6F2A7417F8422D74E5C69B1EC2500DD6275974367DE718D'
+        '23CC9F589B98CFE272697DA826778A45CC5B80C12FF79732D75586581CD81DE9EB631AD8936874A366306430120603551D130101'
+        'FF040830060101FF020100301D0603551D0E04160414560D13306F3301C2B275B975F3DE8903C5C17803301F0603551D23041830'
+        '16801490F26647964EA59C668539DEBF6A9B2C4C634EEB300E0603551D0F0101FF040403020204300A06082A8648CE3D04030203'
+        '4800304502210097905AB5FB6B34653FEA48A3DAB7986DE8E461E841240C5962EB18E065D4393E0220754F4648534D550709C844'
+        '430A3EE1B85B79B8A432623626497B9A02FEF10332'
+    )
+    REVOKING_CRL_DER = bytes.fromhex(
+        '3081E630818C020101300A06082A8648CE3D04030230243110300E06035504030C07546573742043493110300E060355040A0C07'
+        '52535054455354170D3236313031393136323234365A170D3236313131383136323234365A3027302502142565E65EC48C7209ED'
+        '7DC5E71BAAE001E5AFCD45170D3236313031393136323234365AA00E300C300A0603551D140403020102300A06082A8648CE3D04'
+        '03020349003046022100C31F7F134A718E6FF2457739E776250EF95B975AE2E369B31485C0C67AB3E610022100D3AD5515E1894C'
+        'B839740962A00BD34F7773AC11CDEE8C6F88BBCDB6C9E7F084'
+    )
+    EMPTY_CRL_DER = bytes.fromhex(
+        '3081BB3063020101300A06082A8648CE3D04030230243110300E06035504030C07546573742043493110300E060355040A0C0752'
+        '535054455354170D3236313031393136323234365A170D3236313131383136323234365AA00E300C300A0603551D140403020101'
+        '300A06082A8648CE3D0403020348003045022100E88810FB19AC93732E683C7F78DA04B6BE19B57E106E7049D25274FF882D16D9'
+        '022002875F0B19F33E0B14714110ED84EF6252FDC8552594B3A491BC335846E36874'
+    )
+    NOW = datetime(2026, 10, 20, tzinfo=timezone.utc).timestamp()
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.crl_path = os.path.join(directory.name, 'CRL_CI_ECDSA.der')
+        self.crl_version = 0
+        self.now = self.NOW
+        self.cache = ChainVerificationCache(
+            ttl=3600, crl_path=self.crl_path, crl_check_interval=60, clock=lambda: self.now
+        )
+        self.ci_certificate = Certificate(CertificateTest.CI_DER)
+        self.eum_certificate = Certificate(self.EUM_DER)
+
+    def publish_crl(self, der):
+        """
+            Replaces the CRL file, checked again by the cache once the check interval has elapsed.
+        """
+        with open(self.crl_path, 'wb') as crl:
+            crl.write(der)
+        self.crl_version += 1
+        os.utime(self.crl_path, (self.NOW + self.crl_version, self.NOW + self.crl_version))
+        self.now += 60
+
+    def is_verified(self):
+        return self.cache.is_verified(self.ci_certificate, self.eum_certificate)
+
+    def is_revoked(self):
+        return self.cache.is_revoked(self.ci_certificate, self.eum_certificate)
+
+    def test_verified_chain_served_from_the_cache(self):
+        self.assertFalse(self.is_verified())
+        self.cache.add(self.ci_certificate, self.eum_certificate)
+        self.assertTrue(self.is_verified())
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.now += 3600
+        self.assertFalse(self.is_verified())
+        self.assertEqual(len(self.cache), 0)
+
+    def test_revoked_eum_certificate_evicted(self):
+        self.publish_crl(self.EMPTY_CRL_DER)
+        self.cache.add(self.ci_certificate, self.eum_certificate)
+        self.assertTrue(self.is_verified())
+        self.assertFalse(self.is_revoked())
+        self.publish_crl(self.REVOKING_CRL_DER)
+        self.assertFalse(self.is_verified())
+        self.assertTrue(self.is_revoked())
+
+    def test_malformed_crl_keeps_the_previous_revocations(self):
+        self.publish_crl(self.REVOKING_CRL_DER)
+        self.assertTrue(self.is_revoked())
+        self.publish_crl(self.EMPTY_CRL_DER[:-20])
+        with self.assertLogs('api.chain_cache', 'ERROR'):
+            self.assertTrue(self.is_revoked())
+        # read again at the next check
+        self.now += 60
+        with self.assertLogs('api.chain_cache', 'ERROR'):
+            self.assertTrue(self.is_revoked())
+        self.publish_crl(self.EMPTY_CRL_DER)
+        self.assertFalse(self.is_revoked())
+
+    def test_crl_past_its_next_update_kept_and_logged(self):
+        self.publish_crl(self.REVOKING_CRL_DER)
+        self.assertTrue(self.is_revoked())
+        self.now = datetime(2026, 11, 19, tzinfo=timezone.utc).timestamp()
+        with self.assertLogs('api.chain_cache', 'WARNING'):
+            self.assertTrue(self.is_revoked())
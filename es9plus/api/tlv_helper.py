@@ -22,3 +22,54 @@ class TlvHelper:
             return "81" + hexlify((len(data) // 2).to_bytes(1, 'big')).decode().upper() + data
         else:
             return "82" + hexlify((len(data) // 2).to_bytes(2, 'big')).decode().upper() + data
+
+    @staticmethod
+    def encode_length(length):
+        """
+            BER definite length: short form below 128, otherwise '81' / '82' / '83' followed by the length.
+        """
+        if length < 0x80:
+            return length.to_bytes(1, 'big')
+        elif length < 0x100:
+            return b'\x81' + length.to_bytes(1, 'big')
+        elif length < 0x10000:
+            return b'\x82' + length.to_bytes(2, 'big')
+        return b'\x83' + length.to_bytes(3, 'big')
+
+    @staticmethod
+    def read_tlv(data, offset=0):
+        """
+            Returns (tag, value_offset, end_offset) of the BER-TLV starting at offset.
+        """
+        tag_end = offset + 1
+        if data[offset] & 0x1F == 0x1F:
+            while data[tag_end] & 0x80:
+                tag_end += 1
+            tag_end += 1
+        length = data[tag_end]
+        value_offset = tag_end + 1
+        if length & 0x80:
+            length_size = length & 0x7F
+            length = int.from_bytes(data[value_offset:value_offset + length_size], 'big')
+            value_offset += length_size
+        return bytes(data[offset:tag_end]), value_offset, value_offset + length
+
+    @staticmethod
+    def find_tlv(data, *tags):
+        """
+            Returns the BER-TLV reached by following tags (hex strings, e.g. 'BF3B', 'A0', '30'), the first
+            matching TLV being taken at each level, or None when it is absent.
+        """
+        start, end = 0, len(data)
+        for depth, tag in enumerate(bytes.fromhex(tag) for tag in tags):
+            offset = start
+            while offset < end:
+                found, value_offset, tlv_end = TlvHelper.read_tlv(data, offset)
+                if found == tag:
+                    break
+                offset = tlv_end
+            else:
+                return None
+            if depth == len(tags) - 1:
+                return bytes(data[offset:tlv_end])
+            start, end = value_offset, tlv_end
@@ -0,0 +1,206 @@
+import hashlib
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from ecdsa import VerifyingKey, NIST256p, BRAINPOOLP256r1, BadSignatureError
+from ecdsa.util import sigdecode_der, sigdecode_string
+
+# Module imported by the worker processes: no Django nor pycrate import here.
+
+CURVES = {curve.name: curve for curve in (NIST256p, BRAINPOOLP256r1)}
+
+_verifying_keys = {}
+
+
+def _verifying_key(curve_name, public_key):
+    """
+        CI and EUM public keys come back in every batch, their point decoding is done once per worker.
+    """
+    key = _verifying_keys.get((curve_name, public_key))
+    if key is None:
+        if len(_verifying_keys) >= 4096:
+            _verifying_keys.clear()
+        key = VerifyingKey.from_string(public_key, curve=CURVES[curve_name], hashfunc=hashlib.sha256)
+        _verifying_keys[(curve_name, public_key)] = key
+    return key
+
+
+def verify_batch(checks):
+    return [check.run() for check in checks]
+
+
+class SignatureCheck:
+    """
+        One ECDSA with SHA-256 verification, picklable to be run in a worker process: the RSP signatures
+        (euiccSignature1, euiccSignature2 ...) are r || s, the certificate signatures are DER encoded.
+    """
+    __slots__ = ('curve_name', 'public_key', 'signature', 'data', 'der')
+
+    def __init__(self, curve_name, public_key, signature, data, der=False):
+        self.curve_name = curve_name
+        self.public_key = public_key
+        self.signature = signature
+        self.data = data
+        self.der = der
+
+    @classmethod
+    def rsp(cls, certificate, signature, data):
+        return cls(certificate.curve.name, certificate.public_key, bytes(signature), bytes(data))
+
+    @classmethod
+    def certificate(cls, issuer, certificate):
+        return cls(issuer.curve.name, issuer.public_key, certificate.signature, certificate.tbs_der, der=True)
+
+    def run(self):
+        try:
+            return _verifying_key(self.curve_name, self.public_key).verify(
+                self.signature, self.data, sigdecode=sigdecode_der if self.der else sigdecode_string
+            )
+        except (BadSignatureError, ValueError, KeyError):
+            return False
+
+
+class SignatureVerificationService:
+    """
+        Collects the signature checks submitted by the ES9+ worker threads of concurrent sessions and runs
+        them in micro-batches (batch_size checks, or whatever is pending after batch_delay seconds) in a pool
+        of processes, so the verifications neither hold the GIL of the server process nor run one at a time.
+        With processes = 0 the checks are run inline in the calling thread.
+
+        A pool broken by the death of one of its processes is replaced: the batches it was running are
+        submitted once more to the new pool, their checks failing with BrokenProcessPool if it breaks too.
+
+        ecdsa uses gmpy2 for its big integer arithmetic when it is installed.
+    """
+    BATCH_SIZE = 32
+    BATCH_DELAY = 0.002
+
+    def __init__(self, processes, batch_size=None, batch_delay=None):
+        self.processes = processes
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.batch_delay = batch_delay or self.BATCH_DELAY
+        self._pending = []
+        self._condition = threading.Condition()
+        self._dispatcher = None
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._started_at = None
+        self.verified = 0
+        self.batches = 0
+        self.queue_latency_total = 0.0
+        self.queue_latency_max = 0.0
+
+    @property
+    def executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def _discard(self, executor):
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def submit(self, check):
+        future = Future()
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+        if not self.processes:
+            future.set_result(check.run())
+            self._record(1, 0.0)
+            return future
+
+        with self._condition:
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch, name='es9plus-verify', daemon=True)
+                self._dispatcher.start()
+            self._pending.append((check, future, time.monotonic()))
+            self._condition.notify()
+        return future
+
+    def verify(self, check):
+        return self.submit(check).result()
+
+    def verify_all(self, checks):
+        futures = [self.submit(check) for check in checks]
+        return [future.result() for future in futures]
+
+    def _dispatch(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                deadline = self._pending[0][2] + self.batch_delay
+                while len(self._pending) < self.batch_size and time.monotonic() < deadline:
+                    self._condition.wait(deadline - time.monotonic())
+                batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+
+            dispatched_at = time.monotonic()
+            latencies = [dispatched_at - enqueued_at for _, _, enqueued_at in batch]
+            self._run([check for check, _, _ in batch], [future for _, future, _ in batch])
+            self._record(len(batch), sum(latencies), max(latencies))
+
+    def _run(self, checks, futures, retry=True):
+        executor = self.executor
+        try:
+            result = executor.submit(verify_batch, checks)
+        except BrokenProcessPool as error:
+            self._broken(executor, checks, futures, retry, error)
+            return
+        except RuntimeError as error:
+            self._fail(futures, error)
+            return
+        result.add_done_callback(lambda result: self._complete(result, executor, checks, futures, retry))
+
+    def _broken(self, executor, checks, futures, retry, error):
+        self._discard(executor)
+        if retry:
+            self._run(checks, futures, retry=False)
+        else:
+            self._fail(futures, error)
+
+    def _complete(self, result, executor, checks, futures, retry):
+        error = result.exception()
+        if isinstance(error, BrokenProcessPool):
+            self._broken(executor, checks, futures, retry, error)
+            return
+        if error is not None:
+            self._fail(futures, error)
+            return
+        for future, valid in zip(futures, result.result()):
+            future.set_result(valid)
+
+    @staticmethod
+    def _fail(futures, error):
+        for future in futures:
+            future.set_exception(error)
+
+    def _record(self, count, latency_total, latency_max=0.0):
+        self.verified += count
+        self.batches += 1
+        self.queue_latency_total += latency_total
+        self.queue_latency_max = max(self.queue_latency_max, latency_max)
+
+    def metrics(self):
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        return {
+            'verified': self.verified,
+            'batches': self.batches,
+            'average_batch_size': self.verified / self.batches if self.batches else 0.0,
+            'throughput': self.verified / elapsed if elapsed else 0.0,
+            'queue_latency_average': self.queue_latency_total / self.verified if self.verified else 0.0,
+            'queue_latency_max': self.queue_latency_max,
+        }
+
+    def shutdown(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
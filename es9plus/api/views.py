@@ -1,3 +1,41 @@
-from django.shortcuts import render
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotAllowed
 
-# Create your views here.
+from api.es9 import InitiateAuthentication, AuthenticateClient, GetBoundProfilePackage, HandleNotification, \
+    CancelSession
+from api.exceptions import FunctionProviderBusyException
+from api.pool import BoundedExecutor
+
+ASN1_CONTENT_TYPE = 'application/x-gsma-rsp-asn1'
+
+executor = BoundedExecutor(settings.ES9PLUS_WORKER_THREADS, settings.ES9PLUS_MAX_PENDING_REQUESTS)
+
+
+def es9plus_view(function):
+    """
+        Async view for an ES9+ function, the ASN.1 request is processed in the bounded executor.
+        HandleNotification has no output data: 204 once queued for ingestion, 503 when the executor or the
+        notification ingestion is saturated.
+    """
+    async def view(request):
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+        try:
+            response = await executor.run(function.handle, request.body)
+        except FunctionProviderBusyException:
+            if function.RESPONSE is None:
+                return HttpResponse(status=503)
+            response = function.busy()
+        if response is None:
+            return HttpResponse(status=204)
+        return HttpResponse(response, content_type=ASN1_CONTENT_TYPE)
+
+    view.csrf_exempt = True
+    return view
+
+
+initiate_authentication = es9plus_view(InitiateAuthentication)
+authenticate_client = es9plus_view(AuthenticateClient)
+get_bound_profile_package = es9plus_view(GetBoundProfilePackage)
+handle_notification = es9plus_view(HandleNotification)
+cancel_session = es9plus_view(CancelSession)
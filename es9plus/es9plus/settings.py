@@ -37,6 +37,8 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+
+    'api'
 ]
 
 MIDDLEWARE = [
@@ -121,3 +123,69 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# SM-DP+ identity and eSIM PKI material (SGP.22 section 4.5)
+
+SMDP_ADDRESS = 'testsmdpplus1.example.com'
+SMDP_OID = '2.999.10'
+
+RSP_PKI_DIR = BASE_DIR / 'pki'
+CERT_CI_ECDSA = RSP_PKI_DIR / 'CERT_CI_ECDSA.der'
+CERT_DPAUTH_ECDSA = RSP_PKI_DIR / 'CERT_DPauth_ECDSA.der'
+SK_DPAUTH_ECDSA = RSP_PKI_DIR / 'SK_DPauth_ECDSA.pem'
+CERT_DPPB_ECDSA = RSP_PKI_DIR / 'CERT_DPpb_ECDSA.der'
+SK_DPPB_ECDSA = RSP_PKI_DIR / 'SK_DPpb_ECDSA.pem'
+# CRL of the eSIM CA, reloaded when the file changes (ignored when absent)
+CRL_CI_ECDSA = RSP_PKI_DIR / 'CRL_CI_ECDSA.der'
+
+
+# ES9+ request pipeline
+# DER decoding and crypto run in a bounded thread pool, requests above the pending limit are rejected
+# with functionProviderBusy instead of queueing on the event loop.
+
+ES9PLUS_WORKER_THREADS = 8
+ES9PLUS_MAX_PENDING_REQUESTS = 256
+
+
+# RSP sessions
+# Sessions live in a process-local LRU cache (TTL and size bound) backed by a shared store, so that the
+# calls of one session can be served by different worker processes.
+
+ES9PLUS_SESSION_CACHE_SIZE = 100_000
+ES9PLUS_SESSION_TTL = 600
+ES9PLUS_SESSION_SHARED_DB = BASE_DIR / 'rsp_sessions.sqlite3'
+
+# Successful EUM -> CI chain verifications are cached for this many seconds (bounded by the EUM validity)
+ES9PLUS_CHAIN_CACHE_TTL = 3600
+
+# Signature verifications are run in micro-batches in a pool of processes (0: inline in the request thread)
+ES9PLUS_VERIFY_PROCESSES = 2
+ES9PLUS_VERIFY_BATCH_SIZE = 32
+ES9PLUS_VERIFY_BATCH_DELAY = 0.002
+
+# ECDSA nonces (and their k.G) precomputed per SM-DP+ signing key
+ES9PLUS_SIGNING_NONCES = 256
+
+# ES9+.HandleNotification
+# Notifications are decoded and verified by ES9PLUS_NOTIFICATION_WORKERS threads (0: in the request thread) and
+# written in batched transactions; the LPAd gets 503 above ES9PLUS_NOTIFICATION_MAX_PENDING in progress.
+# The Operator is notified through ES2+.HandleNotification at the ES9PLUS_OPERATOR_NOTIFICATION_URLS endpoint of
+# the Profile Owner OID of the Profile, or ES9PLUS_OPERATOR_NOTIFICATION_URL (None: not notified). The calls are
+# persisted until delivered, with up to ES9PLUS_OPERATOR_NOTIFICATION_CONCURRENCY in flight per endpoint; failed
+# calls are retried with exponential backoff.
+
+ES9PLUS_NOTIFICATION_WORKERS = 4
+ES9PLUS_NOTIFICATION_MAX_PENDING = 10_000
+ES9PLUS_NOTIFICATION_BATCH_SIZE = 200
+ES9PLUS_NOTIFICATION_BATCH_DELAY = 0.05
+
+ES9PLUS_OPERATOR_NOTIFICATION_URL = None
+ES9PLUS_OPERATOR_NOTIFICATION_URLS = {}
+ES9PLUS_OPERATOR_NOTIFICATION_RETRIES = 5
+ES9PLUS_OPERATOR_NOTIFICATION_BACKOFF = 1.0
+ES9PLUS_OPERATOR_NOTIFICATION_TIMEOUT = 10.0
+ES9PLUS_OPERATOR_NOTIFICATION_CONCURRENCY = 8
+ES9PLUS_OPERATOR_NOTIFICATION_BATCH_SIZE = 100
+ES9PLUS_OPERATOR_NOTIFICATION_LEASE = 300
+ES9PLUS_OPERATOR_NOTIFICATION_POLL_INTERVAL = 1.0
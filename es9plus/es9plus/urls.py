@@ -17,6 +17,13 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 
+from api import views
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('gsma/rsp2/es9plus/initiateAuthentication', views.initiate_authentication),
+    path('gsma/rsp2/es9plus/authenticateClient', views.authenticate_client),
+    path('gsma/rsp2/es9plus/getBoundProfilePackage', views.get_bound_profile_package),
+    path('gsma/rsp2/es9plus/handleNotification', views.handle_notification),
+    path('gsma/rsp2/es9plus/cancelSession', views.cancel_session),
 ]
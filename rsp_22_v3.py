@@ -7982,7 +7982,7 @@ class RSPDefinitions:
     AuthenticateClientRequest = SEQ(name='AuthenticateClientRequest', mode=MODE_TYPE, tag=(59, TAG_CONTEXT_SPEC, TAG_IMPLICIT))
     _AuthenticateClientRequest_transactionId = OCT_STR(name='transactionId', mode=MODE_TYPE, tag=(0, TAG_CONTEXT_SPEC, TAG_IMPLICIT), typeref=ASN1RefType(('RSPDefinitions', 'TransactionId')))
     _AuthenticateClientRequest_authenticateServerResponse = CHOICE(name='authenticateServerResponse', mode=MODE_TYPE, tag=(56, TAG_CONTEXT_SPEC, TAG_IMPLICIT), typeref=ASN1RefType(('RSPDefinitions', 'AuthenticateServerResponse')))
-    _AuthenticateClientRequest_deleteNotificationForDc = SEQ(name='deleteNotificationForDc', mode=MODE_TYPE, tag=(1, TAG_CONTEXT_SPEC, TAG_IMPLICIT), typeref=ASN1RefType(('RSPDefinitions', 'DeleteNotificationForDc')))
+    _AuthenticateClientRequest_deleteNotificationForDc = SEQ(name='deleteNotificationForDc', mode=MODE_TYPE, tag=(1, TAG_CONTEXT_SPEC, TAG_IMPLICIT), typeref=ASN1RefType(('RSPDefinitions', 'DeleteNotificationForDc')), opt=True)
     AuthenticateClientRequest._cont = ASN1Dict([
         ('transactionId', _AuthenticateClientRequest_transactionId),
         ('authenticateServerResponse', _AuthenticateClientRequest_authenticateServerResponse),
@@ -0,0 +1,24 @@
+class Es12:
+    """
+        ES12 functions of the SM-DS (SM-DP+ to SM-DS).
+
+        RegisterEvent stores the Event Record and, when the LPAd of the EID has enabled the Push Service,
+        triggers it to perform an Event Retrieval (PushService.register_event). DeleteEvent removes the
+        Event Record.
+    """
+
+    def __init__(self, events, push_service=None):
+        self.events = events
+        self.push_service = push_service
+
+    async def register_event(self, eid, event_id, rsp_server_address, forwarding_indicator=False):
+        """
+            Raises EventAlreadyInUseError when the EID already has a pending record with this event id.
+        """
+        record = self.events.register(eid, event_id, rsp_server_address, forwarding_indicator)
+        if self.push_service is not None:
+            await self.push_service.register_event(eid, event_id)
+        return record
+
+    def delete_event(self, eid, event_id):
+        return self.events.delete(eid, event_id)
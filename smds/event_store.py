@@ -0,0 +1,130 @@
+import heapq
+import sys
+import time
+import zlib
+
+
+class EventAlreadyInUseError(Exception):
+    pass
+
+
+class EventRecord:
+    __slots__ = ('eid', 'event_id', 'rsp_server_address', 'forwarding_indicator', 'registered_at', 'expires_at')
+
+    def __init__(self, eid, event_id, rsp_server_address, forwarding_indicator, registered_at, expires_at):
+        self.eid = eid
+        self.event_id = event_id
+        self.rsp_server_address = rsp_server_address
+        self.forwarding_indicator = forwarding_indicator
+        self.registered_at = registered_at
+        self.expires_at = expires_at
+
+    def to_json(self):
+        return {
+            'eventId': self.event_id,
+            'rspServerAddress': self.rsp_server_address,
+            'forwardingIndicator': self.forwarding_indicator,
+        }
+
+
+class EventTable:
+    """
+        Event Records stored by the SM-DS on ES12.RegisterEvent and served on Event Retrieval.
+
+        Records are spread over a fixed number of partitions by the CRC32 of the EID, each partition maps
+        an EID to the list of its pending records so Event Retrieval is a single dict lookup. An EID rarely
+        has more than a couple of pending events, so a list is smaller than a nested dict per EID.
+
+        Record footprint is kept small:
+            .   __slots__ records holding integer timestamps.
+            .   rspServerAddress values are interned, every record of the same SM-DP+ shares one string.
+            .   Expiry uses coarse time buckets (sets) referencing the records, expire() drops whole buckets
+                instead of scanning the table, a deleted record leaves its bucket right away.
+    """
+    PARTITIONS = 256
+    EVENT_TTL = 30 * 24 * 60 * 60
+    EXPIRY_BUCKET = 60
+
+    def __init__(self, partitions=None, event_ttl=None, expiry_bucket=None, clock=time.time):
+        self.partitions = [{} for _ in range(partitions or self.PARTITIONS)]
+        self.event_ttl = event_ttl or self.EVENT_TTL
+        self.expiry_bucket = expiry_bucket or self.EXPIRY_BUCKET
+        self.clock = clock
+        self.count = 0
+
+        self._expiry_buckets = {}
+        self._expiry_heap = []
+
+    def __len__(self):
+        return self.count
+
+    def _partition(self, eid):
+        return self.partitions[zlib.crc32(eid.encode()) % len(self.partitions)]
+
+    def register(self, eid, event_id, rsp_server_address, forwarding_indicator=False, ttl=None):
+        partition = self._partition(eid)
+        records = partition.get(eid)
+        if records is None:
+            records = partition[sys.intern(eid)] = []
+        elif any(record.event_id == event_id for record in records):
+            raise EventAlreadyInUseError(event_id)
+
+        now = int(self.clock())
+        record = EventRecord(
+            eid, event_id, sys.intern(rsp_server_address), bool(forwarding_indicator),
+            now, now + (self.event_ttl if ttl is None else ttl)
+        )
+        records.append(record)
+        self.count += 1
+
+        bucket_key = record.expires_at // self.expiry_bucket
+        bucket = self._expiry_buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._expiry_buckets[bucket_key] = set()
+            heapq.heappush(self._expiry_heap, bucket_key)
+        bucket.add(record)
+        return record
+
+    def pending(self, eid):
+        now = int(self.clock())
+        return [record for record in self._partition(eid).get(eid, ()) if record.expires_at > now]
+
+    def _remove(self, partition, record):
+        records = partition.get(record.eid)
+        if not records:
+            return False
+        for index, stored in enumerate(records):
+            if stored is record:
+                del records[index]
+                break
+        else:
+            return False
+        if not records:
+            del partition[record.eid]
+        self.count -= 1
+        return True
+
+    def delete(self, eid, event_id):
+        """
+            ES12.DeleteEvent, the record is removed from its expiry bucket as well.
+        """
+        partition = self._partition(eid)
+        for record in partition.get(eid, ()):
+            if record.event_id == event_id:
+                self._expiry_buckets[record.expires_at // self.expiry_bucket].discard(record)
+                return self._remove(partition, record)
+        return False
+
+    def expire(self, now=None):
+        """
+            Drop every bucket whose whole time range has elapsed, returns the number of removed records.
+        """
+        now = int(self.clock() if now is None else now)
+        last_bucket = now // self.expiry_bucket - 1
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0] <= last_bucket:
+            bucket = self._expiry_buckets.pop(heapq.heappop(self._expiry_heap))
+            for record in bucket:
+                if self._remove(self._partition(record.eid), record):
+                    removed += 1
+        return removed
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PushDeliveryError(Exception):
+    pass
+
+
+class PushTransport:
+    """
+        Channel used by the SM-DS to reach the Push Server.
+
+        Later, to inform the LPAd that an Event Record is pending for this LPAd on the SM-DS, the
+        SM-DS requests the push server to send a push notification for this Push Token.
+        The push server routes this notification to the push client, which forwards it to the LPAd.
+        The LPAd MAY then perform an Event Retrieval procedure.
+
+        Implementations SHALL raise PushDeliveryError when the Push Token cannot be reached.
+    """
+
+    async def send(self, push_token, notification):
+        raise NotImplementedError
+
+
+class InMemoryPushTransport(PushTransport):
+    """
+        Local stand-in for the Push Server.
+
+        Every push client connects with its Push Token and receives an asyncio.Queue, the same way a
+        WebSocket connection would be held open per push client. Notifications sent to a Push Token
+        without a connected client fail with PushDeliveryError.
+    """
+
+    def __init__(self):
+        self.channels = {}
+
+    def connect(self, push_token, maxsize=0):
+        channel = asyncio.Queue(maxsize)
+        self.channels[push_token] = channel
+        return channel
+
+    def disconnect(self, push_token):
+        self.channels.pop(push_token, None)
+
+    async def send(self, push_token, notification):
+        channel = self.channels.get(push_token)
+        if channel is None:
+            raise PushDeliveryError(f"Push Token {push_token} is not connected")
+        await channel.put(notification)
+
+
+class PushRegistration:
+    __slots__ = ('eid', 'push_service_id', 'push_token')
+
+    def __init__(self, eid, push_service_id, push_token):
+        self.eid = eid
+        self.push_service_id = push_service_id
+        self.push_token = push_token
+
+
+class _DeviceChannel:
+    """
+        Queue of one EID and the task delivering it, closed is set when the EID is disabled so the
+        registrations waiting for room in the queue give up.
+    """
+    __slots__ = ('queue', 'worker', 'closed')
+
+    def __init__(self, maxsize):
+        self.queue = asyncio.Queue(maxsize)
+        self.worker = None
+        self.closed = asyncio.Event()
+
+
+class PushService:
+    """
+        SM-DS Push Service (see push_service_smds.png).
+
+        1.  During ES11.AuthenticateClient the LPAd provides the push service id (one of the
+            supportedPushServices of the sessionContext) and the Push Token, the SM-DS then enables
+            the Push Service for this EID.
+        2.  On Event Registration the SM-DS triggers the LPAd to perform an Event Retrieval instead of
+            waiting for the LPAd to poll.
+
+        Each EID owns a bounded queue drained by its own delivery task:
+            .   Events registered while a notification is queued or in flight are coalesced, the LPAd
+                retrieves every pending Event Record in one Event Retrieval procedure anyway.
+            .   register_event waits when the EID queue is full, so a burst of registrations is slowed
+                down instead of buffering without limit, and gives up when the EID is disabled meanwhile.
+            .   The number of concurrent transport calls is capped across all EIDs.
+            .   A delivery task idle for idle_timeout seconds ends and releases its queue, the next event of
+                the EID starts a new one.
+            .   A failing delivery (PushDeliveryError, no answer of the transport within send_timeout seconds
+                or any other error of the transport) is counted in delivery_failures, the task goes on with the
+                next notifications.
+
+        register_event is called by ES12.RegisterEvent (smds.es12) once the Event Record is stored.
+    """
+    DEVICE_QUEUE_SIZE = 64
+    MAX_CONCURRENT_DELIVERIES = 100
+    IDLE_TIMEOUT = 300
+    SEND_TIMEOUT = 10
+
+    def __init__(self, transport, smds_address, device_queue_size=None, max_concurrent_deliveries=None,
+                 idle_timeout=None, send_timeout=None):
+        self.transport = transport
+        self.smds_address = smds_address
+        self.device_queue_size = device_queue_size or self.DEVICE_QUEUE_SIZE
+        self.idle_timeout = idle_timeout or self.IDLE_TIMEOUT
+        self.send_timeout = send_timeout or self.SEND_TIMEOUT
+        self.registrations = {}
+        self.metrics = {
+            'events_registered': 0,
+            'events_coalesced': 0,
+            'notifications_sent': 0,
+            'delivery_failures': 0,
+        }
+
+        self._channels = {}
+        self._deliveries = asyncio.Semaphore(max_concurrent_deliveries or self.MAX_CONCURRENT_DELIVERIES)
+
+    def enable(self, eid, push_service_id, push_token):
+        self.registrations[eid] = PushRegistration(eid, push_service_id, push_token)
+
+    async def disable(self, eid):
+        self.registrations.pop(eid, None)
+        channel = self._channels.pop(eid, None)
+        if channel is not None:
+            channel.closed.set()
+            channel.worker.cancel()
+            await asyncio.gather(channel.worker, return_exceptions=True)
+
+    def _channel(self, eid):
+        channel = self._channels.get(eid)
+        if channel is None:
+            channel = self._channels[eid] = _DeviceChannel(self.device_queue_size)
+            channel.worker = asyncio.create_task(self._deliver(eid, channel))
+        return channel
+
+    @staticmethod
+    async def _put(channel, event_id):
+        if not channel.queue.full():
+            channel.queue.put_nowait(event_id)
+            return True
+        put = asyncio.ensure_future(channel.queue.put(event_id))
+        closed = asyncio.ensure_future(channel.closed.wait())
+        try:
+            await asyncio.wait((put, closed), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            put.cancel()
+            closed.cancel()
+        return put.done() and not put.cancelled()
+
+    async def register_event(self, eid, event_id):
+        """
+            Called once the Event Record is stored.
+            Returns False when the LPAd of this EID has not enabled the Push Service and keeps polling.
+        """
+        if eid not in self.registrations:
+            return False
+        if not await self._put(self._channel(eid), event_id):
+            return False
+        self.metrics['events_registered'] += 1
+        return True
+
+    def _notification(self, eid, event_ids):
+        return {
+            'eid': eid,
+            'smdsAddress': self.smds_address,
+            'pendingEvents': len(event_ids),
+        }
+
+    async def _deliver(self, eid, channel):
+        queue = channel.queue
+        while True:
+            try:
+                event_ids = [await asyncio.wait_for(queue.get(), self.idle_timeout)]
+            except asyncio.TimeoutError:
+                # no await between the check and the release: no event can be queued meanwhile
+                if queue.empty():
+                    if self._channels.get(eid) is channel:
+                        del self._channels[eid]
+                    return
+                continue
+            while not queue.empty():
+                event_ids.append(queue.get_nowait())
+            self.metrics['events_coalesced'] += len(event_ids) - 1
+
+            registration = self.registrations.get(eid)
+            try:
+                if registration is not None:
+                    async with self._deliveries:
+                        await asyncio.wait_for(
+                            self.transport.send(registration.push_token, self._notification(eid, event_ids)),
+                            self.send_timeout
+                        )
+                    self.metrics['notifications_sent'] += 1
+            except PushDeliveryError:
+                self.metrics['delivery_failures'] += 1
+            except asyncio.TimeoutError:
+                logger.warning('push notification to EID %s timed out', eid)
+                self.metrics['delivery_failures'] += 1
+            except Exception:
+                logger.exception('push notification to EID %s failed', eid)
+                self.metrics['delivery_failures'] += 1
+            finally:
+                for _ in event_ids:
+                    queue.task_done()
+
+    async def drain(self):
+        await asyncio.gather(*(channel.queue.join() for channel in list(self._channels.values())))
+
+    async def close(self):
+        for eid in list(self._channels):
+            await self.disable(eid)
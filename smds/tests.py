@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+
+from smds.es12 import Es12
+from smds.event_store import EventAlreadyInUseError, EventTable
+from smds.push_service import PushService, PushTransport
+
+EID = '89049032123451234512345678901235'
+SMDP_ADDRESS = 'smdp.example.com'
+
+
+class EventTableTest(unittest.TestCase):
+    NOW = 1_800_000_000
+
+    def setUp(self):
+        self.now = self.NOW
+        self.events = EventTable(partitions=16, event_ttl=3600, expiry_bucket=60, clock=lambda: self.now)
+
+    def test_registered_events_retrieved(self):
+        self.events.register(EID, 'event-1', SMDP_ADDRESS)
+        self.events.register(EID, 'event-2', SMDP_ADDRESS, forwarding_indicator=True)
+        self.assertEqual([record.to_json() for record in self.events.pending(EID)], [
+            {'eventId': 'event-1', 'rspServerAddress': SMDP_ADDRESS, 'forwardingIndicator': False},
+            {'eventId': 'event-2', 'rspServerAddress': SMDP_ADDRESS, 'forwardingIndicator': True},
+        ])
+        self.assertEqual(self.events.pending('89049032123451234512345678900000'), [])
+        self.assertEqual(len(self.events), 2)
+
+    def test_event_id_in_use_rejected(self):
+        self.events.register(EID, 'event-1', SMDP_ADDRESS)
+        with self.assertRaises(EventAlreadyInUseError):
+            self.events.register(EID, 'event-1', SMDP_ADDRESS)
+
+    def test_deleted_event_removed_from_its_expiry_bucket(self):
+        record = self.events.register(EID, 'event-1', SMDP_ADDRESS)
+        self.assertTrue(self.events.delete(EID, 'event-1'))
+        self.assertFalse(self.events.delete(EID, 'event-1'))
+        self.assertEqual((self.events.pending(EID), len(self.events)), ([], 0))
+        self.assertNotIn(record, self.events._expiry_buckets[record.expires_at // 60])
+
+    def test_expired_events_dropped(self):
+        self.events.register(EID, 'event-1', SMDP_ADDRESS, ttl=60)
+        self.events.register(EID, 'event-2', SMDP_ADDRESS)
+        self.now += 60
+        # expired, still stored until its bucket has elapsed
+        self.assertEqual([record.event_id for record in self.events.pending(EID)], ['event-2'])
+        self.assertEqual(self.events.expire(), 0)
+        self.now += 60
+        self.assertEqual(self.events.expire(), 1)
+        self.assertEqual(len(self.events), 1)
+        self.now += 3600
+        self.assertEqual(self.events.expire(), 1)
+        self.assertEqual((len(self.events), self.events.partitions), (0, [{}] * 16))
+
+    def test_zero_ttl_not_replaced_by_the_default(self):
+        self.events.register(EID, 'event-1', SMDP_ADDRESS, ttl=0)
+        self.assertEqual(self.events.pending(EID), [])
+
+    def test_eids_spread_over_the_partitions(self):
+        for serial in range(1600):
+            self.events.register('8904903212345123451234567890{:04d}'.format(serial), 'event', SMDP_ADDRESS)
+        sizes = [len(partition) for partition in self.events.partitions]
+        self.assertEqual(sum(sizes), 1600)
+        self.assertLess(max(sizes), 2 * 100)
+        self.assertGreater(min(sizes), 100 // 2)
+
+
+class GatedPushTransport(PushTransport):
+    """
+        Push transport holding every send until the gate is opened, sending is set once a send is waiting.
+    """
+
+    def __init__(self):
+        self.notifications = []
+        self.gate = asyncio.Event()
+        self.sending = asyncio.Event()
+
+    async def send(self, push_token, notification):
+        self.sending.set()
+        await self.gate.wait()
+        self.notifications.append((push_token, notification))
+
+
+class PushServiceTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.transport = GatedPushTransport()
+        self.service = PushService(self.transport, 'smds.example.com', device_queue_size=1)
+        self.service.enable(EID, 'push.example', 'token')
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    async def register_while_sending(self, *event_ids):
+        """
+            Registers the first event, waits until its notification is being sent and registers the others.
+        """
+        await self.service.register_event(EID, event_ids[0])
+        await self.transport.sending.wait()
+        return [asyncio.ensure_future(self.service.register_event(EID, event_id)) for event_id in event_ids[1:]]
+
+    async def test_eid_without_push_service_not_queued(self):
+        self.assertFalse(await self.service.register_event('89049032123451234512345678900000', 'event'))
+        self.assertEqual(self.service.metrics['events_registered'], 0)
+
+    async def test_events_registered_during_a_send_coalesced(self):
+        self.service.device_queue_size = 4
+        registrations = await self.register_while_sending('event-1', 'event-2', 'event-3')
+        await asyncio.gather(*registrations)
+        self.transport.gate.set()
+        await self.service.drain()
+        self.assertEqual([notification['pendingEvents'] for _, notification in self.transport.notifications], [1, 2])
+        self.assertEqual(self.service.metrics['events_coalesced'], 1)
+        self.assertEqual(self.service.metrics['notifications_sent'], 2)
+
+    async def test_registration_waits_for_room_in_the_queue(self):
+        queued, blocked = await self.register_while_sending('event-1', 'event-2', 'event-3')
+        self.assertTrue(await queued)
+        await asyncio.sleep(0.01)
+        self.assertFalse(blocked.done())
+        self.transport.gate.set()
+        self.assertTrue(await blocked)
+        await self.service.drain()
+        self.assertEqual(self.service.metrics['events_registered'], 3)
+
+    async def test_disable_releases_blocked_registrations(self):
+        queued, blocked = await self.register_while_sending('event-1', 'event-2', 'event-3')
+        await queued
+        await self.service.disable(EID)
+        self.assertFalse(await asyncio.wait_for(blocked, 1))
+        self.assertEqual(self.service.metrics['events_registered'], 2)
+
+    async def test_idle_channel_released(self):
+        self.service.idle_timeout = 0.01
+        self.transport.gate.set()
+        await self.service.register_event(EID, 'event-1')
+        await self.service.drain()
+        await asyncio.sleep(0.05)
+        self.assertNotIn(EID, self.service._channels)
+        await self.service.register_event(EID, 'event-2')
+        await self.service.drain()
+        self.assertEqual(self.service.metrics['notifications_sent'], 2)
+
+    async def test_send_timeout_counted_as_a_failure(self):
+        self.service.send_timeout = 0.01
+        with self.assertLogs('smds.push_service', 'WARNING'):
+            await self.service.register_event(EID, 'event-1')
+            await self.service.drain()
+        self.assertEqual(self.service.metrics['delivery_failures'], 1)
+        self.assertEqual(self.service.metrics['notifications_sent'], 0)
+
+
+class Es12Test(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.transport = GatedPushTransport()
+        self.transport.gate.set()
+        self.service = PushService(self.transport, 'smds.example.com')
+        self.es12 = Es12(EventTable(), self.service)
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    async def test_registered_event_pushed(self):
+        self.service.enable(EID, 'push.example', 'token')
+        await self.es12.register_event(EID, 'event-1', SMDP_ADDRESS)
+        await self.service.drain()
+        self.assertEqual([record.event_id for record in self.es12.events.pending(EID)], ['event-1'])
+        self.assertEqual(self.transport.notifications, [('token', {
+            'eid': EID, 'smdsAddress': 'smds.example.com', 'pendingEvents': 1,
+        })])
+
+    async def test_event_stored_without_push_service(self):
+        await self.es12.register_event(EID, 'event-1', SMDP_ADDRESS)
+        self.assertEqual(len(self.es12.events.pending(EID)), 1)
+        self.assertEqual(self.transport.notifications, [])
+        self.assertTrue(self.es12.delete_event(EID, 'event-1'))
+        self.assertEqual(self.es12.events.pending(EID), [])